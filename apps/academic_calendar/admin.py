@@ -2,7 +2,14 @@ from __future__ import annotations
 
 from django.contrib import admin
 
-from .models import AcademicTerm, AcademicYear, CalendarEvent, TimetableEntry
+from .models import (
+    AcademicTerm,
+    AcademicYear,
+    CalendarEvent,
+    CalendarFeedToken,
+    Room,
+    TimetableEntry,
+)
 
 
 @admin.register(AcademicYear)
@@ -26,8 +33,22 @@ class CalendarEventAdmin(admin.ModelAdmin):
     search_fields = ("title", "description")
 
 
+@admin.register(CalendarFeedToken)
+class CalendarFeedTokenAdmin(admin.ModelAdmin):
+    list_display = ("user", "created_at", "updated_at")
+    search_fields = ("user__email",)
+    readonly_fields = ("token",)
+
+
+@admin.register(Room)
+class RoomAdmin(admin.ModelAdmin):
+    list_display = ("name", "building", "capacity", "is_active")
+    list_filter = ("is_active", "building")
+    search_fields = ("name", "building")
+
+
 @admin.register(TimetableEntry)
 class TimetableEntryAdmin(admin.ModelAdmin):
-    list_display = ("course", "teacher", "entry_type", "start_at", "end_at", "room")
-    list_filter = ("entry_type",)
+    list_display = ("course", "teacher", "entry_type", "start_at", "end_at", "location")
+    list_filter = ("entry_type", "location")
     search_fields = ("course__code", "teacher__email")
@@ -0,0 +1,252 @@
+"""A user's merged agenda: calendar events, timetable entries and scheduled assessments.
+
+``agenda_items`` returns one ``UNION ALL`` query over the three tables, already filtered
+to what the user can see, so feeds and agenda views are built from a single round trip.
+
+Cached renderings are keyed on a per-user calendar version built from the version stamps
+of the scopes the user's agenda reads: shared events, their department, their courses,
+their own timetable and enrollments, and (for admins) everything. Signals bump only the
+scopes of the event, timetable entry, assessment or enrollment that changed; code that
+writes in bulk (which skips signals) calls ``bump_calendar_version`` itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, F, Q, QuerySet, Value
+from django.db.models.functions import Coalesce, Concat
+from django.utils import timezone
+
+from apps.assessments.models import Assessment
+from apps.common.metrics import record_cache_lookup
+from apps.courses.models import Course, CourseEnrollment
+from apps.courses.visibility import Visibility, visibility_for
+from apps.users.models import User
+from .models import CalendarEvent, TimetableEntry
+
+CALENDAR_VERSION_KEY = "calendar:version:{scope}"
+
+ALL_SCOPE = "all"  # every event and assessment, read by admins
+SHARED_SCOPE = "shared"  # events without a department
+
+AGENDA_COLUMNS = ("kind", "uid", "summary", "details", "starts", "ends", "place", "modified")
+
+VISIBLE_ASSESSMENT_STATUSES = (
+    Assessment.Status.SCHEDULED,
+    Assessment.Status.IN_PROGRESS,
+    Assessment.Status.COMPLETED,
+)
+
+
+@dataclass(frozen=True)
+class AgendaItem:
+    kind: str
+    uid: object
+    summary: str
+    details: str
+    starts: datetime
+    ends: datetime
+    place: str
+    modified: datetime
+
+
+@dataclass(frozen=True)
+class CalendarVersion:
+    tag: str  # changes whenever one of the user's scopes is bumped
+    updated: float  # timestamp of the latest of those bumps
+
+
+def course_scope(course_id) -> str:
+    return f"course:{course_id}"
+
+
+def department_scope(department_id) -> str:
+    return f"department:{department_id}"
+
+
+def user_scope(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def assessment_scopes(course_ids: Iterable) -> set[str]:
+    """The scopes whose agendas show assessments of ``course_ids``."""
+    course_ids = set(course_ids)
+    scopes = {ALL_SCOPE, *(course_scope(course_id) for course_id in course_ids)}
+    departments = Course.objects.filter(pk__in=course_ids, department__isnull=False)
+    scopes.update(
+        department_scope(department_id)
+        for department_id in departments.values_list("department_id", flat=True)
+    )
+    return scopes
+
+
+def agenda_scopes(instance) -> set[str]:
+    """The scopes whose agendas may show (or, for enrollments, depend on) ``instance``."""
+    if isinstance(instance, CalendarEvent):
+        scopes = {ALL_SCOPE}
+        if instance.department_id:
+            scopes.add(department_scope(instance.department_id))
+        else:
+            scopes.add(SHARED_SCOPE)
+        if instance.course_id:
+            scopes.add(course_scope(instance.course_id))
+        return scopes
+    if isinstance(instance, TimetableEntry):
+        return {course_scope(instance.course_id), user_scope(instance.teacher_id)}
+    if isinstance(instance, Assessment):
+        return assessment_scopes([instance.course_id])
+    if isinstance(instance, CourseEnrollment):
+        return {user_scope(instance.student_id)}
+    raise TypeError(f"{type(instance).__name__} is not an agenda source")
+
+
+def user_scopes(user_id, visibility: Visibility) -> list[str]:
+    """The scopes ``user_id``'s agenda is built from (see ``_events`` and friends)."""
+    scopes = {SHARED_SCOPE, user_scope(user_id)}
+    if visibility.department_id:
+        scopes.add(department_scope(visibility.department_id))
+    if visibility.role == User.Role.ADMIN:
+        scopes.add(ALL_SCOPE)
+    elif visibility.role == User.Role.TEACHER:
+        scopes.update(course_scope(course_id) for course_id in visibility.teaching_course_ids)
+    elif visibility.role == User.Role.STUDENT:
+        scopes.update(course_scope(course_id) for course_id in visibility.enrolled_course_ids)
+    return sorted(scopes)
+
+
+def calendar_version(user_id, visibility: Visibility) -> CalendarVersion:
+    """The user's calendar version; scopes never bumped are stamped lazily on first use."""
+    scopes = user_scopes(user_id, visibility)
+    keys = [CALENDAR_VERSION_KEY.format(scope=scope) for scope in scopes]
+    stamps = cache.get_many(keys)
+    for key in keys:
+        if key not in stamps:
+            now = timezone.now().timestamp()
+            stamps[key] = now if cache.add(key, now, timeout=None) else cache.get(key, now)
+    signature = ";".join(f"{scope}={stamps[key]}" for scope, key in zip(scopes, keys))
+    return CalendarVersion(
+        tag=hashlib.sha256(signature.encode()).hexdigest()[:20],
+        updated=max(stamps[key] for key in keys),
+    )
+
+
+def bump_calendar_version(scopes: Iterable[str]) -> float:
+    version = timezone.now().timestamp()
+    cache.set_many(
+        {CALENDAR_VERSION_KEY.format(scope=scope): version for scope in scopes}, timeout=None
+    )
+    return version
+
+
+def _text(value) -> Value:
+    return Value(value, output_field=CharField())
+
+
+def _enrolled_courses(user: User) -> QuerySet:
+    return CourseEnrollment.objects.filter(
+        student=user, status=CourseEnrollment.EnrollmentStatus.ENROLLED
+    ).values("course_id")
+
+
+def _events(user: User) -> QuerySet:
+    events = CalendarEvent.objects.all()
+    shared = Q(department__isnull=True)
+    if user.department_id:
+        shared |= Q(department_id=user.department_id)
+    if user.role == User.Role.HOD:
+        events = events.filter(shared)
+    elif user.role == User.Role.TEACHER:
+        teaching = Course.objects.filter(assigned_teacher=user).values("id")
+        events = events.filter(shared | Q(course_id__in=teaching))
+    elif user.role == User.Role.STUDENT:
+        events = events.filter(shared | Q(course_id__in=_enrolled_courses(user)))
+    elif user.role != User.Role.ADMIN:
+        events = events.none()
+    return events.annotate(
+        kind=_text("event"),
+        uid=F("id"),
+        summary=F("title"),
+        details=F("description"),
+        starts=F("start_at"),
+        ends=F("end_at"),
+        place=_text(""),
+        modified=F("updated_at"),
+    )
+
+
+def _timetable(user: User) -> QuerySet:
+    if user.role == User.Role.STUDENT:
+        entries = TimetableEntry.objects.filter(course_id__in=_enrolled_courses(user))
+    else:
+        entries = TimetableEntry.objects.filter(teacher=user)
+    return entries.annotate(
+        kind=_text("class"),
+        uid=F("id"),
+        summary=Concat("course__code", _text(" "), "course__title", output_field=CharField()),
+        details=F("entry_type"),
+        starts=F("start_at"),
+        ends=F("end_at"),
+        place=Coalesce("location__name", "room"),
+        modified=F("updated_at"),
+    )
+
+
+def _assessments(user: User) -> QuerySet:
+    assessments = Assessment.objects.filter(
+        status__in=VISIBLE_ASSESSMENT_STATUSES,
+        scheduled_at__isnull=False,
+        closes_at__isnull=False,
+    )
+    if user.role == User.Role.STUDENT:
+        assessments = assessments.filter(course_id__in=_enrolled_courses(user))
+    elif user.role == User.Role.TEACHER:
+        assessments = assessments.filter(course__assigned_teacher=user)
+    elif user.role == User.Role.HOD and user.department_id:
+        assessments = assessments.filter(course__department_id=user.department_id)
+    elif user.role != User.Role.ADMIN:
+        assessments = assessments.none()
+    return assessments.annotate(
+        kind=_text("assessment"),
+        uid=F("id"),
+        summary=Concat("course__code", _text(": "), "title", output_field=CharField()),
+        details=F("assessment_type"),
+        starts=F("scheduled_at"),
+        ends=F("closes_at"),
+        place=_text(""),
+        modified=F("updated_at"),
+    )
+
+
+def agenda_queryset(user: User, start: datetime, end: datetime) -> QuerySet:
+    """Everything on ``user``'s agenda overlapping ``[start, end)`` as one UNION query."""
+    window = Q(starts__lt=end, ends__gt=start)
+    parts = [
+        part.filter(window).order_by().values_list(*AGENDA_COLUMNS)
+        for part in (_events(user), _timetable(user), _assessments(user))
+    ]
+    return parts[0].union(*parts[1:], all=True).order_by("starts", "kind")
+
+
+def agenda_items(user: User, start: datetime, end: datetime) -> list[AgendaItem]:
+    return [AgendaItem(*row) for row in agenda_queryset(user, start, end)]
+
+
+def cached_agenda_items(user: User, start: datetime, end: datetime) -> list[AgendaItem]:
+    """``agenda_items`` cached per user and window until the user's calendar version changes."""
+    version = calendar_version(user.pk, visibility_for(user))
+    key = (
+        f"calendar:agenda:{user.pk}:{version.tag}:"
+        f"{start.timestamp():.0f}:{end.timestamp():.0f}"
+    )
+    items = cache.get(key)
+    record_cache_lookup("agenda", items is not None)
+    if items is None:
+        items = agenda_items(user, start, end)
+        cache.set(key, items, settings.CALENDAR_AGENDA_CACHE_SECONDS)
+    return items
@@ -5,3 +5,6 @@ class AcademicCalendarConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.academic_calendar"
     verbose_name = "Academic Calendar"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,86 @@
+"""Tokenized personal iCalendar feeds.
+
+Calendar apps poll feeds often and cannot authenticate with JWTs, so each user gets a
+secret feed token. Token lookups and rendered feeds are both cached; a rendered feed is
+keyed on the user's calendar version, so it is rebuilt only after something on their
+agenda changes, and conditional requests against an unchanged version end in a 304.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.common.metrics import record_cache_lookup
+from apps.courses.visibility import visibility_for_id
+from apps.users.models import User
+from .agenda import CalendarVersion, agenda_items, calendar_version
+from .ics import render_calendar
+from .models import CalendarFeedToken
+
+MISSING = 0  # cached marker for unknown tokens (user ids start at 1)
+
+
+def feed_token_cache_key(token: str) -> str:
+    return f"calendar:feed-token:{token}"
+
+
+def feed_user_id(token: str) -> int | None:
+    key = feed_token_cache_key(token)
+    user_id = cache.get(key)
+    record_cache_lookup("calendar_feed_token", user_id is not None)
+    if user_id is None:
+        user_id = (
+            CalendarFeedToken.objects.filter(token=token, user__is_active=True)
+            .values_list("user_id", flat=True)
+            .first()
+        ) or MISSING
+        cache.set(key, user_id, settings.CALENDAR_FEED_CACHE_SECONDS)
+    return user_id or None
+
+
+def forget_feed_token(token: str) -> None:
+    cache.delete(feed_token_cache_key(token))
+
+
+def rotate_feed_token(feed: CalendarFeedToken) -> CalendarFeedToken:
+    old_token = feed.token
+    feed.rotate()
+    forget_feed_token(old_token)
+    return feed
+
+
+def feed_version(user_id: int) -> CalendarVersion:
+    return calendar_version(user_id, visibility_for_id(user_id))
+
+
+def feed_etag(user_id: int) -> str:
+    return f"{user_id}-{feed_version(user_id).tag}"
+
+
+def feed_last_modified(user_id: int) -> datetime:
+    return datetime.fromtimestamp(int(feed_version(user_id).updated), tz=dt_timezone.utc)
+
+
+def render_feed(user_id: int) -> str:
+    """The user's feed for the configured window around today, cached per version."""
+    version = feed_version(user_id)
+    key = f"calendar:feed:{user_id}:{version.tag}"
+    body = cache.get(key)
+    record_cache_lookup("calendar_feed", body is not None)
+    if body is None:
+        user = User.objects.get(pk=user_id)
+        now = timezone.now()
+        items = agenda_items(
+            user,
+            now - timedelta(days=settings.CALENDAR_FEED_PAST_DAYS),
+            now + timedelta(days=settings.CALENDAR_FEED_FUTURE_DAYS),
+        )
+        stamp = datetime.fromtimestamp(version.updated, tz=dt_timezone.utc)
+        name = f"Sentraexam - {user.get_full_name() or user.email}"
+        body = render_calendar(items, name=name, stamp=stamp)
+        cache.set(key, body, settings.CALENDAR_FEED_CACHE_SECONDS)
+    return body
@@ -0,0 +1,75 @@
+"""Minimal RFC 5545 (iCalendar) rendering for personal agenda feeds."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timezone as dt_timezone
+
+from .agenda import AgendaItem
+
+PRODID = "-//Sentraexam//Calendar Feed//EN"
+UID_DOMAIN = "sentraexam"
+LINE_LIMIT = 75  # octets, excluding the CRLF
+
+
+def escape_text(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def format_datetime(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def fold(line: str) -> str:
+    """Split ``line`` into CRLF-continued chunks of at most 75 octets (never mid-character)."""
+    if len(line.encode("utf-8")) <= LINE_LIMIT:
+        return line
+    chunks: list[str] = []
+    current, size, limit = "", 0, LINE_LIMIT
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > limit:
+            chunks.append(current)
+            # Continuation lines start with a space, which counts towards the limit.
+            current, size, limit = "", 0, LINE_LIMIT - 1
+        current += char
+        size += width
+    chunks.append(current)
+    return "\r\n ".join(chunks)
+
+
+def render_calendar(
+    items: Iterable[AgendaItem], *, name: str, stamp: datetime
+) -> str:
+    dtstamp = format_datetime(stamp)
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_text(name)}",
+    ]
+    for item in items:
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{item.kind}-{item.uid}@{UID_DOMAIN}",
+            f"DTSTAMP:{dtstamp}",
+            f"LAST-MODIFIED:{format_datetime(item.modified)}",
+            f"DTSTART:{format_datetime(item.starts)}",
+            f"DTEND:{format_datetime(item.ends)}",
+            f"SUMMARY:{escape_text(item.summary)}",
+        ]
+        if item.details:
+            lines.append(f"DESCRIPTION:{escape_text(item.details)}")
+        if item.place:
+            lines.append(f"LOCATION:{escape_text(item.place)}")
+        lines += [f"CATEGORIES:{item.kind.upper()}", "END:VEVENT"]
+    lines.append("END:VCALENDAR")
+    return "".join(f"{fold(line)}\r\n" for line in lines)
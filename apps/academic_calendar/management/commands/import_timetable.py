@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from apps.academic_calendar.models import AcademicTerm
+from apps.academic_calendar.timetable_import import IMPORT_COLUMNS, import_timetable, read_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import timetable entries for a term from a CSV file with the columns "
+        + ", ".join(IMPORT_COLUMNS)
+        + ". Conflicting or invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("term", help="Academic term id.")
+        parser.add_argument("csv_path")
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Validate and report without writing."
+        )
+
+    def handle(self, *args, **options):
+        term = AcademicTerm.objects.filter(pk=options["term"]).first()
+        if term is None:
+            raise CommandError(f"Academic term {options['term']} does not exist.")
+        try:
+            with open(options["csv_path"], encoding="utf-8-sig", newline="") as handle:
+                rows = read_csv(handle)
+        except OSError as exc:
+            raise CommandError(str(exc)) from exc
+        except ValidationError as exc:
+            raise CommandError(exc.detail) from exc
+
+        result = import_timetable(term, rows, dry_run=options["dry_run"])
+        for error in result.errors:
+            messages = "; ".join(
+                f"{field}: {' '.join(str(message) for message in field_messages)}"
+                for field, field_messages in error["errors"].items()
+            )
+            self.stderr.write(f"Row {error['row']}: {messages}")
+        verb = "Would create" if result.dry_run else "Created"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result.valid} of {result.total} entries; {len(result.errors)} rejected."
+            )
+        )
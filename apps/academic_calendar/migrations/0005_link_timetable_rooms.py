@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+def link_rooms(apps, schema_editor):
+    """Create a Room per distinct room name and link timetable entries to it.
+
+    Entries that overlap an earlier booking of the same room are left unlinked (they keep
+    their room text) so the room exclusion constraint can be added, and need to be
+    re-assigned by hand.
+    """
+    Room = apps.get_model("academic_calendar", "Room")
+    TimetableEntry = apps.get_model("academic_calendar", "TimetableEntry")
+
+    rooms = {}
+    for name in TimetableEntry.objects.values_list("room", flat=True).distinct():
+        normalized = " ".join(name.split())
+        if normalized and normalized.casefold() not in rooms:
+            rooms[normalized.casefold()] = Room(name=normalized)
+    Room.objects.bulk_create(rooms.values())
+
+    booked_until = {}
+    linked = []
+    entries = TimetableEntry.objects.only("id", "room", "start_at", "end_at").order_by("start_at")
+    for entry in entries.iterator(chunk_size=2000):
+        key = " ".join(entry.room.split()).casefold()
+        room = rooms.get(key)
+        if room is None or entry.start_at < booked_until.get(key, entry.start_at):
+            continue
+        booked_until[key] = max(booked_until.get(key, entry.end_at), entry.end_at)
+        entry.location_id = room.pk
+        linked.append(entry)
+    TimetableEntry.objects.bulk_update(linked, ["location"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academic_calendar", "0004_rooms"),
+    ]
+
+    operations = [
+        migrations.RunPython(link_rooms, migrations.RunPython.noop),
+    ]
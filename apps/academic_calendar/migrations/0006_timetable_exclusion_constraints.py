@@ -0,0 +1,74 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import RangeBoundary, RangeOperators
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations
+from django.db.models import Q
+
+from apps.common.db import PostgresOnlyAddConstraint, TsTzRange, is_postgres
+
+MAX_REPORTED_OVERLAPS = 20
+
+
+def check_teacher_overlaps(apps, schema_editor):
+    """Abort, listing the clashes, if a teacher already has overlapping timetable entries.
+
+    Unlike rooms (see 0005) a teacher cannot be unlinked, and which of two clashing
+    classes is wrong is for a person to decide, so they have to be fixed before the
+    teacher exclusion constraint can be added.
+    """
+    if not is_postgres(schema_editor.connection):
+        return
+    TimetableEntry = apps.get_model("academic_calendar", "TimetableEntry")
+    entries = TimetableEntry.objects.values_list(
+        "id", "teacher_id", "start_at", "end_at"
+    ).order_by("teacher_id", "start_at")
+    overlaps = []
+    teacher_id = latest = None
+    for entry_id, entry_teacher_id, start_at, end_at in entries.iterator(chunk_size=2000):
+        if entry_teacher_id != teacher_id:
+            teacher_id, latest = entry_teacher_id, None
+        elif start_at < latest[1]:
+            overlaps.append(f"{latest[0]} and {entry_id} (teacher {teacher_id})")
+        if latest is None or end_at > latest[1]:
+            latest = (entry_id, end_at)
+    if overlaps:
+        listed = "\n  ".join(overlaps[:MAX_REPORTED_OVERLAPS])
+        more = len(overlaps) - MAX_REPORTED_OVERLAPS
+        suffix = f"\n  ... and {more} more" if more > 0 else ""
+        raise RuntimeError(
+            f"{len(overlaps)} timetable entries overlap another class of the same teacher; "
+            f"reschedule or delete them before migrating:\n  {listed}{suffix}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("academic_calendar", "0005_link_timetable_rooms"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_teacher_overlaps, migrations.RunPython.noop),
+        BtreeGistExtension(),
+        PostgresOnlyAddConstraint(
+            model_name="timetableentry",
+            constraint=ExclusionConstraint(
+                name="timetable_teacher_no_overlap",
+                expressions=[
+                    ("teacher", RangeOperators.EQUAL),
+                    (TsTzRange("start_at", "end_at", RangeBoundary()), RangeOperators.OVERLAPS),
+                ],
+            ),
+        ),
+        PostgresOnlyAddConstraint(
+            model_name="timetableentry",
+            constraint=ExclusionConstraint(
+                name="timetable_room_no_overlap",
+                expressions=[
+                    ("location", RangeOperators.EQUAL),
+                    (TsTzRange("start_at", "end_at", RangeBoundary()), RangeOperators.OVERLAPS),
+                ],
+                condition=Q(location__isnull=False),
+            ),
+        ),
+    ]
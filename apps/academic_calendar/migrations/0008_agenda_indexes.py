@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic_calendar', '0007_calendar_feed_token'),
+        ('courses', '0002_initial'),
+        ('departments', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['start_at', 'end_at'], name='academic_ca_start_a_98124e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['course', 'start_at'], name='academic_ca_course__b29f45_idx'),
+        ),
+    ]
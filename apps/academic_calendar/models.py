@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import secrets
+
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 from apps.common.models import BaseModel, OwnedModel
@@ -86,12 +89,53 @@ class CalendarEvent(OwnedModel):
 
     class Meta:
         ordering = ("start_at",)
+        indexes = [
+            models.Index(fields=("start_at", "end_at")),
+            models.Index(fields=("course", "start_at")),
+        ]
 
     def clean(self):
         if self.start_at >= self.end_at:
             raise ValueError("Event end time must be after start time.")
 
 
+class RoomQuerySet(models.QuerySet):
+    def for_name(self, name: str) -> "Room":
+        """Return the room called ``name`` (case-insensitively), creating it if needed."""
+        name = " ".join(name.split())
+        room = self.filter(name__iexact=name).first()
+        if room is not None:
+            return room
+        try:
+            with transaction.atomic():
+                return self.create(name=name)
+        except IntegrityError:
+            return self.get(name__iexact=name)
+
+
+class Room(BaseModel):
+    name = models.CharField(max_length=128)
+    building = models.CharField(max_length=128, blank=True)
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    is_active = models.BooleanField(default=True)
+
+    objects = RoomQuerySet.as_manager()
+
+    class Meta:
+        ordering = ("name",)
+        constraints = [
+            models.UniqueConstraint(Lower("name"), name="room_name_ci_unique"),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+# Postgres exclusion constraints (migration 0006) backing the overlap checks below.
+TEACHER_OVERLAP_CONSTRAINT = "timetable_teacher_no_overlap"
+ROOM_OVERLAP_CONSTRAINT = "timetable_room_no_overlap"
+
+
 class TimetableEntry(OwnedModel):
     class EntryType(models.TextChoices):
         LECTURE = "LECTURE", "Lecture"
@@ -108,6 +152,13 @@ class TimetableEntry(OwnedModel):
     course = models.ForeignKey("courses.Course", on_delete=models.CASCADE)
     teacher = models.ForeignKey(User, on_delete=models.CASCADE, related_name="timetable_entries")
     room = models.CharField(max_length=128)
+    location = models.ForeignKey(
+        Room,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="timetable_entries",
+    )
     entry_type = models.CharField(max_length=20, choices=EntryType.choices)
     start_at = models.DateTimeField()
     end_at = models.DateTimeField()
@@ -117,18 +168,56 @@ class TimetableEntry(OwnedModel):
         indexes = [
             models.Index(fields=("teacher", "start_at")),
             models.Index(fields=("course", "start_at")),
+            models.Index(fields=("location", "start_at")),
         ]
 
-    def overlaps(self) -> bool:
+    def _overlapping(self):
         return TimetableEntry.objects.filter(
-            teacher=self.teacher,
             start_at__lt=self.end_at,
             end_at__gt=self.start_at,
-        ).exclude(id=self.id).exists()
+        ).exclude(id=self.id)
+
+    def overlaps(self) -> bool:
+        return self._overlapping().filter(teacher=self.teacher).exists()
+
+    def room_overlaps(self) -> bool:
+        return bool(self.location_id) and self._overlapping().filter(
+            location_id=self.location_id
+        ).exists()
 
     def save(self, *args, **kwargs):
         if self.start_at >= self.end_at:
             raise ValueError("Timetable entry end time must be after start time.")
         if self.overlaps():
             raise ValueError("Timetable entry overlaps with existing schedule.")
-        super().save(*args, **kwargs)
+        if self.room_overlaps():
+            raise ValueError("Room is already booked for this time.")
+        # The checks above race with concurrent writers; on Postgres the exclusion
+        # constraints are the real guarantee.
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as exc:
+            if TEACHER_OVERLAP_CONSTRAINT in str(exc):
+                raise ValueError("Timetable entry overlaps with existing schedule.") from exc
+            if ROOM_OVERLAP_CONSTRAINT in str(exc):
+                raise ValueError("Room is already booked for this time.") from exc
+            raise
+
+
+def generate_feed_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+class CalendarFeedToken(BaseModel):
+    """Secret that authenticates a user's iCalendar feed URL (calendar apps cannot send JWTs)."""
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="calendar_feed_token")
+    token = models.CharField(max_length=64, unique=True, default=generate_feed_token)
+
+    def __str__(self) -> str:
+        return f"Calendar feed for {self.user}"
+
+    def rotate(self) -> None:
+        self.token = generate_feed_token()
+        self.save(update_fields=["token", "updated_at"])
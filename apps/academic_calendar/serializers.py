@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+from django.conf import settings
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import AcademicTerm, AcademicYear, CalendarEvent, TimetableEntry
+from .models import (
+    AcademicTerm,
+    AcademicYear,
+    CalendarEvent,
+    CalendarFeedToken,
+    Room,
+    TimetableEntry,
+)
 
 
 class AcademicYearSerializer(serializers.ModelSerializer):
@@ -52,9 +61,75 @@ class CalendarEventSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class AgendaQuerySerializer(serializers.Serializer):
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField()
+
+    def validate(self, attrs):
+        if attrs["start"] >= attrs["end"]:
+            raise serializers.ValidationError("End must be after start.")
+        if (attrs["end"] - attrs["start"]).days >= settings.CALENDAR_AGENDA_MAX_DAYS:
+            raise serializers.ValidationError(
+                f"The agenda window cannot exceed {settings.CALENDAR_AGENDA_MAX_DAYS} days."
+            )
+        return attrs
+
+
+class AgendaItemSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    id = serializers.CharField(source="uid")
+    title = serializers.CharField(source="summary")
+    details = serializers.CharField()
+    start_at = serializers.DateTimeField(source="starts")
+    end_at = serializers.DateTimeField(source="ends")
+    location = serializers.CharField(source="place")
+    updated_at = serializers.DateTimeField(source="modified")
+
+
+class CalendarFeedSerializer(serializers.ModelSerializer):
+    url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = CalendarFeedToken
+        fields = ("url", "token", "created_at", "updated_at")
+        read_only_fields = fields
+
+    def get_url(self, obj: CalendarFeedToken) -> str:
+        return self.context["url"]
+
+
+class RoomSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Room
+        fields = ("id", "name", "building", "capacity", "is_active", "created_at", "updated_at")
+
+    def validate_name(self, value: str) -> str:
+        value = " ".join(value.split())
+        duplicates = Room.objects.filter(name__iexact=value)
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError("A room with this name already exists.")
+        return value
+
+
+class RoomAvailabilityQuerySerializer(serializers.Serializer):
+    start_at = serializers.DateTimeField()
+    end_at = serializers.DateTimeField()
+    min_capacity = serializers.IntegerField(required=False, min_value=1)
+
+    def validate(self, attrs):
+        if attrs["start_at"] >= attrs["end_at"]:
+            raise serializers.ValidationError("End time must be after start time.")
+        return attrs
+
+
 class TimetableEntrySerializer(serializers.ModelSerializer):
     course_code = serializers.CharField(source="course.code", read_only=True)
     teacher_email = serializers.EmailField(source="teacher.email", read_only=True)
+    location = serializers.PrimaryKeyRelatedField(
+        queryset=Room.objects.filter(is_active=True), required=False, allow_null=True
+    )
 
     class Meta:
         model = TimetableEntry
@@ -66,6 +141,7 @@ class TimetableEntrySerializer(serializers.ModelSerializer):
             "teacher",
             "teacher_email",
             "room",
+            "location",
             "entry_type",
             "start_at",
             "end_at",
@@ -73,7 +149,52 @@ class TimetableEntrySerializer(serializers.ModelSerializer):
             "updated_at",
         )
 
+        extra_kwargs = {"room": {"required": False}}
+
     def validate(self, attrs):
         if attrs["start_at"] >= attrs["end_at"]:
             raise serializers.ValidationError("End time must be after start time.")
+        if attrs.get("location"):
+            attrs["room"] = attrs["location"].name
+        elif not attrs.get("room") and self.instance is None:
+            raise serializers.ValidationError({"room": "A room is required."})
+        return attrs
+
+    @staticmethod
+    def _resolve_room(validated_data) -> None:
+        # Done while saving, inside its transaction, so a rejected entry creates no room.
+        if validated_data.get("room") and not validated_data.get("location"):
+            validated_data["location"] = Room.objects.for_name(validated_data["room"])
+            validated_data["room"] = validated_data["location"].name
+
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                self._resolve_room(validated_data)
+                return super().create(validated_data)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc)) from exc
+
+    def update(self, instance, validated_data):
+        try:
+            with transaction.atomic():
+                self._resolve_room(validated_data)
+                return super().update(instance, validated_data)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc)) from exc
+
+
+class TimetableImportSerializer(serializers.Serializer):
+    """Bulk import request: a CSV ``file`` or a JSON list of ``entries`` for one term."""
+
+    academic_term = serializers.PrimaryKeyRelatedField(queryset=AcademicTerm.objects.all())
+    file = serializers.FileField(required=False)
+    entries = serializers.ListField(
+        child=serializers.DictField(), required=False, allow_empty=False
+    )
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if ("file" in attrs) == ("entries" in attrs):
+            raise serializers.ValidationError("Provide either a CSV file or a list of entries.")
         return attrs
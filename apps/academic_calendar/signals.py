@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.assessments.models import Assessment
+from apps.courses.models import CourseEnrollment
+from apps.users.models import User
+from .agenda import agenda_scopes, bump_calendar_version
+from .feeds import forget_feed_token
+from .models import CalendarEvent, CalendarFeedToken, TimetableEntry
+
+AGENDA_SOURCES = (CalendarEvent, TimetableEntry, Assessment, CourseEnrollment)
+
+
+def remember_previous_scopes(sender, instance, raw=False, **kwargs):
+    # A row moved to another course, department or teacher leaves the old agendas too.
+    instance._previous_calendar_scopes = set()
+    if not raw and not instance._state.adding:
+        previous = sender.objects.filter(pk=instance.pk).first()
+        if previous is not None:
+            instance._previous_calendar_scopes = agenda_scopes(previous)
+
+
+def invalidate_agendas(sender, instance, **kwargs):
+    scopes = agenda_scopes(instance) | getattr(instance, "_previous_calendar_scopes", set())
+    transaction.on_commit(lambda: bump_calendar_version(scopes))
+
+
+for model in AGENDA_SOURCES:
+    label = model._meta.label_lower
+    pre_save.connect(
+        remember_previous_scopes, sender=model, dispatch_uid=f"calendar_scopes_{label}"
+    )
+    for signal in (post_save, post_delete):
+        signal.connect(
+            invalidate_agendas,
+            sender=model,
+            dispatch_uid=f"calendar_version_{label}",
+        )
+
+
+@receiver(post_delete, sender=CalendarFeedToken, dispatch_uid="calendar_forget_feed_token")
+def forget_deleted_feed_token(sender, instance: CalendarFeedToken, **kwargs):
+    forget_feed_token(instance.token)
+
+
+@receiver(post_save, sender=User, dispatch_uid="calendar_forget_saved_user_feed_token")
+def forget_saved_user_feed_token(sender, instance: User, update_fields=None, **kwargs):
+    # Cached token lookups only check is_active on a miss; drop them when it may change.
+    if update_fields is not None and "is_active" not in update_fields:
+        return
+    token = (
+        CalendarFeedToken.objects.filter(user=instance).values_list("token", flat=True).first()
+    )
+    if token:
+        transaction.on_commit(lambda: forget_feed_token(token))
@@ -0,0 +1,349 @@
+from datetime import datetime, timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.academic_calendar.models import CalendarEvent, Room, TimetableEntry
+from apps.assessments.models import Assessment
+from apps.courses.visibility import visibility_for
+from apps.users.models import User
+from tests.factories import (
+    AcademicTermFactory,
+    AssessmentFactory,
+    CourseEnrollmentFactory,
+    CourseFactory,
+    DepartmentFactory,
+    UserFactory,
+)
+
+
+def _at(hour: int) -> datetime:
+    day = timezone.localdate() + timedelta(days=7)
+    return timezone.make_aware(datetime(day.year, day.month, day.day, hour))
+
+
+def _row(course, teacher, start: int, end: int, room: str = "A-101") -> dict:
+    return {
+        "course": course.code,
+        "teacher": teacher.email,
+        "room": room,
+        "entry_type": "LECTURE",
+        "start_at": _at(start).isoformat(),
+        "end_at": _at(end).isoformat(),
+    }
+
+
+@pytest.mark.django_db
+def test_timetable_import_reports_every_conflict(django_assert_max_num_queries):
+    admin = UserFactory(role=User.Role.ADMIN)
+    term = AcademicTermFactory()
+    teacher = UserFactory(role=User.Role.TEACHER)
+    other_teacher = UserFactory(role=User.Role.TEACHER)
+    course = CourseFactory()
+    TimetableEntry.objects.create(
+        academic_term=term,
+        course=course,
+        teacher=teacher,
+        room="B-1",
+        entry_type="LECTURE",
+        start_at=_at(9),
+        end_at=_at(10),
+    )
+    entries = [
+        _row(course, teacher, 9, 11),  # clashes with the existing entry
+        _row(course, other_teacher, 13, 15),  # clashes with the next row
+        _row(course, other_teacher, 14, 16),
+        _row(course, other_teacher, 16, 17),  # back-to-back is fine
+        _row(course, teacher, 11, 12),
+        {**_row(course, teacher, 12, 13), "course": "NOPE"},
+    ]
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    with django_assert_max_num_queries(12):
+        response = client.post(
+            "/api/calendar/timetable/import/",
+            {"academic_term": str(term.id), "entries": entries},
+            format="json",
+        )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["created"] == 2
+    assert [error["row"] for error in data["errors"]] == [1, 2, 3, 6]
+    assert "already booked" in data["errors"][0]["errors"]["teacher"][0]
+    assert "row 3" in data["errors"][1]["errors"]["teacher"][0]
+    assert "course" in data["errors"][3]["errors"]
+    assert TimetableEntry.objects.filter(teacher=other_teacher).count() == 1
+
+
+@pytest.mark.django_db
+def test_timetable_import_from_csv_dry_run():
+    admin = UserFactory(role=User.Role.ADMIN)
+    term = AcademicTermFactory()
+    teacher = UserFactory(role=User.Role.TEACHER)
+    course = CourseFactory()
+    row = _row(course, teacher, 9, 10)
+    content = ",".join(row) + "\n" + ",".join(row.values()) + "\n"
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    response = client.post(
+        "/api/calendar/timetable/import/",
+        {
+            "academic_term": str(term.id),
+            "file": SimpleUploadedFile("timetable.csv", content.encode()),
+            "dry_run": "true",
+        },
+        format="multipart",
+    )
+
+    assert response.status_code == 200
+    assert response.json()["valid"] == 1
+    assert not TimetableEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_timetable_entry_rejects_room_double_booking():
+    admin = UserFactory(role=User.Role.ADMIN)
+    term = AcademicTermFactory()
+    course = CourseFactory()
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    payload = {
+        "academic_term": str(term.id),
+        "course": str(course.id),
+        "entry_type": "LECTURE",
+        "start_at": _at(9).isoformat(),
+        "end_at": _at(10).isoformat(),
+    }
+
+    first = client.post(
+        "/api/calendar/timetable/",
+        {**payload, "teacher": UserFactory(role=User.Role.TEACHER).id, "room": "Lab  1"},
+        format="json",
+    )
+    second = client.post(
+        "/api/calendar/timetable/",
+        {**payload, "teacher": UserFactory(role=User.Role.TEACHER).id, "room": "lab 1"},
+        format="json",
+    )
+
+    assert first.status_code == 201
+    assert first.json()["room"] == "Lab 1"
+    assert second.status_code == 400
+    assert "Room is already booked" in str(second.json())
+    assert Room.objects.count() == 1
+
+    # A rejected entry does not leave its new room behind.
+    clashing_teacher = first.json()["teacher"]
+    third = client.post(
+        "/api/calendar/timetable/",
+        {**payload, "teacher": clashing_teacher, "room": "Lab 2"},
+        format="json",
+    )
+    assert third.status_code == 400
+    assert not Room.objects.filter(name="Lab 2").exists()
+
+
+@pytest.mark.django_db
+def test_available_rooms_excludes_booked_rooms():
+    teacher = UserFactory(role=User.Role.TEACHER)
+    booked = Room.objects.create(name="Hall A", capacity=100)
+    free = Room.objects.create(name="Hall B", capacity=80)
+    Room.objects.create(name="Seminar", capacity=20)
+    TimetableEntry.objects.create(
+        academic_term=AcademicTermFactory(),
+        course=CourseFactory(),
+        teacher=teacher,
+        room=booked.name,
+        location=booked,
+        entry_type="LECTURE",
+        start_at=_at(9),
+        end_at=_at(11),
+    )
+    client = APIClient()
+    client.force_authenticate(user=teacher)
+
+    response = client.get(
+        "/api/calendar/rooms/available/",
+        {"start_at": _at(10).isoformat(), "end_at": _at(12).isoformat(), "min_capacity": 50},
+    )
+
+    assert response.status_code == 200
+    assert [room["id"] for room in response.json()["results"]] == [str(free.id)]
+
+    client.force_authenticate(user=UserFactory(role=User.Role.ADMIN))
+    assert client.delete(f"/api/calendar/rooms/{booked.id}/").status_code == 409
+    assert Room.objects.filter(pk=booked.pk).exists()
+    assert client.delete(f"/api/calendar/rooms/{free.id}/").status_code == 204
+
+
+@pytest.mark.django_db
+def test_calendar_feed_is_tokenized_and_conditional(django_capture_on_commit_callbacks):
+    student = UserFactory(role=User.Role.STUDENT)
+    course = CourseFactory()
+    CourseEnrollmentFactory(course=course, student=student)
+    term = AcademicTermFactory()
+    event = CalendarEvent.objects.create(
+        title="Open day, main hall",
+        event_type=CalendarEvent.EventType.MEETING,
+        start_at=_at(8),
+        end_at=_at(9),
+        academic_term=term,
+    )
+    TimetableEntry.objects.create(
+        academic_term=term,
+        course=course,
+        teacher=UserFactory(role=User.Role.TEACHER),
+        room="B-2",
+        entry_type="LECTURE",
+        start_at=_at(10),
+        end_at=_at(11),
+    )
+    AssessmentFactory(
+        course=course,
+        title="Midterm",
+        status=Assessment.Status.SCHEDULED,
+        scheduled_at=_at(13),
+        closes_at=_at(14),
+    )
+    AssessmentFactory(  # not enrolled
+        status=Assessment.Status.SCHEDULED, scheduled_at=_at(15), closes_at=_at(16)
+    )
+    client = APIClient()
+    client.force_authenticate(user=student)
+    feed_url = client.get("/api/calendar/feed/").json()["url"]
+    client.force_authenticate(user=None)
+
+    response = client.get(feed_url)
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/calendar")
+    body = response.content.decode()
+    assert body.startswith("BEGIN:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 3
+    assert "SUMMARY:Open day\\, main hall" in body
+    assert f"UID:event-{event.id}@sentraexam" in body
+    assert "LOCATION:B-2" in body
+    assert f"SUMMARY:{course.code}: Midterm" in body
+
+    etag = response["ETag"]
+    assert client.get(feed_url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    with django_capture_on_commit_callbacks(execute=True):
+        event.title = "Open day moved"
+        event.save()
+    changed = client.get(feed_url, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert "SUMMARY:Open day moved" in changed.content.decode()
+
+
+@pytest.mark.django_db
+def test_rotating_calendar_feed_token_revokes_old_url():
+    user = UserFactory(role=User.Role.TEACHER)
+    client = APIClient()
+    client.force_authenticate(user=user)
+    old_url = client.get("/api/calendar/feed/").json()["url"]
+    assert client.get(old_url).status_code == 200
+
+    new_url = client.post("/api/calendar/feed/rotate/").json()["url"]
+
+    assert new_url != old_url
+    assert client.get(old_url).status_code == 404
+    assert client.get(new_url).status_code == 200
+
+
+@pytest.mark.django_db
+def test_deactivating_a_user_revokes_their_cached_feed(django_capture_on_commit_callbacks):
+    user = UserFactory(role=User.Role.TEACHER)
+    client = APIClient()
+    client.force_authenticate(user=user)
+    url = client.get("/api/calendar/feed/").json()["url"]
+    assert client.get(url).status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_active = False
+        user.save()
+
+    assert client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+def test_agenda_merges_sources_in_one_cached_query(
+    django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    teacher = UserFactory(role=User.Role.TEACHER)
+    course = CourseFactory(assigned_teacher=teacher)
+    term = AcademicTermFactory()
+    TimetableEntry.objects.create(
+        academic_term=term,
+        course=course,
+        teacher=teacher,
+        room="B-2",
+        entry_type="LECTURE",
+        start_at=_at(10),
+        end_at=_at(11),
+    )
+    AssessmentFactory(
+        course=course,
+        status=Assessment.Status.SCHEDULED,
+        scheduled_at=_at(13),
+        closes_at=_at(14),
+    )
+    CalendarEvent.objects.create(
+        title="Staff meeting",
+        event_type=CalendarEvent.EventType.MEETING,
+        start_at=_at(8),
+        end_at=_at(9),
+        academic_term=term,
+    )
+    CalendarEvent.objects.create(  # outside the window
+        title="Later",
+        event_type=CalendarEvent.EventType.MEETING,
+        start_at=_at(8) + timedelta(days=30),
+        end_at=_at(9) + timedelta(days=30),
+        academic_term=term,
+    )
+    client = APIClient()
+    client.force_authenticate(user=teacher)
+    window = {"start": _at(0).isoformat(), "end": _at(23).isoformat()}
+    visibility_for(teacher)
+
+    with django_assert_num_queries(1):
+        response = client.get("/api/calendar/agenda/", window)
+    assert response.status_code == 200
+    assert [item["kind"] for item in response.json()] == ["event", "class", "assessment"]
+    assert response.json()[1]["location"] == "B-2"
+
+    with django_assert_num_queries(0):
+        assert client.get("/api/calendar/agenda/", window).json() == response.json()
+
+    other_department = DepartmentFactory()
+    with django_capture_on_commit_callbacks(execute=True):
+        AssessmentFactory(
+            course=CourseFactory(department=other_department),
+            status=Assessment.Status.SCHEDULED,
+            scheduled_at=_at(13),
+            closes_at=_at(14),
+        )
+        CalendarEvent.objects.create(
+            title="Other department",
+            event_type=CalendarEvent.EventType.MEETING,
+            start_at=_at(8),
+            end_at=_at(9),
+            academic_term=term,
+            department=other_department,
+        )
+    with django_assert_num_queries(0):
+        client.get("/api/calendar/agenda/", window)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        CalendarEvent.objects.filter(title="Later").get().delete()
+    with django_assert_num_queries(1):
+        client.get("/api/calendar/agenda/", window)
+
+    too_long = {"start": _at(0).isoformat(), "end": (_at(0) + timedelta(days=90)).isoformat()}
+    assert client.get("/api/calendar/agenda/", too_long).status_code == 400
@@ -0,0 +1,213 @@
+"""Bulk timetable import.
+
+Rows are validated in memory: courses, teachers and rooms are resolved with one query
+each, the existing entries of those teachers and rooms in the imported time span are
+loaded once, and double-bookings (against existing entries and within the import) are
+found with a sort-and-sweep. All problems are reported together; rows without problems
+are written with ``bulk_create``.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from apps.common.intervals import overlapping_pairs_by
+from apps.courses.models import Course
+from apps.users.models import User
+from .agenda import agenda_scopes, bump_calendar_version
+from .models import AcademicTerm, Room, TimetableEntry
+
+IMPORT_COLUMNS = ("course", "teacher", "room", "entry_type", "start_at", "end_at")
+
+
+class TimetableImportRowSerializer(serializers.Serializer):
+    course = serializers.CharField(max_length=50, help_text="Course code.")
+    teacher = serializers.EmailField(help_text="Teacher email.")
+    room = serializers.CharField(max_length=128, help_text="Room name.")
+    entry_type = serializers.ChoiceField(choices=TimetableEntry.EntryType.choices)
+    start_at = serializers.DateTimeField()
+    end_at = serializers.DateTimeField()
+
+    def validate(self, attrs):
+        if attrs["start_at"] >= attrs["end_at"]:
+            raise serializers.ValidationError("End time must be after start time.")
+        attrs["room"] = " ".join(attrs["room"].split())
+        return attrs
+
+
+@dataclass
+class TimetableImportResult:
+    total: int
+    valid: int = 0
+    created: int = 0
+    dry_run: bool = False
+    errors: list[dict] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "valid": self.valid,
+            "created": self.created,
+            "rejected": len(self.errors),
+            "dry_run": self.dry_run,
+            "errors": self.errors,
+        }
+
+
+def read_csv(file) -> list[dict]:
+    """Parse an uploaded CSV (header row with ``IMPORT_COLUMNS``) into row dicts."""
+    content = file.read()
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig")
+    reader = csv.DictReader(io.StringIO(content))
+    missing = set(IMPORT_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise serializers.ValidationError(
+            {"file": f"Missing columns: {', '.join(sorted(missing))}."}
+        )
+    return [
+        {column: (row.get(column) or "").strip() for column in IMPORT_COLUMNS} for row in reader
+    ]
+
+
+def _describe(entry: TimetableEntry, course_codes: dict) -> str:
+    return (
+        f"{course_codes.get(entry.course_id, entry.course_id)} "
+        f"{entry.start_at.isoformat()}–{entry.end_at.isoformat()}"
+    )
+
+
+def _resolve_rooms(names: set[str], *, create: bool) -> dict[str, Room]:
+    """Map lower-cased room names to rooms; missing rooms are created unless ``create`` is
+    false (dry runs), in which case they are returned unsaved."""
+    wanted = {name.lower(): name for name in names}
+    rooms = {
+        room.lowered: room
+        for room in Room.objects.annotate(lowered=Lower("name")).filter(lowered__in=wanted)
+    }
+    missing = [Room(name=name) for key, name in wanted.items() if key not in rooms]
+    if missing and create:
+        Room.objects.bulk_create(missing, ignore_conflicts=True)
+        return _resolve_rooms(names, create=False)
+    rooms.update({room.name.lower(): room for room in missing})
+    return rooms
+
+
+def _check_overlaps(
+    new_entries: dict[int, TimetableEntry], courses: dict[str, Course], errors: dict
+) -> None:
+    """Record teacher and room double-bookings of ``new_entries`` in ``errors``."""
+    entries = new_entries.values()
+    existing = list(
+        TimetableEntry.objects.filter(
+            Q(teacher_id__in={entry.teacher_id for entry in entries})
+            | Q(location_id__in={entry.location_id for entry in entries}),
+            start_at__lt=max(entry.end_at for entry in entries),
+            end_at__gt=min(entry.start_at for entry in entries),
+        )
+        .select_related("course")
+        .only("id", "teacher", "location", "start_at", "end_at", "course__code")
+    )
+    course_codes = {course.pk: code for code, course in courses.items()}
+    course_codes.update({entry.course_id: entry.course.code for entry in existing})
+    row_numbers = {id(entry): number for number, entry in new_entries.items()}
+    candidates = [*existing, *entries]
+    for error_field, attname, label in (
+        ("teacher", "teacher_id", "Teacher"),
+        ("room", "location_id", "Room"),
+    ):
+        pairs = overlapping_pairs_by(
+            [entry for entry in candidates if getattr(entry, attname)],
+            key=lambda entry: getattr(entry, attname),
+            start=lambda entry: entry.start_at,
+            end=lambda entry: entry.end_at,
+        )
+        for first, second in pairs:
+            for entry, other in ((first, second), (second, first)):
+                number = row_numbers.get(id(entry))
+                if number is None:
+                    continue
+                other_number = row_numbers.get(id(other))
+                if other_number is None:
+                    message = f"{label} is already booked: {_describe(other, course_codes)}."
+                else:
+                    message = f"{label} is double-booked with row {other_number}."
+                errors.setdefault(number, {}).setdefault(error_field, []).append(message)
+
+
+def import_timetable(
+    term: AcademicTerm, rows: list[dict], *, user=None, dry_run: bool = False
+) -> TimetableImportResult:
+    result = TimetableImportResult(total=len(rows), dry_run=dry_run)
+    errors: dict[int, dict] = {}
+
+    parsed: dict[int, dict] = {}
+    for number, row in enumerate(rows, start=1):
+        serializer = TimetableImportRowSerializer(data=row)
+        if serializer.is_valid():
+            parsed[number] = serializer.validated_data
+        else:
+            errors[number] = dict(serializer.errors)
+
+    courses = {
+        course.code: course
+        for course in Course.objects.filter(
+            code__in={attrs["course"] for attrs in parsed.values()}
+        ).only("id", "code")
+    }
+    teachers = dict(
+        User.objects.filter(
+            email__in={attrs["teacher"] for attrs in parsed.values()}, role=User.Role.TEACHER
+        ).values_list("email", "id")
+    )
+
+    new_entries: dict[int, TimetableEntry] = {}
+    for number, attrs in parsed.items():
+        row_errors = {}
+        course = courses.get(attrs["course"])
+        if course is None:
+            row_errors["course"] = [f"Unknown course code '{attrs['course']}'."]
+        teacher_id = teachers.get(attrs["teacher"])
+        if teacher_id is None:
+            row_errors["teacher"] = [f"No teacher with email '{attrs['teacher']}'."]
+        if row_errors:
+            errors[number] = row_errors
+            continue
+        new_entries[number] = TimetableEntry(
+            academic_term=term,
+            course=course,
+            teacher_id=teacher_id,
+            room=attrs["room"],
+            entry_type=attrs["entry_type"],
+            start_at=attrs["start_at"],
+            end_at=attrs["end_at"],
+            created_by=user,
+            updated_by=user,
+        )
+
+    if new_entries:
+        rooms = _resolve_rooms(
+            {entry.room for entry in new_entries.values()}, create=not dry_run
+        )
+        for entry in new_entries.values():
+            entry.location = rooms[entry.room.lower()]
+            entry.room = entry.location.name
+        _check_overlaps(new_entries, courses, errors)
+
+    valid = [entry for number, entry in new_entries.items() if number not in errors]
+    result.errors = [{"row": number, "errors": errors[number]} for number in sorted(errors)]
+    result.valid = len(valid)
+    if valid and not dry_run:
+        with transaction.atomic():
+            TimetableEntry.objects.bulk_create(valid, batch_size=500)
+        # bulk_create skips post_save, so the feed caches are invalidated here.
+        bump_calendar_version(set().union(*(agenda_scopes(entry) for entry in valid)))
+        result.created = len(valid)
+    return result
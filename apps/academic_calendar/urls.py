@@ -1,16 +1,26 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
     AcademicTermViewSet,
     AcademicYearViewSet,
+    AgendaViewSet,
     CalendarEventViewSet,
+    CalendarFeedViewSet,
+    RoomViewSet,
     TimetableEntryViewSet,
+    calendar_feed,
 )
 
 router = DefaultRouter()
 router.register("years", AcademicYearViewSet, basename="academic-years")
 router.register("terms", AcademicTermViewSet, basename="academic-terms")
 router.register("events", CalendarEventViewSet, basename="calendar-events")
+router.register("agenda", AgendaViewSet, basename="calendar-agenda")
+router.register("feed", CalendarFeedViewSet, basename="calendar-feed")
+router.register("rooms", RoomViewSet, basename="rooms")
 router.register("timetable", TimetableEntryViewSet, basename="timetable-entries")
 
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path("ics/<str:token>.ics", calendar_feed, name="calendar-feed-ics"),
+]
@@ -1,20 +1,47 @@
 from __future__ import annotations
 
-from django.db.models import Q, QuerySet
+from django.db.models import Exists, OuterRef, ProtectedError, Q, QuerySet
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.views.decorators.http import condition, require_safe
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.courses.visibility import visibility_for
 from apps.users.models import User
 from apps.users.permissions import IsAdminOrHOD
-from .models import AcademicTerm, AcademicYear, CalendarEvent, TimetableEntry
+from .agenda import cached_agenda_items
+from .feeds import (
+    feed_etag,
+    feed_last_modified,
+    feed_user_id,
+    render_feed,
+    rotate_feed_token,
+)
+from .models import (
+    AcademicTerm,
+    AcademicYear,
+    CalendarEvent,
+    CalendarFeedToken,
+    Room,
+    TimetableEntry,
+)
 from .serializers import (
     AcademicTermSerializer,
     AcademicYearSerializer,
+    AgendaItemSerializer,
+    AgendaQuerySerializer,
     CalendarEventSerializer,
+    CalendarFeedSerializer,
+    RoomAvailabilityQuerySerializer,
+    RoomSerializer,
     TimetableEntrySerializer,
+    TimetableImportSerializer,
 )
+from .timetable_import import import_timetable, read_csv
 
 
 class AcademicYearViewSet(viewsets.ModelViewSet):
@@ -57,23 +84,21 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
         user = self.request.user
         qs = CalendarEvent.objects.select_related("academic_term", "department", "course")
         if user.role == User.Role.ADMIN:
-            return qs.distinct()
+            return qs
         if user.role == User.Role.HOD and user.department_id:
+            return qs.filter(Q(department_id=user.department_id) | Q(department__isnull=True))
+        if user.role in {User.Role.TEACHER, User.Role.STUDENT}:
+            visible = visibility_for(user)
+            course_ids = (
+                visible.teaching_course_ids
+                if user.role == User.Role.TEACHER
+                else visible.enrolled_course_ids
+            )
             return qs.filter(
-                Q(department_id=user.department_id) | Q(department__isnull=True)
-            ).distinct()
-        if user.role == User.Role.TEACHER:
-            return qs.filter(
-                Q(course__assigned_teacher=user)
-                | Q(department_id=user.department_id)
+                Q(course_id__in=course_ids)
+                | Q(department_id=visible.department_id)
                 | Q(department__isnull=True)
-            ).distinct()
-        if user.role == User.Role.STUDENT:
-            return qs.filter(
-                Q(course__enrollments__student=user)
-                | Q(department_id=user.department_id)
-                | Q(department__isnull=True)
-            ).distinct()
+            )
         return qs.none()
 
     def perform_create(self, serializer):
@@ -83,28 +108,73 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
         serializer.save(updated_by=self.request.user)
 
 
+class RoomInUse(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "This room is used by timetable entries; deactivate it instead."
+    default_code = "room_in_use"
+
+
+class RoomViewSet(viewsets.ModelViewSet):
+    queryset = Room.objects.all()
+    serializer_class = RoomSerializer
+    permission_classes = [IsAuthenticated]
+    filterset_fields = ("building", "is_active")
+    search_fields = ("name", "building")
+
+    def get_permissions(self):
+        if self.action in {"create", "update", "partial_update", "destroy"}:
+            return [IsAuthenticated(), IsAdminOrHOD()]
+        return [IsAuthenticated()]
+
+    def perform_destroy(self, instance: Room):
+        try:
+            instance.delete()
+        except ProtectedError:
+            raise RoomInUse()
+
+    @action(detail=False, methods=["get"])
+    def available(self, request, *args, **kwargs):
+        """Active rooms with no timetable entry overlapping ``[start_at, end_at)``."""
+        query = RoomAvailabilityQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        booked = TimetableEntry.objects.filter(
+            location=OuterRef("pk"),
+            start_at__lt=params["end_at"],
+            end_at__gt=params["start_at"],
+        )
+        rooms = self.filter_queryset(self.get_queryset()).filter(is_active=True)
+        if "min_capacity" in params:
+            rooms = rooms.filter(capacity__gte=params["min_capacity"])
+        rooms = rooms.filter(~Exists(booked))
+        page = self.paginate_queryset(rooms)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(rooms, many=True).data)
+
+
 class TimetableEntryViewSet(viewsets.ModelViewSet):
     serializer_class = TimetableEntrySerializer
     permission_classes = [IsAuthenticated]
-    filterset_fields = ("academic_term", "course", "teacher", "entry_type")
+    filterset_fields = ("academic_term", "course", "teacher", "location", "entry_type")
 
     def get_queryset(self) -> QuerySet[TimetableEntry]:
         user = self.request.user
-        qs = TimetableEntry.objects.select_related("academic_term", "course", "teacher")
+        qs = TimetableEntry.objects.select_related(
+            "academic_term", "course", "teacher", "location"
+        )
         if user.role == User.Role.ADMIN:
-            return qs.distinct()
+            return qs
         if user.role == User.Role.HOD and user.department_id:
-            return qs.filter(course__department_id=user.department_id).distinct()
+            return qs.filter(course__department_id=user.department_id)
         if user.role == User.Role.TEACHER:
-            return qs.filter(
-                Q(teacher=user) | Q(course__department_id=user.department_id)
-            ).distinct()
+            return qs.filter(Q(teacher=user) | Q(course__department_id=user.department_id))
         if user.role == User.Role.STUDENT:
-            return qs.filter(course__enrollments__student=user).distinct()
+            return qs.filter(course_id__in=visibility_for(user).enrolled_course_ids)
         return qs.none()
 
     def get_permissions(self):
-        if self.action in {"create", "update", "partial_update", "destroy"}:
+        if self.action in {"create", "update", "partial_update", "destroy", "import_entries"}:
             return [IsAuthenticated(), IsAdminOrHOD()]
         return [IsAuthenticated()]
 
@@ -113,3 +183,81 @@ class TimetableEntryViewSet(viewsets.ModelViewSet):
 
     def perform_update(self, serializer):
         serializer.save(updated_by=self.request.user)
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_entries(self, request, *args, **kwargs):
+        serializer = TimetableImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        rows = read_csv(data["file"]) if "file" in data else data["entries"]
+        result = import_timetable(
+            data["academic_term"], rows, user=request.user, dry_run=data["dry_run"]
+        )
+        if result.created:
+            response_status = status.HTTP_201_CREATED
+        elif result.errors:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_200_OK
+        return Response(result.as_dict(), status=response_status)
+
+
+class AgendaViewSet(viewsets.GenericViewSet):
+    """Merged, time-ordered events, classes and assessments for the current user."""
+
+    serializer_class = AgendaItemSerializer
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request, *args, **kwargs):
+        query = AgendaQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        items = cached_agenda_items(
+            request.user, query.validated_data["start"], query.validated_data["end"]
+        )
+        return Response(self.get_serializer(items, many=True).data)
+
+
+class CalendarFeedViewSet(viewsets.GenericViewSet):
+    """The current user's personal iCalendar feed URL."""
+
+    serializer_class = CalendarFeedSerializer
+    permission_classes = [IsAuthenticated]
+
+    def _feed(self) -> CalendarFeedToken:
+        feed, _ = CalendarFeedToken.objects.get_or_create(user=self.request.user)
+        return feed
+
+    def _response(self, feed: CalendarFeedToken) -> Response:
+        url = self.request.build_absolute_uri(
+            reverse("api:calendar-feed-ics", kwargs={"token": feed.token})
+        )
+        return Response(self.get_serializer(feed, context={"url": url}).data)
+
+    def list(self, request, *args, **kwargs):
+        return self._response(self._feed())
+
+    @action(detail=False, methods=["post"])
+    def rotate(self, request, *args, **kwargs):
+        """Issue a new feed URL; the old one stops working immediately."""
+        return self._response(rotate_feed_token(self._feed()))
+
+
+def _feed_etag(request, token: str) -> str | None:
+    user_id = feed_user_id(token)
+    return feed_etag(user_id) if user_id else None
+
+
+def _feed_last_modified(request, token: str):
+    user_id = feed_user_id(token)
+    return feed_last_modified(user_id) if user_id else None
+
+
+@require_safe
+@condition(etag_func=_feed_etag, last_modified_func=_feed_last_modified)
+def calendar_feed(request, token: str) -> HttpResponse:
+    user_id = feed_user_id(token)
+    if user_id is None:
+        raise Http404
+    response = HttpResponse(render_feed(user_id), content_type="text/calendar; charset=utf-8")
+    response["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,100 @@
+"""Per-student assessment clash report.
+
+Two queries: the assessments whose windows fall in the requested range, and the
+enrollments in their courses. A single sweep-line over the assessment windows finds
+every overlapping pair; a student clashes when enrolled in the courses of both
+assessments of a pair, so students are matched against the (usually short) list of
+clashing pairs for their courses instead of being checked one by one in the database.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from itertools import groupby
+
+from apps.common.intervals import overlapping_pairs
+from apps.courses.models import CourseEnrollment
+from .models import Assessment
+
+ASSESSMENT_FIELDS = (
+    "id",
+    "title",
+    "course_id",
+    "course__code",
+    "course__department_id",
+    "scheduled_at",
+    "closes_at",
+)
+
+
+def _describe(assessment: dict) -> dict:
+    return {
+        "assessment": assessment["id"],
+        "title": assessment["title"],
+        "course": assessment["course_id"],
+        "course_code": assessment["course__code"],
+        "scheduled_at": assessment["scheduled_at"],
+        "closes_at": assessment["closes_at"],
+    }
+
+
+def student_clashes(
+    start: datetime,
+    end: datetime,
+    *,
+    assessment_types: list[str],
+    department_id=None,
+) -> list[dict]:
+    """Return one row per student with overlapping assessments in ``[start, end)``.
+
+    With ``department_id`` only clashes involving at least one assessment of that
+    department's courses are reported.
+    """
+    assessments = list(
+        Assessment.objects.filter(
+            assessment_type__in=assessment_types,
+            scheduled_at__lt=end,
+            closes_at__gt=start,
+        )
+        .exclude(status__in=(Assessment.Status.DRAFT, Assessment.Status.CANCELLED))
+        .order_by()
+        .values(*ASSESSMENT_FIELDS)
+    )
+    pairs_by_course: dict[object, list[tuple[object, dict, dict]]] = defaultdict(list)
+    for first, second in overlapping_pairs(
+        assessments, start=lambda row: row["scheduled_at"], end=lambda row: row["closes_at"]
+    ):
+        if department_id is not None and department_id not in {
+            first["course__department_id"],
+            second["course__department_id"],
+        }:
+            continue
+        # Index each pair under one of its courses; the other must also be enrolled.
+        pairs_by_course[first["course_id"]].append((second["course_id"], first, second))
+    if not pairs_by_course:
+        return []
+
+    clash_courses = set(pairs_by_course)
+    clash_courses |= {other for pairs in pairs_by_course.values() for other, _, _ in pairs}
+    enrollments = (
+        CourseEnrollment.objects.filter(
+            course_id__in=clash_courses, status=CourseEnrollment.EnrollmentStatus.ENROLLED
+        )
+        .order_by("student_id")
+        .values_list("student_id", "student__email", "course_id")
+    )
+    report = []
+    for (student_id, email), rows in groupby(enrollments.iterator(), key=lambda row: row[:2]):
+        courses = {course_id for _, _, course_id in rows}
+        clashes = [
+            {"first": _describe(first), "second": _describe(second)}
+            for course_id in courses
+            for other, first, second in pairs_by_course.get(course_id, ())
+            if other in courses
+        ]
+        if clashes:
+            clashes.sort(key=lambda clash: clash["first"]["scheduled_at"])
+            report.append({"student": student_id, "student_email": email, "clashes": clashes})
+    report.sort(key=lambda row: row["student_email"])
+    return report
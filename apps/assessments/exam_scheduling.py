@@ -0,0 +1,410 @@
+"""Automatic exam timetabling.
+
+Exams are vertices of a conflict graph whose edges join exams that share enrolled
+students (weighted by the number of shared students). Slots are assigned with DSatur
+graph colouring under per-slot seat and room limits, then a local search moves single
+exams to reduce the number of students sitting two exams on the same day. Exams that
+are already scheduled are fixed: they block overlapping slots for conflicting exams and
+use up seats in them.
+
+The co-enrollment graph is kept sparse as ``{exam: Counter(neighbour -> shared)}`` built
+from one pass over the enrollments, so only course pairs that actually share students
+cost anything.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from itertools import combinations, groupby
+from time import perf_counter
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from apps.academic_calendar.agenda import assessment_scopes, bump_calendar_version
+from apps.academic_calendar.models import Room
+from apps.courses.models import CourseEnrollment
+from apps.search.index import update_entries
+from apps.search.models import SearchEntry
+from .models import Assessment
+
+# Students with two exams in consecutive slots of a day count this much more than two
+# exams further apart on the same day.
+ADJACENT_SLOT_WEIGHT = 2
+
+
+@dataclass(frozen=True)
+class ExamSlot:
+    start: datetime
+    end: datetime
+
+    @property
+    def day(self) -> date:
+        return timezone.localtime(self.start).date()
+
+    @property
+    def minutes(self) -> int:
+        return int((self.end - self.start).total_seconds() // 60)
+
+
+@dataclass
+class ExamNode:
+    key: object
+    size: int
+    duration_minutes: int
+
+
+@dataclass
+class ScheduleResult:
+    assignments: dict[object, ExamSlot] = field(default_factory=dict)
+    unscheduled: dict[object, str] = field(default_factory=dict)
+    same_day_pairs: int = 0
+    elapsed_ms: int = 0
+
+
+def build_slots(
+    start_date: date,
+    end_date: date,
+    slot_times: Iterable[time],
+    slot_minutes: int,
+    include_weekends: bool = False,
+) -> list[ExamSlot]:
+    slots = []
+    day = start_date
+    while day <= end_date:
+        if include_weekends or day.weekday() < 5:
+            for slot_time in sorted(slot_times):
+                start = timezone.make_aware(datetime.combine(day, slot_time))
+                slots.append(ExamSlot(start, start + timedelta(minutes=slot_minutes)))
+        day += timedelta(days=1)
+    return slots
+
+
+def co_enrollment_graph(
+    enrollments: Iterable[tuple[object, object]],
+) -> tuple[Counter, dict[object, Counter]]:
+    """Return per-course enrollment counts and the sparse course co-enrollment graph.
+
+    ``enrollments`` are ``(student, course)`` pairs ordered by student.
+    """
+    sizes: Counter = Counter()
+    graph: dict[object, Counter] = defaultdict(Counter)
+    for _, rows in groupby(enrollments, key=lambda row: row[0]):
+        courses = sorted({course for _, course in rows}, key=str)
+        sizes.update(courses)
+        for first, second in combinations(courses, 2):
+            graph[first][second] += 1
+            graph[second][first] += 1
+    return sizes, graph
+
+
+class ExamTimetabler:
+    """Assign each exam to a slot; see the module docstring for the approach."""
+
+    def __init__(
+        self,
+        exams: list[ExamNode],
+        conflicts: dict[int, Counter],
+        slots: list[ExamSlot],
+        *,
+        seat_capacity: int | None = None,
+        room_count: int | None = None,
+        blocked: dict[int, dict[int, int]] | None = None,
+        seats_taken: dict[int, int] | None = None,
+        max_passes: int = 20,
+        time_limit: float = 10.0,
+    ):
+        self.exams = exams
+        self.conflicts = conflicts
+        self.slots = slots
+        self.seat_capacity = seat_capacity
+        self.room_count = room_count
+        self.max_passes = max_passes
+        self.time_limit = time_limit
+
+        days: dict[date, list[int]] = defaultdict(list)
+        for index, slot in enumerate(slots):
+            days[slot.day].append(index)
+        self.day_slots = {
+            day: sorted(indexes, key=lambda index: slots[index].start)
+            for day, indexes in days.items()
+        }
+        self.slot_day = {index: slot.day for index, slot in enumerate(slots)}
+        self.slot_position = {
+            index: position
+            for indexes in self.day_slots.values()
+            for position, index in enumerate(indexes)
+        }
+
+        self.assigned: dict[int, int] = {}
+        # shared_in_slot[exam][slot]: students ``exam`` shares with the exams in that slot
+        # (including fixed ones); any non-zero value rules the slot out for ``exam``.
+        self.shared_in_slot = [Counter() for _ in exams]
+        # saturation[exam]: number of distinct slots ruled out by conflicts (DSatur).
+        self.saturation = [0] * len(exams)
+        for exam, slot_weights in (blocked or {}).items():
+            for slot, shared in slot_weights.items():
+                self._block(exam, slot, shared)
+        self.seats_used = Counter(seats_taken or {})
+        self.exams_in_slot: Counter = Counter()
+
+    def _fits(self, exam: int, slot: int) -> bool:
+        node = self.exams[exam]
+        if self.shared_in_slot[exam][slot] or node.duration_minutes > self.slots[slot].minutes:
+            return False
+        if self.room_count is not None and self.exams_in_slot[slot] >= self.room_count:
+            return False
+        if self.seat_capacity is not None:
+            return self.seats_used[slot] + node.size <= self.seat_capacity
+        return True
+
+    def _penalties(self, exam: int) -> Counter:
+        """Same-day student overlap ``exam`` would cause in each slot it could move to."""
+        penalties: Counter = Counter()
+        for slot, shared in self.shared_in_slot[exam].items():
+            if not shared:
+                continue
+            position = self.slot_position[slot]
+            for candidate in self.day_slots[self.slot_day[slot]]:
+                if candidate == slot:
+                    continue
+                adjacent = abs(self.slot_position[candidate] - position) == 1
+                penalties[candidate] += shared * (ADJACENT_SLOT_WEIGHT if adjacent else 1)
+        return penalties
+
+    def _block(self, exam: int, slot: int, shared: int) -> None:
+        if not self.shared_in_slot[exam][slot]:
+            self.saturation[exam] += 1
+        self.shared_in_slot[exam][slot] += shared
+
+    def _unblock(self, exam: int, slot: int, shared: int) -> None:
+        self.shared_in_slot[exam][slot] -= shared
+        if not self.shared_in_slot[exam][slot]:
+            self.saturation[exam] -= 1
+
+    def _place(self, exam: int, slot: int) -> None:
+        self.assigned[exam] = slot
+        self.seats_used[slot] += self.exams[exam].size
+        self.exams_in_slot[slot] += 1
+        for neighbour, shared in self.conflicts.get(exam, {}).items():
+            self._block(neighbour, slot, shared)
+
+    def _remove(self, exam: int) -> None:
+        slot = self.assigned.pop(exam)
+        self.seats_used[slot] -= self.exams[exam].size
+        self.exams_in_slot[slot] -= 1
+        for neighbour, shared in self.conflicts.get(exam, {}).items():
+            self._unblock(neighbour, slot, shared)
+
+    def _colour(self) -> list[int]:
+        """DSatur: place the most constrained exam next, in its least-penalised slot."""
+        degree = {
+            exam: sum(self.conflicts.get(exam, {}).values()) for exam in range(len(self.exams))
+        }
+
+        def priority(exam: int) -> tuple:
+            return (-self.saturation[exam], -degree[exam], -self.exams[exam].size, exam)
+
+        heap = [priority(exam) for exam in range(len(self.exams))]
+        heapq.heapify(heap)
+        done: set[int] = set()
+        failed = []
+        while heap:
+            entry = heapq.heappop(heap)
+            exam = entry[-1]
+            if exam in done:
+                continue
+            if -entry[0] != self.saturation[exam]:
+                # Stale entry: re-queue with the up-to-date saturation.
+                heapq.heappush(heap, priority(exam))
+                continue
+            done.add(exam)
+            candidates = [slot for slot in range(len(self.slots)) if self._fits(exam, slot)]
+            if not candidates:
+                failed.append(exam)
+                continue
+            penalties = self._penalties(exam)
+            self._place(exam, min(candidates, key=lambda slot: (penalties[slot], slot)))
+            for neighbour in self.conflicts.get(exam, ()):
+                if neighbour not in done:
+                    heapq.heappush(heap, priority(neighbour))
+        return failed
+
+    def _improve(self, deadline: float) -> None:
+        """Move exams one at a time while that lowers their same-day overlap."""
+        for _ in range(self.max_passes):
+            moved = False
+            for exam in list(self.assigned):
+                if perf_counter() > deadline:
+                    return
+                penalties = self._penalties(exam)
+                current = self.assigned[exam]
+                if not penalties[current]:
+                    continue
+                best = min(
+                    (
+                        slot
+                        for slot in range(len(self.slots))
+                        if slot == current or self._fits(exam, slot)
+                    ),
+                    key=lambda slot: (penalties[slot], slot != current, slot),
+                )
+                if best != current:
+                    self._remove(exam)
+                    self._place(exam, best)
+                    moved = True
+            if not moved:
+                return
+
+    def same_day_pairs(self) -> int:
+        """Number of (student, exam pair) combinations sitting on the same day."""
+        total = 0
+        for exam, slot in self.assigned.items():
+            for neighbour, shared in self.conflicts.get(exam, {}).items():
+                other = self.assigned.get(neighbour)
+                if exam < neighbour and other is not None:
+                    total += shared if self.slot_day[slot] == self.slot_day[other] else 0
+        return total
+
+    def solve(self) -> ScheduleResult:
+        started = perf_counter()
+        failed = self._colour()
+        self._improve(started + self.time_limit)
+        result = ScheduleResult(
+            assignments={
+                self.exams[exam].key: self.slots[slot] for exam, slot in self.assigned.items()
+            },
+            unscheduled={
+                self.exams[exam].key: "No slot is free of student clashes and within capacity."
+                for exam in failed
+            },
+            same_day_pairs=self.same_day_pairs(),
+        )
+        result.elapsed_ms = int((perf_counter() - started) * 1000)
+        return result
+
+
+def _overlapping_slots(slots: list[ExamSlot], start: datetime, end: datetime) -> set[int]:
+    return {index for index, slot in enumerate(slots) if slot.start < end and start < slot.end}
+
+
+def schedule_exams(
+    assessments: Iterable[Assessment],
+    slots: list[ExamSlot],
+    *,
+    seat_capacity: int | None = None,
+    room_count: int | None = None,
+    dry_run: bool = False,
+) -> ScheduleResult:
+    """Schedule ``assessments`` into ``slots`` and (unless ``dry_run``) save the result.
+
+    Exams already scheduled inside the slot range are taken into account but never moved.
+    When no limits are given they default to the active rooms with a known capacity.
+    """
+    assessments = list(assessments)
+    window_start = min(slot.start for slot in slots)
+    window_end = max(slot.end for slot in slots)
+    fixed = list(
+        Assessment.objects.filter(
+            assessment_type=Assessment.AssessmentType.EXAM,
+            status__in=(Assessment.Status.SCHEDULED, Assessment.Status.IN_PROGRESS),
+            scheduled_at__lt=window_end,
+            closes_at__gt=window_start,
+        )
+        .exclude(pk__in=[assessment.pk for assessment in assessments])
+        .only("id", "course_id", "scheduled_at", "closes_at")
+    )
+    if seat_capacity is None and room_count is None:
+        rooms = Room.objects.filter(is_active=True, capacity__isnull=False).aggregate(
+            seats=Sum("capacity"), count=Count("id")
+        )
+        if rooms["count"]:
+            seat_capacity, room_count = rooms["seats"], rooms["count"]
+
+    course_ids = {assessment.course_id for assessment in assessments}
+    course_ids |= {assessment.course_id for assessment in fixed}
+    enrollments = (
+        CourseEnrollment.objects.filter(
+            course_id__in=course_ids, status=CourseEnrollment.EnrollmentStatus.ENROLLED
+        )
+        .order_by("student_id")
+        .values_list("student_id", "course_id")
+        .iterator(chunk_size=10000)
+    )
+    sizes, course_graph = co_enrollment_graph(enrollments)
+
+    exams = [
+        ExamNode(assessment.pk, sizes[assessment.course_id], assessment.duration_minutes)
+        for assessment in assessments
+    ]
+    exams_by_course: dict[object, list[int]] = defaultdict(list)
+    for index, assessment in enumerate(assessments):
+        exams_by_course[assessment.course_id].append(index)
+    conflicts: dict[int, Counter] = defaultdict(Counter)
+    for course_id, indexes in exams_by_course.items():
+        for first, second in combinations(indexes, 2):
+            # Exams of the same course share every student.
+            conflicts[first][second] = conflicts[second][first] = sizes[course_id]
+        for neighbour_course, shared in course_graph.get(course_id, {}).items():
+            for index in indexes:
+                for neighbour in exams_by_course.get(neighbour_course, ()):
+                    conflicts[index][neighbour] = shared
+
+    blocked: dict[int, Counter] = defaultdict(Counter)
+    seats_taken: Counter = Counter()
+    for assessment in fixed:
+        overlapping = _overlapping_slots(slots, assessment.scheduled_at, assessment.closes_at)
+        for slot in overlapping:
+            seats_taken[slot] += sizes[assessment.course_id]
+        affected = {
+            index: sizes[assessment.course_id]
+            for index in exams_by_course.get(assessment.course_id, ())
+        }
+        for neighbour_course, shared in course_graph.get(assessment.course_id, {}).items():
+            affected.update(dict.fromkeys(exams_by_course.get(neighbour_course, ()), shared))
+        for index, shared in affected.items():
+            for slot in overlapping:
+                blocked[index][slot] += shared
+
+    result = ExamTimetabler(
+        exams,
+        conflicts,
+        slots,
+        seat_capacity=seat_capacity,
+        room_count=room_count,
+        blocked=blocked,
+        seats_taken=seats_taken,
+    ).solve()
+    if not dry_run:
+        apply_schedule(assessments, result)
+    return result
+
+
+def apply_schedule(assessments: list[Assessment], result: ScheduleResult) -> None:
+    now = timezone.now()
+    updated = []
+    for assessment in assessments:
+        slot = result.assignments.get(assessment.pk)
+        if slot is None:
+            continue
+        assessment.scheduled_at = slot.start
+        assessment.closes_at = slot.start + timedelta(minutes=assessment.duration_minutes)
+        assessment.status = Assessment.Status.SCHEDULED
+        assessment.updated_at = now
+        updated.append(assessment)
+    with transaction.atomic():
+        Assessment.objects.bulk_update(
+            updated, ["scheduled_at", "closes_at", "status", "updated_at"], batch_size=500
+        )
+        # Bulk writes skip the search index signals.
+        update_entries(
+            SearchEntry.Kind.ASSESSMENT,
+            [assessment.pk for assessment in updated],
+            status=Assessment.Status.SCHEDULED,
+        )
+    bump_calendar_version(assessment_scopes(assessment.course_id for assessment in updated))
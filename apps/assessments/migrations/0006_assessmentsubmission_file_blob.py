@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0005_drop_exam_url_column'),
+        ('common', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assessmentsubmission',
+            name='file_blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='submissions', to='common.contentblob'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0006_assessmentsubmission_file_blob'),
+        ('courses', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessment',
+            index=models.Index(fields=['course', 'scheduled_at'], name='assessments_course__331fd0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assessment',
+            index=models.Index(condition=models.Q(('scheduled_at__isnull', False)), fields=['scheduled_at', 'closes_at'], name='assessment_scheduled_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessments', '0007_agenda_indexes'),
+        ('common', '0002_upload_slot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assessmentsubmission',
+            index=models.Index(condition=models.Q(('status__in', ('SUBMITTED', 'LATE'))), fields=['submitted_at', 'id'], name='submission_ungraded_idx'),
+        ),
+    ]
@@ -7,7 +7,7 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
-from apps.common.models import BaseModel, OwnedModel
+from apps.common.models import BaseModel, ContentAddressedFilesMixin, OwnedModel
 from apps.courses.models import Course
 
 User = settings.AUTH_USER_MODEL
@@ -65,6 +65,14 @@ class Assessment(BaseModel):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("course", "scheduled_at")),
+            models.Index(
+                fields=("scheduled_at", "closes_at"),
+                name="assessment_scheduled_idx",
+                condition=models.Q(scheduled_at__isnull=False),
+            ),
+        ]
 
     def submit_for_approval(self):
         self.status = self.Status.SUBMITTED
@@ -83,12 +91,14 @@ class Assessment(BaseModel):
         self.save(update_fields=["status", "scheduled_at", "closes_at", "updated_at"])
 
 
-class AssessmentSubmission(OwnedModel):
+class AssessmentSubmission(ContentAddressedFilesMixin, OwnedModel):
     class SubmissionStatus(models.TextChoices):
         SUBMITTED = "SUBMITTED", "Submitted"
         GRADED = "GRADED", "Graded"
         LATE = "LATE", "Late Submission"
 
+    UNGRADED_STATUSES = (SubmissionStatus.SUBMITTED, SubmissionStatus.LATE)
+
     assessment = models.ForeignKey(
         Assessment, on_delete=models.CASCADE, related_name="submissions"
     )
@@ -111,11 +121,29 @@ class AssessmentSubmission(OwnedModel):
         null=True,
         blank=True,
     )
+    file_blob = models.ForeignKey(
+        "common.ContentBlob",
+        on_delete=models.PROTECT,
+        related_name="submissions",
+        null=True,
+        blank=True,
+        editable=False,
+    )
     answers = models.JSONField(default=list, blank=True)
 
+    blob_fields = {"file_response": "file_blob"}
+
     class Meta:
         unique_together = ("assessment", "student")
         ordering = ("-submitted_at",)
+        indexes = [
+            # Grading queue: the oldest ungraded submissions first.
+            models.Index(
+                fields=("submitted_at", "id"),
+                name="submission_ungraded_idx",
+                condition=models.Q(status__in=("SUBMITTED", "LATE")),
+            ),
+        ]
 
     def mark_graded(self, score, feedback=None):
         self.score = score
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from datetime import datetime, time, timedelta
+
 from django.utils import timezone
 from rest_framework import serializers
 
+from apps.academic_calendar.models import AcademicTerm
+from apps.common.models import UploadSlot
+from apps.common.serializers import DirectUploadSerializerMixin, UploadSlotField
 from apps.users.models import User
 from .models import Assessment, AssessmentSubmission
 
@@ -209,11 +214,80 @@ class AssessmentScheduleSerializer(serializers.Serializer):
         return assessment
 
 
-class AssessmentSubmissionSerializer(serializers.ModelSerializer):
+class ExamAutoScheduleSerializer(serializers.Serializer):
+    """Parameters for automatically scheduling approved exams into generated slots."""
+
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+    slot_times = serializers.ListField(
+        child=serializers.TimeField(), allow_empty=False, default=lambda: [time(9), time(14)]
+    )
+    slot_minutes = serializers.IntegerField(min_value=15, max_value=720, default=180)
+    include_weekends = serializers.BooleanField(default=False)
+    assessments = serializers.PrimaryKeyRelatedField(
+        queryset=Assessment.objects.filter(
+            assessment_type=Assessment.AssessmentType.EXAM, status=Assessment.Status.APPROVED
+        ),
+        many=True,
+        required=False,
+    )
+    department = serializers.UUIDField(required=False)
+    seat_capacity = serializers.IntegerField(min_value=1, required=False)
+    room_count = serializers.IntegerField(min_value=1, required=False)
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if attrs["start_date"] > attrs["end_date"]:
+            raise serializers.ValidationError("Start date must be on or before end date.")
+        if attrs["start_date"] < timezone.localdate():
+            raise serializers.ValidationError("Exams can only be scheduled in the future.")
+        if (attrs["end_date"] - attrs["start_date"]).days > 120:
+            raise serializers.ValidationError("The scheduling window is limited to 120 days.")
+        return attrs
+
+
+class ClashReportQuerySerializer(serializers.Serializer):
+    """Window for the clash report: an academic term, or an explicit start/end."""
+
+    academic_term = serializers.PrimaryKeyRelatedField(
+        queryset=AcademicTerm.objects.all(), required=False
+    )
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    assessment_type = serializers.MultipleChoiceField(
+        choices=Assessment.AssessmentType.choices, required=False
+    )
+    department = serializers.UUIDField(required=False)
+
+    def validate(self, attrs):
+        term = attrs.get("academic_term")
+        if term is not None:
+            attrs.setdefault(
+                "start", timezone.make_aware(datetime.combine(term.start_date, time.min))
+            )
+            attrs.setdefault(
+                "end",
+                timezone.make_aware(datetime.combine(term.end_date + timedelta(days=1), time.min)),
+            )
+        if "start" not in attrs or "end" not in attrs:
+            raise serializers.ValidationError("Provide an academic term or a start and end.")
+        if attrs["start"] >= attrs["end"]:
+            raise serializers.ValidationError("End must be after start.")
+        # Query strings give an empty selection rather than a missing one.
+        attrs["assessment_type"] = attrs.get("assessment_type") or {
+            Assessment.AssessmentType.EXAM
+        }
+        return attrs
+
+
+class AssessmentSubmissionSerializer(DirectUploadSerializerMixin, serializers.ModelSerializer):
+    upload_fields = {"file_upload": ("file_response", "file_blob")}
+
     assessment_title = serializers.CharField(source="assessment.title", read_only=True)
     student_email = serializers.EmailField(source="student.email", read_only=True)
     text_response = serializers.CharField(required=False, allow_blank=True)
     file_response = serializers.FileField(required=False, allow_null=True)
+    file_upload = UploadSlotField(purpose=UploadSlot.Purpose.SUBMISSION)
     answers = serializers.ListField(
         child=serializers.JSONField(),  # Allow mixed types (int for MCQ, str for Subjective)
         required=False,
@@ -233,6 +307,7 @@ class AssessmentSubmissionSerializer(serializers.ModelSerializer):
             "feedback",
             "text_response",
             "file_response",
+            "file_upload",
             "answers",
             "submitted_at",
             "created_at",
@@ -311,3 +386,37 @@ class AssessmentGradeSerializer(serializers.Serializer):
         )
         return submission
         return assessment
+
+
+class GradingQueueAssessmentSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    title = serializers.CharField()
+    assessment_type = serializers.CharField()
+    status = serializers.CharField()
+    closes_at = serializers.DateTimeField()
+    course = serializers.UUIDField(source="course_id")
+    course_code = serializers.CharField()
+    course_title = serializers.CharField()
+    pending = serializers.IntegerField()
+    late = serializers.IntegerField()
+    graded = serializers.IntegerField()
+
+
+class GradingQueueSubmissionSerializer(serializers.ModelSerializer):
+    assessment_title = serializers.CharField(source="assessment.title", read_only=True)
+    course_code = serializers.CharField(source="assessment.course.code", read_only=True)
+    student_email = serializers.EmailField(source="student.email", read_only=True)
+
+    class Meta:
+        model = AssessmentSubmission
+        fields = (
+            "id",
+            "assessment",
+            "assessment_title",
+            "course_code",
+            "student",
+            "student_email",
+            "status",
+            "submitted_at",
+        )
+        read_only_fields = fields
@@ -1,8 +1,11 @@
+from datetime import timedelta
+
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
 from rest_framework.test import APIClient
 
-from apps.assessments.models import Assessment
+from apps.assessments.models import Assessment, AssessmentSubmission
 from apps.users.models import User
 from tests.factories import (
     AssessmentFactory,
@@ -137,3 +140,142 @@ def test_assignment_submission_requires_file_for_file_format():
         format="multipart",
     )
     assert success_response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_exam_auto_schedule_separates_shared_students():
+    admin = UserFactory(role=User.Role.ADMIN)
+    first, second, third = CourseFactory(), CourseFactory(), CourseFactory()
+    student = UserFactory(role=User.Role.STUDENT)
+    for course in (first, second):
+        CourseEnrollmentFactory(course=course, student=student)
+    CourseEnrollmentFactory(course=third)
+    exams = [
+        AssessmentFactory(course=course, status=Assessment.Status.APPROVED)
+        for course in (first, second, third)
+    ]
+    start = timezone.localdate() + timedelta(days=7)
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    response = client.post(
+        "/api/assessments/auto-schedule/",
+        {
+            "start_date": start.isoformat(),
+            "end_date": start.isoformat(),
+            "slot_times": ["09:00", "14:00"],
+            "include_weekends": True,
+        },
+        format="json",
+    )
+
+    assert response.status_code == 200, response.json()
+    assert response.json()["unscheduled"] == []
+    for exam in exams:
+        exam.refresh_from_db()
+        assert exam.status == Assessment.Status.SCHEDULED
+        assert exam.closes_at == exam.scheduled_at + timedelta(minutes=exam.duration_minutes)
+    assert exams[0].scheduled_at != exams[1].scheduled_at
+
+    draft = AssessmentFactory(course=third, status=Assessment.Status.DRAFT)
+    response = client.post(
+        "/api/assessments/auto-schedule/",
+        {
+            "start_date": start.isoformat(),
+            "end_date": start.isoformat(),
+            "assessments": [str(draft.id)],
+        },
+        format="json",
+    )
+    assert response.status_code == 400
+    draft.refresh_from_db()
+    assert draft.status == Assessment.Status.DRAFT
+
+
+@pytest.mark.django_db
+def test_clash_report_lists_students_with_overlapping_exams(django_assert_max_num_queries):
+    department = DepartmentFactory()
+    hod = UserFactory(role=User.Role.HOD, department=department)
+    first, second, third = (CourseFactory(department=department) for _ in range(3))
+    clashing = UserFactory(role=User.Role.STUDENT)
+    for course in (first, second, third):
+        CourseEnrollmentFactory(course=course, student=clashing)
+    CourseEnrollmentFactory(course=first)
+    start = timezone.now() + timedelta(days=3)
+    for course, offset in ((first, 0), (second, 30), (third, 120)):
+        AssessmentFactory(
+            course=course,
+            status=Assessment.Status.SCHEDULED,
+            scheduled_at=start + timedelta(minutes=offset),
+            closes_at=start + timedelta(minutes=offset + 60),
+        )
+    client = APIClient()
+    client.force_authenticate(user=hod)
+
+    with django_assert_max_num_queries(4):
+        response = client.get(
+            "/api/assessments/clash-report/",
+            {"start": start.isoformat(), "end": (start + timedelta(days=1)).isoformat()},
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 1
+    row = data["results"][0]
+    assert row["student_email"] == clashing.email
+    assert len(row["clashes"]) == 1
+    clash = row["clashes"][0]
+    assert {clash["first"]["course_code"], clash["second"]["course_code"]} == {
+        first.code,
+        second.code,
+    }
+
+    client.force_authenticate(user=UserFactory(role=User.Role.HOD, department=None))
+    unassigned = client.get(
+        "/api/assessments/clash-report/",
+        {"start": start.isoformat(), "end": (start + timedelta(days=1)).isoformat()},
+    )
+    assert unassigned.status_code == 200
+    assert unassigned.json()["count"] == 0
+
+
+@pytest.mark.django_db
+def test_grading_queue_counts_and_pages_oldest_ungraded(django_assert_max_num_queries):
+    teacher = UserFactory(role=User.Role.TEACHER)
+    course = CourseFactory(assigned_teacher=teacher)
+    quiz = AssessmentFactory(course=course, status=Assessment.Status.COMPLETED)
+    essay = AssessmentFactory(course=course, status=Assessment.Status.COMPLETED)
+    AssessmentFactory(course=CourseFactory(), status=Assessment.Status.COMPLETED)
+    statuses = AssessmentSubmission.SubmissionStatus
+    submissions = []
+    for index, (assessment, submission_status) in enumerate(
+        [
+            (quiz, statuses.SUBMITTED),
+            (quiz, statuses.LATE),
+            (quiz, statuses.GRADED),
+            (essay, statuses.SUBMITTED),
+            (essay, statuses.SUBMITTED),
+        ]
+    ):
+        submission = AssessmentSubmission.objects.create(
+            assessment=assessment,
+            student=UserFactory(role=User.Role.STUDENT),
+            status=submission_status,
+        )
+        AssessmentSubmission.objects.filter(pk=submission.pk).update(
+            submitted_at=timezone.now() - timedelta(hours=10 - index)
+        )
+        submissions.append(submission)
+    client = APIClient()
+    client.force_authenticate(user=teacher)
+
+    with django_assert_max_num_queries(1):
+        summary = client.get("/api/assessments/grading-queue/").json()
+    counts = {row["id"]: (row["pending"], row["late"], row["graded"]) for row in summary}
+    assert counts == {str(quiz.id): (1, 1, 1), str(essay.id): (2, 0, 0)}
+
+    ungraded = [str(submission.id) for submission in submissions if submission.status != "GRADED"]
+    first = client.get("/api/assessments/grading-queue/submissions/?page_size=3").json()
+    second = client.get(first["next"]).json()
+    assert second["next"] is None
+    assert [item["id"] for item in first["results"] + second["results"]] == ungraded
@@ -0,0 +1,51 @@
+from collections import Counter
+from datetime import date, time, timedelta
+
+from apps.assessments.exam_scheduling import (
+    ExamNode,
+    ExamTimetabler,
+    build_slots,
+    co_enrollment_graph,
+)
+
+
+def test_co_enrollment_graph_counts_shared_students():
+    enrollments = [(1, "A"), (1, "B"), (2, "A"), (2, "B"), (2, "C"), (3, "C")]
+
+    sizes, graph = co_enrollment_graph(enrollments)
+
+    assert sizes == Counter({"A": 2, "B": 2, "C": 2})
+    assert graph["A"] == Counter({"B": 2, "C": 1})
+    assert "A" not in graph["A"]
+
+
+def test_timetabler_avoids_clashes_and_respects_capacity():
+    # A triangle of clashing exams plus one independent exam, over two days of two slots.
+    exams = [ExamNode(key, size, 120) for key, size in (("A", 30), ("B", 30), ("C", 30), ("D", 50))]
+    conflicts = {
+        0: Counter({1: 5, 2: 5}),
+        1: Counter({0: 5, 2: 5}),
+        2: Counter({0: 5, 1: 5}),
+    }
+    monday = date(2030, 1, 7)
+    slots = build_slots(monday, monday + timedelta(days=1), [time(9), time(14)], 180)
+
+    result = ExamTimetabler(exams, conflicts, slots, seat_capacity=60).solve()
+
+    assert not result.unscheduled
+    assigned = result.assignments
+    assert len({assigned["A"], assigned["B"], assigned["C"]}) == 3
+    assert all(
+        sum(exam.size for exam in exams if assigned[exam.key] == slot) <= 60 for slot in slots
+    )
+    # Two days cannot separate three mutually clashing exams, but only one pair shares a day.
+    assert result.same_day_pairs == 5
+
+
+def test_timetabler_reports_exams_that_cannot_fit():
+    exams = [ExamNode("A", 10, 240)]
+    slots = build_slots(date(2030, 1, 7), date(2030, 1, 7), [time(9)], 180)
+
+    result = ExamTimetabler(exams, {}, slots).solve()
+
+    assert list(result.unscheduled) == ["A"]
@@ -1,9 +1,10 @@
 from rest_framework.routers import DefaultRouter
 
-from .views import AssessmentSubmissionViewSet, AssessmentViewSet
+from .views import AssessmentSubmissionViewSet, AssessmentViewSet, GradingQueueViewSet
 
 router = DefaultRouter()
 router.register("submissions", AssessmentSubmissionViewSet, basename="assessment-submissions")
+router.register("grading-queue", GradingQueueViewSet, basename="grading-queue")
 router.register("", AssessmentViewSet, basename="assessments")
 
 urlpatterns = router.urls
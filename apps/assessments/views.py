@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Count, F, Q, QuerySet
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.settings import api_settings
 
+from apps.common.metrics import SUBMISSIONS_RECEIVED
+from apps.courses.visibility import visibility_for
 from apps.users.models import User
 from apps.users.permissions import IsAdmin, IsAdminHODOrTeacher, IsAdminOrHOD, IsAdminOrTeacher
+from .clash_report import student_clashes
+from .exam_scheduling import build_slots, schedule_exams
 from .models import Assessment, AssessmentSubmission
 from .serializers import (
     AssessmentApprovalSerializer,
@@ -21,6 +28,10 @@ from .serializers import (
     AssessmentScheduleSerializer,
     AssessmentSerializer,
     AssessmentSubmissionSerializer,
+    ClashReportQuerySerializer,
+    ExamAutoScheduleSerializer,
+    GradingQueueAssessmentSerializer,
+    GradingQueueSubmissionSerializer,
 )
 
 
@@ -38,30 +49,29 @@ class AssessmentViewSet(viewsets.ModelViewSet):
         user = self.request.user
         qs = self.queryset
         if user.role == User.Role.ADMIN:
-            return qs.distinct()
+            return qs
         if user.role == User.Role.HOD and user.department_id:
-            return qs.filter(course__department_id=user.department_id).distinct()
+            return qs.filter(course__department_id=user.department_id)
         if user.role == User.Role.TEACHER:
+            visible = visibility_for(user)
             return qs.filter(
-                models.Q(created_by=user) | models.Q(course__assigned_teacher=user)
-            ).distinct()
+                models.Q(created_by=user) | models.Q(course_id__in=visible.teaching_course_ids)
+            )
         if user.role == User.Role.STUDENT:
+            visible = visibility_for(user)
             visible_statuses = [
                 Assessment.Status.APPROVED,
                 Assessment.Status.SCHEDULED,
                 Assessment.Status.IN_PROGRESS,
                 Assessment.Status.COMPLETED,
             ]
-            department_filter = models.Q(status__in=visible_statuses)
-            if user.department_id:
-                department_filter &= models.Q(course__department_id=user.department_id)
+            qs = qs.filter(status__in=visible_statuses)
+            if not visible.department_id:
+                return qs
             return qs.filter(
-                models.Q(
-                    course__enrollments__student=user,
-                    status__in=visible_statuses,
-                )
-                | department_filter
-            ).distinct()
+                models.Q(course_id__in=visible.enrolled_course_ids)
+                | models.Q(course__department_id=visible.department_id)
+            )
         return qs.none()
 
     def get_serializer_class(self):
@@ -76,7 +86,7 @@ class AssessmentViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), IsAdminOrTeacher()]
         if self.action in {"destroy"}:
             return [IsAuthenticated(), IsAdminOrHOD()]
-        if self.action in {"approve", "schedule"}:
+        if self.action in {"approve", "schedule", "auto_schedule", "clash_report"}:
             return [IsAuthenticated(), IsAdminOrHOD()]
         if self.action == "submit_for_approval":
             return [IsAuthenticated(), IsAdminHODOrTeacher()]
@@ -114,6 +124,93 @@ class AssessmentViewSet(viewsets.ModelViewSet):
         serializer.save(assessment=assessment)
         return Response(AssessmentSerializer(assessment, context={"request": request}).data)
 
+    @action(detail=False, methods=["get"], url_path="clash-report")
+    def clash_report(self, request, *args, **kwargs):
+        """Students enrolled in assessments whose windows overlap, paginated by student."""
+        query = ClashReportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        department_id = params.get("department")
+        if request.user.role == User.Role.HOD:
+            department_id = request.user.department_id
+        if request.user.role == User.Role.HOD and department_id is None:
+            # An HOD without a department heads nothing; never the institution-wide report.
+            report = []
+        else:
+            report = student_clashes(
+                params["start"],
+                params["end"],
+                assessment_types=sorted(params["assessment_type"]),
+                department_id=department_id,
+            )
+        page = self.paginate_queryset(report)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(report)
+
+    @action(detail=False, methods=["post"], url_path="auto-schedule")
+    def auto_schedule(self, request, *args, **kwargs):
+        """Schedule approved exams into clash-free slots (see ``exam_scheduling``)."""
+        serializer = ExamAutoScheduleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        exams = self.get_queryset().filter(
+            assessment_type=Assessment.AssessmentType.EXAM, status=Assessment.Status.APPROVED
+        )
+        if params.get("assessments"):
+            exams = exams.filter(pk__in=[assessment.pk for assessment in params["assessments"]])
+        if params.get("department"):
+            exams = exams.filter(course__department_id=params["department"])
+        exams = list(exams.order_by("course__code"))
+        if not exams:
+            raise ValidationError("There are no approved exams to schedule.")
+        slots = build_slots(
+            params["start_date"],
+            params["end_date"],
+            params["slot_times"],
+            params["slot_minutes"],
+            include_weekends=params["include_weekends"],
+        )
+        if not slots:
+            raise ValidationError("The date range contains no exam slots.")
+        result = schedule_exams(
+            exams,
+            slots,
+            seat_capacity=params.get("seat_capacity"),
+            room_count=params.get("room_count"),
+            dry_run=params["dry_run"],
+        )
+        scheduled = sorted(
+            (
+                {
+                    "assessment": str(exam.pk),
+                    "title": exam.title,
+                    "course_code": exam.course.code,
+                    "scheduled_at": result.assignments[exam.pk].start,
+                    "closes_at": result.assignments[exam.pk].start
+                    + timedelta(minutes=exam.duration_minutes),
+                }
+                for exam in exams
+                if exam.pk in result.assignments
+            ),
+            key=lambda row: (row["scheduled_at"], row["course_code"]),
+        )
+        unscheduled = [
+            {"assessment": str(exam.pk), "title": exam.title, "reason": result.unscheduled[exam.pk]}
+            for exam in exams
+            if exam.pk in result.unscheduled
+        ]
+        return Response(
+            {
+                "dry_run": params["dry_run"],
+                "scheduled": scheduled,
+                "unscheduled": unscheduled,
+                "same_day_pairs": result.same_day_pairs,
+                "elapsed_ms": result.elapsed_ms,
+            },
+            status=status.HTTP_200_OK,
+        )
+
 
 class AssessmentSubmissionViewSet(viewsets.ModelViewSet):
     queryset = AssessmentSubmission.objects.select_related(
@@ -146,6 +243,7 @@ class AssessmentSubmissionViewSet(viewsets.ModelViewSet):
         if assessment.closes_at and now > assessment.closes_at:
             raise ValidationError("Submission window has closed for this assessment.")
         submission = serializer.save(student=user, created_by=user, updated_by=user)
+        SUBMISSIONS_RECEIVED.labels(assessment_type=assessment.assessment_type).inc()
         if assessment.submission_format == Assessment.SubmissionFormat.ONLINE:
             questions = assessment.questions or []
             answers = submission.answers or []
@@ -184,3 +282,52 @@ class AssessmentSubmissionViewSet(viewsets.ModelViewSet):
         return Response(
             AssessmentSubmissionSerializer(submission, context={"request": request}).data
         )
+
+
+class GradingQueuePagination(CursorPagination):
+    ordering = ("submitted_at", "id")
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class GradingQueueViewSet(viewsets.GenericViewSet):
+    """Ungraded work in the courses the caller teaches.
+
+    ``list`` returns pending/late/graded counts per assessment from one grouped query;
+    ``submissions`` is a keyset-paginated queue of the oldest ungraded submissions.
+    """
+
+    serializer_class = GradingQueueSubmissionSerializer
+    pagination_class = GradingQueuePagination
+    permission_classes = [IsAuthenticated, IsAdminHODOrTeacher]
+    filterset_fields = ("assessment", "status")
+
+    def get_queryset(self) -> QuerySet[AssessmentSubmission]:
+        return AssessmentSubmission.objects.filter(
+            assessment__course__assigned_teacher=self.request.user,
+            status__in=AssessmentSubmission.UNGRADED_STATUSES,
+        ).select_related("assessment", "assessment__course", "student")
+
+    def list(self, request, *args, **kwargs):
+        statuses = AssessmentSubmission.SubmissionStatus
+        assessments = (
+            Assessment.objects.filter(course__assigned_teacher=request.user)
+            .exclude(status__in=(Assessment.Status.DRAFT, Assessment.Status.CANCELLED))
+            .values("id", "title", "assessment_type", "status", "closes_at", "course_id")
+            .annotate(
+                course_code=F("course__code"),
+                course_title=F("course__title"),
+                pending=Count("submissions", filter=Q(submissions__status=statuses.SUBMITTED)),
+                late=Count("submissions", filter=Q(submissions__status=statuses.LATE)),
+                graded=Count("submissions", filter=Q(submissions__status=statuses.GRADED)),
+            )
+            .order_by("course_code", "closes_at", "title")
+        )
+        return Response(GradingQueueAssessmentSerializer(assessments, many=True).data)
+
+    @action(detail=False, methods=["get"])
+    def submissions(self, request, *args, **kwargs):
+        queue = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queue)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
@@ -5,3 +5,12 @@ class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.common"
     verbose_name = "Common Utilities"
+
+    def ready(self):
+        from .metrics import connect_task_metrics
+        from .profiling import install_serializer_timing
+        from .signals import connect_blob_signals
+
+        connect_blob_signals()
+        connect_task_metrics()
+        install_serializer_timing()
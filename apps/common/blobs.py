@@ -0,0 +1,101 @@
+"""Content-addressed blob storage.
+
+Uploads are hashed chunk by chunk and stored once per SHA-256 digest. Rows that use a
+blob hold a reference to it (see ``ContentAddressedFilesMixin``); blobs whose reference
+count drops to zero are deleted by ``collect_unreferenced_blobs``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import timedelta
+
+import structlog
+from django.db import IntegrityError, transaction
+from django.db.models import F, ProtectedError
+from django.utils import timezone
+
+from .models import ContentBlob, blob_upload_to
+
+logger = structlog.get_logger(__name__)
+
+
+def hash_file(file) -> tuple[str, int]:
+    """Return the hex SHA-256 digest and size of ``file``, reading it in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in file.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def ingest_file(file, filename: str) -> ContentBlob:
+    """Return the blob holding ``file``'s content, storing the bytes only if they are new."""
+    sha256, size = hash_file(file)
+    blob = ContentBlob.objects.filter(sha256=sha256).first()
+    if blob is not None:
+        # Touch the blob so a concurrent collection run skips it.
+        ContentBlob.objects.filter(pk=blob.pk).update(updated_at=timezone.now())
+        return blob
+    blob = ContentBlob(sha256=sha256, size=size)
+    storage = blob.file.storage
+    path = blob_upload_to(blob, filename)
+    if storage.exists(path):
+        # Left behind by a collected blob or a lost race; the bytes are identical.
+        blob.file.name = path
+    else:
+        blob.file.save(filename, file, save=False)
+    try:
+        with transaction.atomic():
+            blob.save()
+    except IntegrityError:
+        return ContentBlob.objects.get(sha256=sha256)
+    return blob
+
+
+def acquire_blob(blob_id) -> None:
+    ContentBlob.objects.filter(pk=blob_id).update(
+        ref_count=F("ref_count") + 1, updated_at=timezone.now()
+    )
+
+
+def release_blob(blob_id) -> None:
+    ContentBlob.objects.filter(pk=blob_id, ref_count__gt=0).update(
+        ref_count=F("ref_count") - 1, updated_at=timezone.now()
+    )
+
+
+def collect_unreferenced_blobs(grace_period: timedelta, batch_size: int = 500) -> int:
+    """Delete blobs unreferenced for longer than ``grace_period`` along with their files.
+
+    The grace period protects blobs that were just ingested but whose referencing row
+    has not been committed yet.
+    """
+    cutoff = timezone.now() - grace_period
+    candidates = list(
+        ContentBlob.objects.filter(ref_count=0, updated_at__lt=cutoff).values_list(
+            "pk", flat=True
+        )[:batch_size]
+    )
+    collected = 0
+    for pk in candidates:
+        with transaction.atomic():
+            blob = (
+                ContentBlob.objects.select_for_update()
+                .filter(pk=pk, ref_count=0, updated_at__lt=cutoff)
+                .first()
+            )
+            if blob is None:
+                continue
+            name = blob.file.name
+            storage = blob.file.storage
+            try:
+                blob.delete()
+            except ProtectedError:
+                logger.warning("blobs.reference_count_drift", blob=str(pk))
+                continue
+            transaction.on_commit(lambda name=name, storage=storage: storage.delete(name))
+        collected += 1
+    logger.info("blobs.collected", count=collected)
+    return collected
@@ -0,0 +1,72 @@
+"""Database helpers shared across apps."""
+
+from __future__ import annotations
+
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.db import migrations
+from django.db.models import Func
+
+
+def is_postgres(connection) -> bool:
+    return connection.vendor == "postgresql"
+
+
+class PostgresOnlySQL(migrations.RunSQL):
+    """``RunSQL`` that only runs on PostgreSQL.
+
+    Used for Postgres-specific DDL (GIN/GiST indexes, extensions, exclusion
+    constraints, materialized views) so the same migrations still apply on the SQLite
+    test database.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgres(schema_editor.connection):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgres(schema_editor.connection):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class NonPostgresSQL(migrations.RunSQL):
+    """``RunSQL`` for every backend except PostgreSQL, e.g. a plain-table fallback for a
+    materialized view created with ``PostgresOnlySQL``."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgres(schema_editor.connection):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not is_postgres(schema_editor.connection):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class PostgresOnlyAddConstraint(migrations.AddConstraint):
+    """``AddConstraint`` for Postgres-only constraint types such as ``ExclusionConstraint``.
+
+    The constraint is kept out of the migration state (and so out of model ``Meta``),
+    which lets other backends build the table; it exists only in the Postgres schema.
+    """
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgres(schema_editor.connection):
+            model = to_state.apps.get_model(app_label, self.model_name)
+            schema_editor.add_constraint(model, self.constraint)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if is_postgres(schema_editor.connection):
+            model = to_state.apps.get_model(app_label, self.model_name)
+            schema_editor.remove_constraint(model, self.constraint)
+
+    def describe(self):
+        return f"{super().describe()} (PostgreSQL only)"
+
+
+class TsTzRange(Func):
+    """``tstzrange(start, end[, bounds])``; half-open ``[)`` unless bounds are given."""
+
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
@@ -0,0 +1,47 @@
+"""In-memory interval overlap detection."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import count
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def overlapping_pairs(
+    items: Iterable[T],
+    start: Callable[[T], Any],
+    end: Callable[[T], Any],
+) -> Iterator[tuple[T, T]]:
+    """Yield every pair of ``items`` whose half-open ``[start, end)`` intervals overlap.
+
+    Sort-and-sweep: items are visited by start time while a heap keeps the ones still
+    open, so the cost is O(n log n) plus the number of overlapping pairs. In each pair the
+    first item starts no later than the second.
+    """
+    tiebreak = count()
+    active: list[tuple[Any, int, T]] = []
+    for item in sorted(items, key=start):
+        item_start = start(item)
+        while active and active[0][0] <= item_start:
+            heapq.heappop(active)
+        for _, _, other in active:
+            yield other, item
+        heapq.heappush(active, (end(item), next(tiebreak), item))
+
+
+def overlapping_pairs_by(
+    items: Iterable[T],
+    key: Callable[[T], Hashable],
+    start: Callable[[T], Any],
+    end: Callable[[T], Any],
+) -> Iterator[tuple[T, T]]:
+    """``overlapping_pairs`` restricted to items sharing the same ``key`` (teacher, room, ...)."""
+    groups: dict[Hashable, list[T]] = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+    for group in groups.values():
+        if len(group) > 1:
+            yield from overlapping_pairs(group, start, end)
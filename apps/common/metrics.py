@@ -0,0 +1,167 @@
+"""Prometheus metrics for the API, database, cache, Celery and domain hot paths.
+
+Metrics are module-level ``prometheus_client`` objects. Under gunicorn (or a prefork
+Celery worker) set ``PROMETHEUS_MULTIPROC_DIR`` so every process writes its samples to
+that directory; ``scrape_registry`` then aggregates them for ``/metrics`` (or, in a
+worker, for ``METRICS_WORKER_PORT``). The directory is emptied when gunicorn or the
+worker starts (``config.prometheus``); web and worker need separate directories.
+
+Celery queue depth is not recorded by any process: ``CeleryQueueCollector`` asks the
+broker at scrape time.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import structlog
+from celery.signals import task_postrun, task_prerun, worker_ready
+from django.conf import settings
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from config.prometheus import ensure_multiproc_dir, multiproc_dir
+
+logger = structlog.get_logger(__name__)
+
+# Management commands (migrate, shell) load this module outside gunicorn, before any
+# server hook has created the directory.
+ensure_multiproc_dir()
+
+REQUEST_LATENCY = Histogram(
+    "sentraexam_http_request_duration_seconds",
+    "API request latency by view (URL name) and DRF action.",
+    ("method", "view", "action", "status"),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUEST_QUERIES = Histogram(
+    "sentraexam_http_request_db_queries",
+    "Database queries run per API request.",
+    ("view", "action"),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200),
+)
+CACHE_LOOKUPS = Counter(
+    "sentraexam_cache_lookups_total",
+    "Lookups in the application caches, by cache and hit/miss.",
+    ("cache", "result"),
+)
+TASK_DURATION = Histogram(
+    "sentraexam_celery_task_duration_seconds",
+    "Celery task run time by task and final state.",
+    ("task", "state"),
+    buckets=(0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0),
+)
+SUBMISSIONS_RECEIVED = Counter(
+    "sentraexam_assessment_submissions_total",
+    "Assessment submissions received, by assessment type.",
+    ("assessment_type",),
+)
+NOTIFICATIONS_FANNED_OUT = Counter(
+    "sentraexam_notifications_fanned_out_total",
+    "Notifications created for announcement recipients.",
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+class QueryCounter:
+    """``execute_wrapper`` that counts the queries run inside it."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+
+class CeleryQueueCollector:
+    """Reports the number of messages waiting in each ``METRICS_CELERY_QUEUES`` queue."""
+
+    def collect(self):
+        from config.celery import app
+
+        depth = GaugeMetricFamily(
+            "sentraexam_celery_queue_length",
+            "Messages waiting in the Celery broker queue.",
+            labels=("queue",),
+        )
+        queues = settings.METRICS_CELERY_QUEUES
+        if queues:
+            try:
+                with app.connection_for_read() as connection:
+                    connection.ensure_connection(max_retries=1)
+                    channel = connection.default_channel
+                    for queue in queues:
+                        try:
+                            declared = channel.queue_declare(queue=queue, passive=True)
+                        except connection.channel_errors:
+                            # Redis drops the list key of an empty queue.
+                            depth.add_metric((queue,), 0)
+                        else:
+                            depth.add_metric((queue,), declared.message_count)
+            except Exception:  # noqa: BLE001 - a broker outage must not break the scrape
+                logger.warning("metrics.queue_depth_failed", exc_info=True)
+        yield depth
+
+
+def scrape_registry() -> CollectorRegistry:
+    """This process's registry, or one aggregating every process in multiprocess mode."""
+    if not multiproc_dir():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+QUEUE_REGISTRY = CollectorRegistry()
+QUEUE_REGISTRY.register(CeleryQueueCollector())
+
+
+def render_metrics() -> bytes:
+    """The text exposition served on ``/metrics``."""
+    return generate_latest(scrape_registry()) + generate_latest(QUEUE_REGISTRY)
+
+
+_task_started: dict[str, float] = {}
+
+
+def task_started(task_id=None, **kwargs):
+    _task_started[task_id] = perf_counter()
+
+
+def task_finished(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None and task is not None:
+        TASK_DURATION.labels(task=task.name, state=state or "UNKNOWN").observe(
+            perf_counter() - started
+        )
+
+
+def start_worker_metrics_server(**kwargs):
+    """Serve the worker's task metrics on ``METRICS_WORKER_PORT`` (0 disables it)."""
+    if not settings.METRICS_WORKER_PORT:
+        return
+    if not multiproc_dir():
+        # Tasks run in the pool processes; without a shared directory the main process
+        # that serves the port has no task samples.
+        logger.warning("metrics.worker_without_multiproc_dir")
+    start_http_server(settings.METRICS_WORKER_PORT, registry=scrape_registry())
+
+
+def connect_task_metrics() -> None:
+    task_prerun.connect(task_started, weak=False, dispatch_uid="metrics_task_started")
+    task_postrun.connect(task_finished, weak=False, dispatch_uid="metrics_task_finished")
+    worker_ready.connect(
+        start_worker_metrics_server, weak=False, dispatch_uid="metrics_worker_server"
+    )
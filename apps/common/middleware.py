@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import random
+from contextlib import ExitStack
+from time import perf_counter
+
+import structlog
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .metrics import REQUEST_LATENCY, REQUEST_QUERIES, QueryCounter
+from .profiling import (
+    QueryTimer,
+    RequestProfile,
+    activate_profile,
+    deactivate_profile,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+def server_timing(total: float, profile: RequestProfile) -> str:
+    return ", ".join(
+        (
+            f"app;dur={_ms(total)}",
+            f'db;dur={_ms(profile.db_seconds)};desc="{profile.queries} queries"',
+            f"serialize;dur={_ms(profile.serializer_seconds)}",
+        )
+    )
+
+
+def view_labels(request) -> tuple[str, str]:
+    """The URL name and (for viewsets) the DRF action that handled ``request``."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched", ""
+    actions = getattr(match.func, "actions", None) or {}
+    return match.view_name or match._func_path, actions.get(request.method.lower(), "")
+
+
+class MetricsMiddleware:
+    """Record every request's latency and query count for Prometheus (see ``metrics``)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        started = perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+        duration = perf_counter() - started
+
+        view, action = view_labels(request)
+        REQUEST_LATENCY.labels(
+            method=request.method, view=view, action=action, status=response.status_code
+        ).observe(duration)
+        REQUEST_QUERIES.labels(view=view, action=action).observe(counter.queries)
+        return response
+
+
+class RequestProfilingMiddleware:
+    """Measure wall time, database queries/time and serializer time per request.
+
+    Every request logs a ``db.slow_query`` line for each query slower than
+    ``REQUEST_PROFILING_SLOW_QUERY_MS``. A ``REQUEST_PROFILING_SAMPLE_RATE`` fraction of
+    requests is also fully profiled; those get a ``Server-Timing`` header and an
+    ``http.request_profiled`` log line.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.REQUEST_PROFILING_SAMPLE_RATE
+
+    def __call__(self, request):
+        sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        profile = RequestProfile()
+        # Unsampled requests only time their queries; serializer timing reads the
+        # active profile, so it stays off for them.
+        token = activate_profile(profile) if sampled else None
+        started = perf_counter()
+        try:
+            with ExitStack() as stack:
+                timer = QueryTimer(profile)
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timer))
+                response = self.get_response(request)
+        finally:
+            if token is not None:
+                deactivate_profile(token)
+        total = perf_counter() - started
+
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match else None
+        for query in profile.slow_queries:
+            logger.warning(
+                "db.slow_query",
+                route=route,
+                duration_ms=_ms(query.duration),
+                sql=query.sql[:2000],
+            )
+        if not sampled:
+            return response
+
+        response["Server-Timing"] = server_timing(total, profile)
+        logger.info(
+            "http.request_profiled",
+            method=request.method,
+            path=request.path,
+            route=route,
+            status=response.status_code,
+            duration_ms=_ms(total),
+            db_queries=profile.queries,
+            db_ms=_ms(profile.db_seconds),
+            serializer_ms=_ms(profile.serializer_seconds),
+        )
+        return response
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from pathlib import Path
 from typing import Any
 
 from django.contrib.auth import get_user_model
@@ -61,3 +62,129 @@ class OwnedModel(BaseModel):
         if not self.created_by:
             self.created_by = user
         self.updated_by = user
+
+
+def blob_upload_to(instance: "ContentBlob", filename: str) -> str:
+    extension = Path(filename).suffix.lower()
+    digest = instance.sha256
+    return f"blobs/{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
+
+class ContentBlob(BaseModel):
+    """A stored file addressed by the SHA-256 of its content.
+
+    Identical uploads share one blob; ``ref_count`` tracks how many rows point at it so
+    unreferenced blobs can be garbage collected.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to=blob_upload_to, max_length=255)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=("updated_at",),
+                condition=models.Q(ref_count=0),
+                name="contentblob_unreferenced_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.sha256
+
+
+class ContentAddressedFilesMixin:
+    """Model mixin that stores new uploads in ``FileField``s as shared ``ContentBlob``s.
+
+    ``blob_fields`` maps each file field to the foreign key holding its blob. The file
+    field keeps pointing at the blob's storage path, so URLs and downloads are
+    unchanged.
+    """
+
+    blob_fields: dict[str, str] = {}
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_blob_ids = instance._current_blob_ids()
+        return instance
+
+    def has_new_blob(self, blob_field: str) -> bool:
+        """Whether ``blob_field`` changed in the save in progress (valid in post_save)."""
+        stored = getattr(self, "_stored_blob_ids", {})
+        return stored.get(blob_field) != self.__dict__.get(f"{blob_field}_id")
+
+    def _current_blob_ids(self) -> dict[str, Any]:
+        return {
+            blob_field: self.__dict__.get(f"{blob_field}_id")
+            for blob_field in self.blob_fields.values()
+        }
+
+    def save(self, *args, **kwargs):
+        from django.db import transaction
+
+        from .blobs import acquire_blob, ingest_file, release_blob
+
+        update_fields = kwargs.get("update_fields")
+        for file_field, blob_field in self.blob_fields.items():
+            field_file = getattr(self, file_field)
+            if not field_file:
+                setattr(self, blob_field, None)
+            elif not field_file._committed:
+                blob = ingest_file(field_file.file, field_file.name)
+                field_file.name = blob.file.name
+                field_file._committed = True
+                setattr(self, blob_field, blob)
+            if update_fields is not None and file_field in update_fields:
+                kwargs["update_fields"] = update_fields = {*update_fields, blob_field}
+
+        stored = getattr(self, "_stored_blob_ids", {})
+        current = self._current_blob_ids()
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            for blob_field, blob_id in current.items():
+                previous = stored.get(blob_field)
+                if blob_id == previous:
+                    continue
+                if blob_id:
+                    acquire_blob(blob_id)
+                if previous:
+                    release_blob(previous)
+        self._stored_blob_ids = current
+
+
+class UploadSlot(BaseModel):
+    """A pending direct-to-object-storage upload.
+
+    The client PUTs the file to a presigned URL for ``key`` (a staging key of its own),
+    confirms it, and then references the slot when creating a document or submission
+    instead of sending the file through the API.
+    """
+
+    class Purpose(models.TextChoices):
+        DOCUMENT = "DOCUMENT", "Document"
+        SUBMISSION = "SUBMISSION", "Assessment submission"
+
+    user = models.ForeignKey(
+        get_user_model(), on_delete=models.CASCADE, related_name="upload_slots"
+    )
+    purpose = models.CharField(max_length=20, choices=Purpose.choices)
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    sha256 = models.CharField(max_length=64)
+    key = models.CharField(max_length=255)
+    expires_at = models.DateTimeField()
+    blob = models.ForeignKey(
+        ContentBlob, on_delete=models.CASCADE, related_name="upload_slots", null=True, blank=True
+    )
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [models.Index(fields=("expires_at",))]
+
+    @property
+    def is_confirmed(self) -> bool:
+        return self.blob_id is not None
@@ -0,0 +1,125 @@
+"""S3-compatible object storage access for direct (presigned) uploads and downloads.
+
+Works against AWS S3, MinIO (set ``OBJECT_STORAGE_ENDPOINT_URL``) or moto in tests.
+Uploads are signed with the declared SHA-256 checksum, so the storage service itself
+rejects bodies that do not match the digest the slot was issued for.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.http import content_disposition_header
+
+
+def is_enabled() -> bool:
+    return bool(settings.OBJECT_STORAGE_BUCKET)
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    if not is_enabled():
+        raise ImproperlyConfigured("OBJECT_STORAGE_BUCKET is not configured.")
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.OBJECT_STORAGE_ENDPOINT_URL or None,
+        region_name=settings.OBJECT_STORAGE_REGION or None,
+        aws_access_key_id=settings.OBJECT_STORAGE_ACCESS_KEY_ID or None,
+        aws_secret_access_key=settings.OBJECT_STORAGE_SECRET_ACCESS_KEY or None,
+        config=Config(signature_version="s3v4", s3={"addressing_style": "path"}),
+    )
+
+
+def sha256_base64(hex_digest: str) -> str:
+    return base64.b64encode(bytes.fromhex(hex_digest)).decode()
+
+
+def presign_put(key: str, content_type: str, size: int, sha256: str) -> dict:
+    """Return the URL and headers the client must use to PUT the object."""
+    checksum = sha256_base64(sha256)
+    url = get_client().generate_presigned_url(
+        "put_object",
+        Params={
+            "Bucket": settings.OBJECT_STORAGE_BUCKET,
+            "Key": key,
+            "ContentType": content_type,
+            "ContentLength": size,
+            "ChecksumSHA256": checksum,
+        },
+        ExpiresIn=settings.PRESIGNED_UPLOAD_EXPIRY_SECONDS,
+        HttpMethod="PUT",
+    )
+    return {
+        "url": url,
+        "method": "PUT",
+        "headers": {
+            "Content-Type": content_type,
+            "Content-Length": str(size),
+            "x-amz-checksum-sha256": checksum,
+        },
+    }
+
+
+def presign_get(key: str, filename: str, content_type: str) -> str:
+    """Return a short-lived URL that downloads the object as ``filename``."""
+    return get_client().generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": settings.OBJECT_STORAGE_BUCKET,
+            "Key": key,
+            "ResponseContentType": content_type,
+            "ResponseContentDisposition": content_disposition_header(True, filename),
+        },
+        ExpiresIn=settings.PRESIGNED_DOWNLOAD_EXPIRY_SECONDS,
+    )
+
+
+def _stream_sha256(key: str) -> str:
+    body = get_client().get_object(Bucket=settings.OBJECT_STORAGE_BUCKET, Key=key)["Body"]
+    digest = hashlib.sha256()
+    for chunk in body.iter_chunks(chunk_size=1024 * 1024):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def head(key: str) -> dict | None:
+    """Return ``{"size", "sha256"}`` for an uploaded object, or ``None`` if it is missing.
+
+    Backends that do not keep the upload checksum have the object hashed by streaming it.
+    """
+    from botocore.exceptions import ClientError
+
+    try:
+        response = get_client().head_object(
+            Bucket=settings.OBJECT_STORAGE_BUCKET, Key=key, ChecksumMode="ENABLED"
+        )
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+            return None
+        raise
+    checksum = response.get("ChecksumSHA256")
+    return {
+        "size": response["ContentLength"],
+        "sha256": base64.b64decode(checksum).hex() if checksum else _stream_sha256(key),
+    }
+
+
+def delete(key: str) -> None:
+    get_client().delete_object(Bucket=settings.OBJECT_STORAGE_BUCKET, Key=key)
+
+
+def copy(source: str, destination: str) -> None:
+    bucket = settings.OBJECT_STORAGE_BUCKET
+    get_client().copy_object(
+        Bucket=bucket,
+        Key=destination,
+        CopySource={"Bucket": bucket, "Key": source},
+        ChecksumAlgorithm="SHA256",
+    )
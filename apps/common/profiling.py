@@ -0,0 +1,90 @@
+"""Per-request cost accounting used by ``RequestProfilingMiddleware``.
+
+Database time is collected with ``connection.execute_wrapper`` (``QueryTimer``) on every
+request, so slow queries are always logged. For a sampled request the middleware also
+puts the ``RequestProfile`` in a context variable, and serializer time is collected by
+timing ``BaseSerializer.data``, which ``install_serializer_timing`` wraps once at
+startup. Outside a sampled request that is a context variable lookup.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from django.conf import settings
+from rest_framework.serializers import BaseSerializer
+
+
+@dataclass
+class SlowQuery:
+    sql: str
+    duration: float
+
+
+@dataclass
+class RequestProfile:
+    queries: int = 0
+    db_seconds: float = 0.0
+    serializer_seconds: float = 0.0
+    slow_queries: list[SlowQuery] = field(default_factory=list)
+    # Nested ``.data`` calls are already inside the outer serializer's time.
+    serializer_depth: int = 0
+
+
+_current: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+
+def current_profile() -> RequestProfile | None:
+    return _current.get()
+
+
+def activate_profile(profile: RequestProfile):
+    return _current.set(profile)
+
+
+def deactivate_profile(token) -> None:
+    _current.reset(token)
+
+
+class QueryTimer:
+    """``execute_wrapper`` that adds each query's count and duration to a profile."""
+
+    def __init__(self, profile: RequestProfile):
+        self.profile = profile
+        self.slow_threshold = settings.REQUEST_PROFILING_SLOW_QUERY_MS / 1000
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = perf_counter() - started
+            self.profile.queries += 1
+            self.profile.db_seconds += duration
+            if duration >= self.slow_threshold:
+                self.profile.slow_queries.append(SlowQuery(sql=sql, duration=duration))
+
+
+def install_serializer_timing() -> None:
+    """Wrap ``BaseSerializer.data`` so sampled requests record serialization time."""
+    data = BaseSerializer.data
+    if getattr(data.fget, "profiled", False):
+        return
+
+    def timed_data(serializer):
+        profile = _current.get()
+        if profile is None:
+            return data.fget(serializer)
+        profile.serializer_depth += 1
+        started = perf_counter()
+        try:
+            return data.fget(serializer)
+        finally:
+            profile.serializer_depth -= 1
+            if not profile.serializer_depth:
+                profile.serializer_seconds += perf_counter() - started
+
+    timed_data.profiled = True
+    BaseSerializer.data = property(timed_data, doc=data.__doc__)
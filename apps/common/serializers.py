@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import re
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import UploadSlot
+
+SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class UploadSlotSerializer(serializers.ModelSerializer):
+    upload_required = serializers.SerializerMethodField()
+    upload = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadSlot
+        fields = (
+            "id",
+            "purpose",
+            "filename",
+            "content_type",
+            "size",
+            "sha256",
+            "expires_at",
+            "is_confirmed",
+            "upload_required",
+            "upload",
+            "created_at",
+        )
+        read_only_fields = ("expires_at", "is_confirmed", "created_at")
+        extra_kwargs = {"size": {"min_value": 1}}
+
+    def validate_sha256(self, value: str) -> str:
+        value = value.lower()
+        if not SHA256_PATTERN.match(value):
+            raise serializers.ValidationError("Expected a hex-encoded SHA-256 digest.")
+        return value
+
+    def validate_size(self, value: int) -> int:
+        if value > settings.PRESIGNED_UPLOAD_MAX_BYTES:
+            raise serializers.ValidationError(
+                f"Files larger than {settings.PRESIGNED_UPLOAD_MAX_BYTES} bytes are not accepted."
+            )
+        return value
+
+    def get_upload_required(self, obj: UploadSlot) -> bool:
+        return not obj.is_confirmed
+
+    def get_upload(self, obj: UploadSlot) -> dict | None:
+        """Presigned PUT for the client; only issued while the slot still needs a file."""
+        from . import object_storage
+
+        if obj.is_confirmed or obj.expires_at <= timezone.now():
+            return None
+        return object_storage.presign_put(obj.key, obj.content_type, obj.size, obj.sha256)
+
+
+class UploadSlotField(serializers.PrimaryKeyRelatedField):
+    """Write-only reference to a confirmed upload slot of the requesting user."""
+
+    def __init__(self, purpose: str, **kwargs):
+        self.purpose = purpose
+        kwargs.setdefault("write_only", True)
+        kwargs.setdefault("required", False)
+        super().__init__(**kwargs)
+
+    def get_queryset(self):
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return UploadSlot.objects.none()
+        return UploadSlot.objects.select_related("blob").filter(
+            user=user, purpose=self.purpose, blob__isnull=False
+        )
+
+
+class DirectUploadSerializerMixin:
+    """Lets a serializer take its file from a confirmed ``UploadSlot``.
+
+    ``upload_fields`` maps the slot field to the ``(file field, blob field)`` it fills.
+    The slot is consumed when the instance is saved.
+    """
+
+    upload_fields: dict[str, tuple[str, str]] = {}
+
+    def to_internal_value(self, data):
+        attrs = super().to_internal_value(data)
+        self._upload_slots = []
+        for slot_field, (file_field, blob_field) in self.upload_fields.items():
+            slot = attrs.pop(slot_field, None)
+            if slot is None:
+                continue
+            if attrs.get(file_field):
+                raise serializers.ValidationError(
+                    {slot_field: f"Provide either '{file_field}' or '{slot_field}', not both."}
+                )
+            attrs[file_field] = slot.blob.file.name
+            attrs[blob_field] = slot.blob
+            self._upload_slots.append(slot)
+        return attrs
+
+    def create(self, validated_data):
+        instance = super().create(validated_data)
+        self._consume_upload_slots()
+        return instance
+
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        self._consume_upload_slots()
+        return instance
+
+    def _consume_upload_slots(self) -> None:
+        for slot in getattr(self, "_upload_slots", []):
+            slot.delete()
+        self._upload_slots = []
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from django.apps import apps
+from django.db.models.signals import post_delete
+
+from .blobs import release_blob
+from .models import ContentAddressedFilesMixin
+
+
+def release_blobs_on_delete(sender, instance, **kwargs):
+    for blob_field in sender.blob_fields.values():
+        blob_id = getattr(instance, f"{blob_field}_id", None)
+        if blob_id:
+            release_blob(blob_id)
+
+
+def connect_blob_signals() -> None:
+    for model in apps.get_models():
+        if issubclass(model, ContentAddressedFilesMixin):
+            post_delete.connect(
+                release_blobs_on_delete,
+                sender=model,
+                dispatch_uid=f"release_blobs_{model._meta.label_lower}",
+            )
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+
+from .blobs import collect_unreferenced_blobs
+from .uploads import purge_expired_upload_slots
+
+
+@shared_task
+def collect_blobs() -> int:
+    """Delete content blobs that no row has referenced for the grace period."""
+    return collect_unreferenced_blobs(timedelta(hours=settings.BLOB_GC_GRACE_HOURS))
+
+
+@shared_task
+def purge_upload_slots() -> int:
+    """Delete unused upload slots once they are past their retention window."""
+    return purge_expired_upload_slots()
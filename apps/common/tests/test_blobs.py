@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from apps.common.blobs import collect_unreferenced_blobs
+from apps.common.models import ContentBlob
+from tests.factories import DocumentFactory
+
+
+@pytest.mark.django_db
+def test_identical_uploads_share_one_blob():
+    first = DocumentFactory(file=SimpleUploadedFile("a.pdf", b"%PDF same bytes"))
+    second = DocumentFactory(file=SimpleUploadedFile("b.pdf", b"%PDF same bytes"))
+    other = DocumentFactory(file=SimpleUploadedFile("c.pdf", b"%PDF other bytes"))
+
+    assert first.blob_id == second.blob_id != other.blob_id
+    assert first.file.name == second.file.name == first.blob.file.name
+    blob = ContentBlob.objects.get(pk=first.blob_id)
+    assert blob.ref_count == 2
+    assert blob.size == len(b"%PDF same bytes")
+
+
+@pytest.mark.django_db
+def test_unreferenced_blobs_are_collected(django_capture_on_commit_callbacks):
+    document = DocumentFactory(file=SimpleUploadedFile("a.pdf", b"%PDF collect me"))
+    blob = document.blob
+    storage = blob.file.storage
+    document.delete()
+
+    blob.refresh_from_db()
+    assert blob.ref_count == 0
+    assert collect_unreferenced_blobs(grace_period=timedelta(hours=1)) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert collect_unreferenced_blobs(grace_period=timedelta(0)) == 1
+    assert not ContentBlob.objects.filter(pk=blob.pk).exists()
+    assert not storage.exists(blob.file.name)
@@ -0,0 +1,55 @@
+import pytest
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from apps.departments.tasks import reconcile_department_counts
+from apps.users.models import User
+from tests.factories import UserFactory
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+def test_requests_and_tasks_are_exported_on_metrics(settings):
+    settings.METRICS_TOKEN = "scrape-secret"
+    labels = {"view": "api:courses-list", "action": "list"}
+    requests_before = sample(
+        "sentraexam_http_request_duration_seconds_count", method="GET", status="200", **labels
+    )
+    queries_before = sample("sentraexam_http_request_db_queries_sum", **labels)
+    task = "apps.departments.tasks.reconcile_department_counts"
+    tasks_before = sample(
+        "sentraexam_celery_task_duration_seconds_count", task=task, state="SUCCESS"
+    )
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(role=User.Role.ADMIN))
+
+    assert client.get("/api/courses/").status_code == 200
+    reconcile_department_counts.delay()
+
+    assert (
+        sample(
+            "sentraexam_http_request_duration_seconds_count",
+            method="GET",
+            status="200",
+            **labels,
+        )
+        == requests_before + 1
+    )
+    assert sample("sentraexam_http_request_db_queries_sum", **labels) > queries_before
+    assert (
+        sample("sentraexam_celery_task_duration_seconds_count", task=task, state="SUCCESS")
+        == tasks_before + 1
+    )
+
+    assert client.get("/metrics").status_code == 401
+    settings.METRICS_TOKEN = ""
+    assert client.get("/metrics").status_code == 403
+    settings.METRICS_TOKEN = "scrape-secret"
+    response = client.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-secret")
+    assert response.status_code == 200
+    body = response.content.decode()
+    assert 'view="api:courses-list"' in body
+    assert "sentraexam_celery_queue_length" in body
@@ -0,0 +1,60 @@
+import pytest
+from rest_framework.test import APIClient
+from structlog.testing import CapturingLogger
+
+from apps.common import middleware
+from apps.users.models import User
+from tests.factories import CourseFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_profiled_request_reports_server_timing_and_logs(monkeypatch, settings):
+    settings.REQUEST_PROFILING_SLOW_QUERY_MS = 0
+    log = CapturingLogger()
+    monkeypatch.setattr(middleware, "logger", log)
+    admin = UserFactory(role=User.Role.ADMIN)
+    CourseFactory.create_batch(2)
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    response = client.get("/api/courses/")
+
+    assert response.status_code == 200
+    timing = dict(
+        part.split(";", 1) for part in response["Server-Timing"].replace(" ", "").split(",")
+    )
+    assert set(timing) == {"app", "db", "serialize"}
+    profiled = [call for call in log.calls if call.args == ("http.request_profiled",)]
+    assert len(profiled) == 1
+    fields = profiled[0].kwargs
+    assert fields["status"] == 200
+    assert fields["db_queries"] >= 2
+    assert fields["serializer_ms"] > 0
+    assert f'desc="{fields["db_queries"]}queries"' in timing["db"]
+    slow = [call for call in log.calls if call.args == ("db.slow_query",)]
+    assert len(slow) == fields["db_queries"]
+
+
+def test_profiling_is_skipped_for_unsampled_requests(monkeypatch, settings, rf):
+    settings.REQUEST_PROFILING_SAMPLE_RATE = 0.5
+    monkeypatch.setattr(middleware.random, "random", lambda: 0.9)
+    profiler = middleware.RequestProfilingMiddleware(lambda request: {})
+    assert profiler(rf.get("/")) == {}
+
+
+@pytest.mark.django_db
+def test_slow_queries_are_logged_for_unsampled_requests(monkeypatch, settings):
+    settings.REQUEST_PROFILING_SAMPLE_RATE = 0.0
+    settings.REQUEST_PROFILING_SLOW_QUERY_MS = 0
+    log = CapturingLogger()
+    monkeypatch.setattr(middleware, "logger", log)
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(role=User.Role.ADMIN))
+
+    response = client.get("/api/courses/")
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response
+    assert [call.args for call in log.calls if call.args != ("db.slow_query",)] == []
+    slow = [call for call in log.calls if call.args == ("db.slow_query",)]
+    assert slow and slow[0].kwargs["route"] == "api/courses/$"
@@ -0,0 +1,168 @@
+import base64
+import hashlib
+
+import boto3
+import pytest
+from django.core.files.storage import FileSystemStorage
+from moto import mock_aws
+from rest_framework.test import APIClient
+
+from apps.common import object_storage
+from apps.common.models import ContentBlob, UploadSlot
+from apps.documents.models import Document
+from apps.users.models import User
+from tests.factories import UserFactory
+
+BUCKET = "sentraexam-test"
+CONTENT = b"%PDF-1.4 uploaded straight to the bucket"
+
+
+@pytest.fixture
+def bucket(settings):
+    settings.OBJECT_STORAGE_BUCKET = BUCKET
+    settings.OBJECT_STORAGE_REGION = "us-east-1"
+    settings.OBJECT_STORAGE_ACCESS_KEY_ID = "testing"
+    settings.OBJECT_STORAGE_SECRET_ACCESS_KEY = "testing"
+    object_storage.get_client.cache_clear()
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        yield object_storage.get_client()
+    object_storage.get_client.cache_clear()
+
+
+def _request_slot(client, content=CONTENT):
+    return client.post(
+        "/api/uploads/",
+        {
+            "purpose": UploadSlot.Purpose.DOCUMENT,
+            "filename": "Lecture Notes.pdf",
+            "content_type": "application/pdf",
+            "size": len(content),
+            "sha256": hashlib.sha256(content).hexdigest(),
+        },
+        format="json",
+    )
+
+
+def _put(s3, slot, content):
+    # Stands in for the browser PUT to the presigned URL.
+    s3.put_object(
+        Bucket=BUCKET,
+        Key=UploadSlot.objects.get(pk=slot["id"]).key,
+        Body=content,
+        ContentType="application/pdf",
+        ChecksumSHA256=base64.b64encode(hashlib.sha256(content).digest()).decode(),
+    )
+
+
+@pytest.mark.django_db
+def test_presigned_upload_creates_document(bucket):
+    teacher = UserFactory(role=User.Role.TEACHER)
+    client = APIClient()
+    client.force_authenticate(teacher)
+
+    response = _request_slot(client)
+    assert response.status_code == 201
+    slot = response.json()
+    assert slot["upload_required"] is True
+    assert slot["upload"]["method"] == "PUT"
+    assert BUCKET in slot["upload"]["url"]
+
+    assert client.post(f"/api/uploads/{slot['id']}/confirm/").status_code == 400
+    _put(bucket, slot, CONTENT)
+    response = client.post(f"/api/uploads/{slot['id']}/confirm/")
+    assert response.status_code == 200
+    assert response.json()["is_confirmed"] is True
+
+    response = client.post(
+        "/api/documents/",
+        {"title": "Lecture notes", "upload": slot["id"], "access_level": "INSTITUTION"},
+        format="json",
+    )
+    assert response.status_code == 201, response.json()
+    document = Document.objects.get(pk=response.json()["id"])
+    blob = ContentBlob.objects.get(sha256=hashlib.sha256(CONTENT).hexdigest())
+    assert document.blob_id == blob.pk
+    assert document.file.name == blob.file.name
+    blob.refresh_from_db()
+    assert blob.ref_count == 1
+    assert not UploadSlot.objects.filter(pk=slot["id"]).exists()
+
+
+@pytest.mark.django_db
+def test_offloaded_download_from_object_storage_redirects(bucket, settings, monkeypatch):
+    settings.DOCUMENT_DOWNLOAD_OFFLOAD = "apache"
+    teacher = UserFactory(role=User.Role.TEACHER)
+    client = APIClient()
+    client.force_authenticate(teacher)
+    slot = _request_slot(client).json()
+    _put(bucket, slot, CONTENT)
+    client.post(f"/api/uploads/{slot['id']}/confirm/")
+    document_id = client.post(
+        "/api/documents/",
+        {"title": "Lecture notes", "upload": slot["id"], "access_level": "INSTITUTION"},
+        format="json",
+    ).json()["id"]
+
+    # Like S3Storage, which has no local path for X-Sendfile.
+    def no_path(storage, name):
+        raise NotImplementedError
+
+    monkeypatch.setattr(FileSystemStorage, "path", no_path)
+    response = client.get(f"/api/documents/{document_id}/download/")
+
+    assert response.status_code == 302
+    assert "X-Sendfile" not in response
+    url = response["Location"]
+    assert Document.objects.get(pk=document_id).file.name in url
+    assert "response-content-disposition" in url
+
+
+@pytest.mark.django_db
+def test_confirm_rejects_mismatched_upload(bucket):
+    client = APIClient()
+    client.force_authenticate(UserFactory(role=User.Role.TEACHER))
+
+    slot = _request_slot(client).json()
+    _put(bucket, slot, b"%PDF-1.4 something else")
+
+    response = client.post(f"/api/uploads/{slot['id']}/confirm/")
+    assert response.status_code == 400
+    assert not ContentBlob.objects.exists()
+    assert bucket.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 0
+
+
+@pytest.mark.django_db
+def test_uploads_unavailable_without_bucket():
+    client = APIClient()
+    client.force_authenticate(UserFactory(role=User.Role.TEACHER))
+
+    assert _request_slot(client).status_code == 503
+
+
+@pytest.mark.django_db
+def test_known_digest_neither_reuses_nor_deletes_a_stored_blob(bucket):
+    owner, other = APIClient(), APIClient()
+    owner.force_authenticate(UserFactory(role=User.Role.TEACHER))
+    other.force_authenticate(UserFactory(role=User.Role.TEACHER))
+    slot = _request_slot(owner).json()
+    _put(bucket, slot, CONTENT)
+    assert owner.post(f"/api/uploads/{slot['id']}/confirm/").status_code == 200
+    blob = ContentBlob.objects.get()
+
+    # Knowing only the digest gets no blob, and a bad upload cannot touch the stored file.
+    probe = _request_slot(other).json()
+    assert probe["upload_required"] is True
+    assert other.post(f"/api/uploads/{probe['id']}/confirm/").status_code == 400
+    _put(bucket, probe, b"%PDF-1.4 forged")
+    assert other.post(f"/api/uploads/{probe['id']}/confirm/").status_code == 400
+    keys = [item["Key"] for item in bucket.list_objects_v2(Bucket=BUCKET)["Contents"]]
+    assert keys == [blob.file.name]
+
+    # Uploading the same bytes is deduplicated once they have been verified.
+    again = _request_slot(other).json()
+    _put(bucket, again, CONTENT)
+    assert other.post(f"/api/uploads/{again['id']}/confirm/").status_code == 200
+    assert UploadSlot.objects.get(pk=again["id"]).blob_id == blob.pk
+    keys = [item["Key"] for item in bucket.list_objects_v2(Bucket=BUCKET)["Contents"]]
+    assert keys == [blob.file.name]
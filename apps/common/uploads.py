@@ -0,0 +1,117 @@
+"""Direct-to-object-storage uploads.
+
+1. ``create_upload_slot`` reserves a staging key of its own for the slot
+   (``uploads/<slot id>``) and returns a presigned PUT for it.
+2. The client uploads straight to the bucket; Django never sees the bytes.
+3. ``confirm_upload_slot`` checks the staged object's size and checksum, then moves it
+   to its content-addressed blob path (or drops it if identical content is already
+   stored) and records the ``ContentBlob``.
+4. The slot id is passed as ``upload`` when creating a document or submission.
+
+Deduplication only happens after the bytes have been verified, so knowing a digest is
+not enough to obtain a stored file, and a rejected upload only ever deletes its own
+staging object.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+
+import structlog
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from . import object_storage
+from .models import ContentBlob, UploadSlot, blob_upload_to
+
+logger = structlog.get_logger(__name__)
+
+
+def staging_key(slot: UploadSlot) -> str:
+    return f"uploads/{slot.pk}{Path(slot.filename).suffix.lower()}"
+
+
+def create_upload_slot(
+    *, user, purpose: str, filename: str, content_type: str, size: int, sha256: str
+) -> UploadSlot:
+    slot = UploadSlot(
+        user=user,
+        purpose=purpose,
+        filename=filename,
+        content_type=content_type,
+        size=size,
+        sha256=sha256,
+        expires_at=timezone.now() + timedelta(seconds=settings.PRESIGNED_UPLOAD_EXPIRY_SECONDS),
+    )
+    slot.key = staging_key(slot)
+    slot.save()
+    return slot
+
+
+def _delete_unreferenced(key: str) -> None:
+    """Delete an uploaded object unless a content blob stores its file under ``key``."""
+    if not ContentBlob.objects.filter(file=key).exists():
+        object_storage.delete(key)
+
+
+def confirm_upload_slot(slot: UploadSlot) -> UploadSlot:
+    """Verify the uploaded object and attach it to ``slot`` as a content blob."""
+    if slot.is_confirmed:
+        return slot
+    if slot.expires_at <= timezone.now():
+        raise serializers.ValidationError("This upload slot has expired.")
+    stored = object_storage.head(slot.key)
+    if stored is None:
+        raise serializers.ValidationError("The file has not been uploaded yet.")
+    if stored["size"] != slot.size or stored["sha256"] != slot.sha256:
+        logger.warning(
+            "uploads.checksum_mismatch", slot=str(slot.pk), key=slot.key, stored=stored
+        )
+        _delete_unreferenced(slot.key)
+        raise serializers.ValidationError("The uploaded file does not match the declared checksum.")
+
+    blob = ContentBlob.objects.filter(sha256=slot.sha256).first()
+    if blob is None:
+        blob_key = blob_upload_to(ContentBlob(sha256=slot.sha256), slot.filename)
+        object_storage.copy(slot.key, blob_key)
+        try:
+            with transaction.atomic():
+                blob, _ = ContentBlob.objects.get_or_create(
+                    sha256=slot.sha256, defaults={"file": blob_key, "size": slot.size}
+                )
+        except IntegrityError:
+            blob = ContentBlob.objects.get(sha256=slot.sha256)
+        if blob.file.name != blob_key:
+            # A concurrent confirm stored the same content under another extension.
+            _delete_unreferenced(blob_key)
+    _delete_unreferenced(slot.key)
+    ContentBlob.objects.filter(pk=blob.pk).update(updated_at=timezone.now())
+    slot.blob = blob
+    slot.save(update_fields=["blob", "updated_at"])
+    return slot
+
+
+def purge_expired_upload_slots() -> int:
+    """Delete slots past their retention along with objects that were never confirmed.
+
+    Confirmed uploads are blobs and are left to blob collection.
+    """
+    cutoff = timezone.now() - timedelta(hours=settings.UPLOAD_SLOT_RETENTION_HOURS)
+    expired = UploadSlot.objects.filter(expires_at__lt=cutoff)
+    orphaned_keys = set(expired.filter(blob__isnull=True).values_list("key", flat=True))
+    deleted, _ = expired.delete()
+    if orphaned_keys and object_storage.is_enabled():
+        # Slots issued before staging keys existed pointed at blob paths.
+        orphaned_keys -= set(
+            ContentBlob.objects.filter(file__in=orphaned_keys).values_list("file", flat=True)
+        )
+        orphaned_keys -= set(
+            UploadSlot.objects.filter(key__in=orphaned_keys).values_list("key", flat=True)
+        )
+        for key in orphaned_keys:
+            object_storage.delete(key)
+    logger.info("uploads.slots_purged", count=deleted, orphaned_objects=len(orphaned_keys))
+    return deleted
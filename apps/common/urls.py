@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import UploadSlotViewSet
+
+router = DefaultRouter()
+router.register("", UploadSlotViewSet, basename="uploads")
+
+urlpatterns = router.urls
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_safe
+from prometheus_client import CONTENT_TYPE_LATEST
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from . import object_storage
+from .metrics import render_metrics
+from .models import UploadSlot
+from .serializers import UploadSlotSerializer
+from .uploads import confirm_upload_slot, create_upload_slot
+
+
+class ObjectStorageUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Direct uploads are not configured."
+    default_code = "object_storage_unavailable"
+
+
+class UploadSlotViewSet(
+    mixins.CreateModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet
+):
+    """Presigned direct uploads: create a slot, PUT the file to ``upload.url``, confirm."""
+
+    serializer_class = UploadSlotSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return UploadSlot.objects.filter(user=self.request.user)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not object_storage.is_enabled():
+            raise ObjectStorageUnavailable()
+
+    def perform_create(self, serializer):
+        serializer.instance = create_upload_slot(
+            user=self.request.user, **serializer.validated_data
+        )
+
+    @action(detail=True, methods=["post"])
+    def confirm(self, request, *args, **kwargs):
+        slot = confirm_upload_slot(self.get_object())
+        return Response(self.get_serializer(slot).data)
+
+
+@require_safe
+def metrics(request):
+    """Prometheus scrape endpoint; requires ``Authorization: Bearer <METRICS_TOKEN>``.
+
+    Without a token the endpoint is only open when ``DEBUG`` is on.
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponse("Set METRICS_TOKEN to enable metrics.", status=403)
+    elif not constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return HttpResponse(status=401)
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
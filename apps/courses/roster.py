@@ -0,0 +1,132 @@
+"""Roster sync: bring a course's enrollments in line with a list of students.
+
+The whole roster is diffed against the course's current enrollments in memory (one query
+for the students, one for the enrollments), then new rows are written with
+``bulk_create`` and status changes with ``bulk_update`` in a single transaction.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from apps.academic_calendar.agenda import bump_calendar_version, user_scope
+from apps.users.models import User
+from .models import Course, CourseEnrollment
+from .visibility import invalidate_visibility
+
+
+@dataclass
+class RosterSyncResult:
+    enrolled: list[str] = field(default_factory=list)
+    reactivated: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    unknown: list[str] = field(default_factory=list)
+    dry_run: bool = False
+
+    def as_dict(self) -> dict:
+        return {
+            "enrolled": self.enrolled,
+            "reactivated": self.reactivated,
+            "dropped": self.dropped,
+            "unchanged": self.unchanged,
+            "unknown": self.unknown,
+            "dry_run": self.dry_run,
+        }
+
+
+def resolve_students(identifiers: list[str]) -> tuple[dict[int, str], list[str]]:
+    """Map student ids/emails to ``{user_id: email}``; also return the unmatched ones."""
+    wanted = {identifier.strip() for identifier in identifiers if identifier.strip()}
+    ids = {int(identifier) for identifier in wanted if identifier.isdigit()}
+    emails = {identifier.lower() for identifier in wanted if not identifier.isdigit()}
+    students = dict(
+        User.objects.filter(role=User.Role.STUDENT)
+        .annotate(email_lower=Lower("email"))
+        .filter(Q(pk__in=ids) | Q(email_lower__in=emails))
+        .values_list("pk", "email")
+    )
+    found = {str(pk) for pk in students} | {email.lower() for email in students.values()}
+    unknown = sorted(
+        identifier
+        for identifier in wanted
+        if (identifier if identifier.isdigit() else identifier.lower()) not in found
+    )
+    return students, unknown
+
+
+def sync_roster(
+    course: Course,
+    identifiers: list[str],
+    *,
+    user: User | None = None,
+    drop_missing: bool = True,
+    dry_run: bool = False,
+) -> RosterSyncResult:
+    """Enroll everyone in ``identifiers`` and (optionally) drop enrolled students not in it.
+
+    Nothing is written if any identifier does not match a student, so a typo cannot drop
+    a student from the course.
+    """
+    students, unknown = resolve_students(identifiers)
+    result = RosterSyncResult(unknown=unknown, dry_run=dry_run)
+    current = {
+        enrollment.student_id: enrollment
+        for enrollment in CourseEnrollment.objects.filter(course=course).select_related(
+            "student"
+        )
+    }
+
+    new, changed = [], []
+    now = timezone.now()
+    for student_id, email in students.items():
+        enrollment = current.get(student_id)
+        if enrollment is None:
+            new.append(
+                CourseEnrollment(
+                    course=course,
+                    student_id=student_id,
+                    created_by=user,
+                    updated_by=user,
+                )
+            )
+            result.enrolled.append(email)
+        elif enrollment.status == CourseEnrollment.EnrollmentStatus.DROPPED:
+            enrollment.status = CourseEnrollment.EnrollmentStatus.ENROLLED
+            changed.append(enrollment)
+            result.reactivated.append(email)
+        else:
+            result.unchanged += 1
+    if drop_missing:
+        for student_id, enrollment in current.items():
+            if (
+                student_id not in students
+                and enrollment.status == CourseEnrollment.EnrollmentStatus.ENROLLED
+            ):
+                enrollment.status = CourseEnrollment.EnrollmentStatus.DROPPED
+                changed.append(enrollment)
+                result.dropped.append(enrollment.student.email)
+    for enrollment in changed:
+        enrollment.updated_by = user
+        enrollment.updated_at = now
+    for emails in (result.enrolled, result.reactivated, result.dropped):
+        emails.sort()
+
+    if dry_run or unknown or not (new or changed):
+        return result
+    with transaction.atomic():
+        CourseEnrollment.objects.bulk_create(new, batch_size=500)
+        CourseEnrollment.objects.bulk_update(
+            changed, ["status", "updated_by", "updated_at"], batch_size=500
+        )
+        # Bulk writes skip the enrollment signals.
+        affected = [enrollment.student_id for enrollment in new + changed]
+        transaction.on_commit(lambda: invalidate_visibility(affected))
+        scopes = [user_scope(student_id) for student_id in affected]
+        transaction.on_commit(lambda: bump_calendar_version(scopes))
+    return result
@@ -107,3 +107,29 @@ class CourseEnrollmentSerializer(serializers.ModelSerializer):
         if status and status == CourseEnrollment.EnrollmentStatus.COMPLETED:
             instance.completed_at = timezone.now()
         return super().update(instance, validated_data)
+
+
+class RosterSyncSerializer(serializers.Serializer):
+    students = serializers.ListField(
+        child=serializers.CharField(max_length=254),
+        allow_empty=True,
+        max_length=5000,
+        help_text="Student ids or emails making up the course roster.",
+    )
+    drop_missing = serializers.BooleanField(
+        default=True, help_text="Drop enrolled students who are not in the list."
+    )
+    confirm_drop_all = serializers.BooleanField(
+        default=False, help_text="Required to drop every enrolled student with an empty list."
+    )
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if not attrs["students"] and attrs["drop_missing"] and not attrs["confirm_drop_all"]:
+            raise serializers.ValidationError(
+                {
+                    "students": "An empty roster would drop every enrolled student; "
+                    "set confirm_drop_all to do that."
+                }
+            )
+        return attrs
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.users.models import User
+from .models import Course, CourseEnrollment
+from .visibility import invalidate_visibility
+
+
+def invalidate_on_commit(user_ids) -> None:
+    # Invalidating inside the writer's transaction would let a concurrent request re-cache
+    # the pre-commit sets until VISIBILITY_CACHE_SECONDS pass.
+    transaction.on_commit(lambda: invalidate_visibility(user_ids))
+
+
+@receiver(post_save, sender=CourseEnrollment, dispatch_uid="visibility_enrollment_saved")
+@receiver(post_delete, sender=CourseEnrollment, dispatch_uid="visibility_enrollment_deleted")
+def invalidate_student_visibility(sender, instance: CourseEnrollment, **kwargs):
+    invalidate_on_commit([instance.student_id])
+
+
+@receiver(pre_save, sender=Course, dispatch_uid="visibility_course_previous_teacher")
+def remember_previous_teacher(sender, instance: Course, **kwargs):
+    instance._previous_teacher_id = None
+    if not instance._state.adding:
+        instance._previous_teacher_id = (
+            Course.objects.filter(pk=instance.pk).values_list("assigned_teacher_id", flat=True)
+        ).first()
+
+
+@receiver(post_save, sender=Course, dispatch_uid="visibility_course_saved")
+def invalidate_teacher_visibility(sender, instance: Course, **kwargs):
+    previous = getattr(instance, "_previous_teacher_id", None)
+    if previous != instance.assigned_teacher_id:
+        invalidate_on_commit([previous, instance.assigned_teacher_id])
+
+
+@receiver(post_delete, sender=Course, dispatch_uid="visibility_course_deleted")
+def invalidate_deleted_course_teacher(sender, instance: Course, **kwargs):
+    invalidate_on_commit([instance.assigned_teacher_id])
+
+
+@receiver(post_save, sender=User, dispatch_uid="visibility_user_saved")
+def invalidate_user_visibility(sender, instance: User, **kwargs):
+    invalidate_on_commit([instance.pk])
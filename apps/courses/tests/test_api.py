@@ -1,8 +1,16 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 
+from apps.courses.models import CourseEnrollment
 from apps.users.models import User
-from tests.factories import CourseFactory, DepartmentFactory, UserFactory
+from tests.factories import (
+    CourseEnrollmentFactory,
+    CourseFactory,
+    DepartmentFactory,
+    UserFactory,
+)
 
 
 @pytest.mark.django_db
@@ -37,3 +45,81 @@ def test_student_sees_department_courses_without_enrollment():
     payload = data["results"] if isinstance(data, dict) and "results" in data else data
     course_ids = [item["id"] for item in payload]
     assert str(course.id) in course_ids
+
+
+@pytest.mark.django_db
+def test_student_course_visibility_follows_enrollment_without_distinct(
+    django_capture_on_commit_callbacks,
+):
+    student = UserFactory(role=User.Role.STUDENT, department=DepartmentFactory())
+    course = CourseFactory(department=DepartmentFactory())
+    client = APIClient()
+    client.force_authenticate(user=student)
+
+    def visible_ids():
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/api/courses/")
+        assert not any("DISTINCT" in query["sql"] for query in queries.captured_queries)
+        return [item["id"] for item in response.json()["results"]]
+
+    assert str(course.id) not in visible_ids()
+    with django_capture_on_commit_callbacks(execute=True):
+        enrollment = CourseEnrollmentFactory(course=course, student=student)
+    assert str(course.id) in visible_ids()
+    with django_capture_on_commit_callbacks(execute=True):
+        enrollment.delete()
+    assert str(course.id) not in visible_ids()
+
+
+@pytest.mark.django_db
+def test_roster_sync_diffs_enrollments_in_bulk(
+    django_assert_max_num_queries, django_capture_on_commit_callbacks
+):
+    teacher = UserFactory(role=User.Role.TEACHER)
+    course = CourseFactory(assigned_teacher=teacher)
+    kept, leaving, returning = UserFactory.create_batch(3, role=User.Role.STUDENT)
+    CourseEnrollmentFactory(course=course, student=kept)
+    CourseEnrollmentFactory(course=course, student=leaving)
+    CourseEnrollmentFactory(
+        course=course, student=returning, status=CourseEnrollment.EnrollmentStatus.DROPPED
+    )
+    newcomers = UserFactory.create_batch(20, role=User.Role.STUDENT)
+    roster = [str(kept.pk), returning.email.upper()] + [student.email for student in newcomers]
+    client = APIClient()
+    client.force_authenticate(user=teacher)
+    url = f"/api/courses/{course.id}/roster-sync/"
+
+    typo = client.post(url, {"students": roster + ["nobody@example.com"]}, format="json")
+    assert typo.status_code == 400
+    assert typo.json()["unknown"] == ["nobody@example.com"]
+    assert CourseEnrollment.objects.filter(course=course).count() == 3
+
+    emptied = client.post(url, {"students": []}, format="json")
+    assert emptied.status_code == 400
+    assert "students" in emptied.json()
+    kept_all = client.post(url, {"students": [], "drop_missing": False}, format="json")
+    assert kept_all.status_code == 200
+    assert CourseEnrollment.objects.filter(
+        course=course, status=CourseEnrollment.EnrollmentStatus.ENROLLED
+    ).count() == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with django_assert_max_num_queries(10):
+            response = client.post(url, {"students": roster}, format="json")
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert len(summary["enrolled"]) == 20
+    assert summary["reactivated"] == [returning.email]
+    assert summary["dropped"] == [leaving.email]
+    assert summary["unchanged"] == 1
+    statuses = dict(
+        CourseEnrollment.objects.filter(course=course).values_list("student_id", "status")
+    )
+    assert statuses[leaving.pk] == CourseEnrollment.EnrollmentStatus.DROPPED
+    assert statuses[returning.pk] == CourseEnrollment.EnrollmentStatus.ENROLLED
+    assert len(statuses) == 23
+
+    other_teacher = UserFactory(role=User.Role.TEACHER)
+    client.force_authenticate(user=other_teacher)
+    assert client.post(url, {"students": []}, format="json").status_code == 403
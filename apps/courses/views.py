@@ -4,17 +4,21 @@ from django.db import models
 from django.db.models import QuerySet
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from apps.users.models import User
 from apps.users.permissions import IsAdmin, IsAdminHODOrTeacher, IsAdminOrHOD
 from .models import Course, CourseEnrollment
+from .roster import sync_roster
+from .visibility import visibility_for
 from .serializers import (
     CourseApprovalSerializer,
     CourseCreateSerializer,
     CourseEnrollmentSerializer,
     CourseSerializer,
+    RosterSyncSerializer,
 )
 
 
@@ -31,37 +35,36 @@ class CourseViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated(), IsAdminOrHOD()]
         if self.action == "approve":
             return [IsAuthenticated(), IsAdminOrHOD()]
+        if self.action == "roster_sync":
+            return [IsAuthenticated(), IsAdminHODOrTeacher()]
         return [IsAuthenticated()]
 
     def get_queryset(self) -> QuerySet[Course]:
         user = self.request.user
         qs = self.queryset
         if user.role == User.Role.ADMIN:
-            return qs.distinct()
+            return qs
         if user.role == User.Role.HOD:
-            return qs.filter(department=user.department).distinct()
+            return qs.filter(department=user.department)
         if user.role == User.Role.TEACHER:
             return qs.filter(
                 models.Q(assigned_teacher=user) | models.Q(status=Course.Status.ACTIVE)
-            ).distinct()
+            )
         if user.role == User.Role.STUDENT:
-            department_filter = models.Q()
-            if user.department_id:
-                department_filter = models.Q(
-                    department_id=user.department_id, status=Course.Status.ACTIVE
-                )
-            else:
-                department_filter = models.Q(status=Course.Status.ACTIVE)
-            return qs.filter(
-                models.Q(enrollments__student=user) | department_filter
-            ).distinct()
-        return qs.none().distinct()
+            visible = visibility_for(user)
+            department_filter = models.Q(status=Course.Status.ACTIVE)
+            if visible.department_id:
+                department_filter &= models.Q(department_id=visible.department_id)
+            return qs.filter(models.Q(id__in=visible.enrolled_course_ids) | department_filter)
+        return qs.none()
 
     def get_serializer_class(self):
         if self.action in {"create", "update", "partial_update"}:
             return CourseCreateSerializer
         if self.action == "approve":
             return CourseApprovalSerializer
+        if self.action == "roster_sync":
+            return RosterSyncSerializer
         return self.serializer_class
 
     @action(detail=True, methods=["post"])
@@ -72,6 +75,24 @@ class CourseViewSet(viewsets.ModelViewSet):
         serializer.save()
         return Response(CourseSerializer(course, context={"request": request}).data)
 
+    @action(detail=True, methods=["post"], url_path="roster-sync")
+    def roster_sync(self, request, *args, **kwargs):
+        course = self.get_object()
+        if request.user.role == User.Role.TEACHER and course.assigned_teacher_id != request.user.pk:
+            raise PermissionDenied("Only the assigned teacher can manage this course's roster.")
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        result = sync_roster(
+            course,
+            data["students"],
+            user=request.user,
+            drop_missing=data["drop_missing"],
+            dry_run=data["dry_run"],
+        )
+        response_status = status.HTTP_400_BAD_REQUEST if result.unknown else status.HTTP_200_OK
+        return Response(result.as_dict(), status=response_status)
+
 
 class CourseEnrollmentViewSet(viewsets.ModelViewSet):
     queryset = CourseEnrollment.objects.select_related("course", "student", "created_by")
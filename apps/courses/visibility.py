@@ -0,0 +1,75 @@
+"""Per-user course visibility, cached so list endpoints can filter without joins.
+
+List endpoints used to filter with ``Q(...) | Q(course__enrollments__student=user)`` and
+``.distinct()``, which fans the join out and forces a de-duplication pass on every call.
+Instead they filter on ``course_id__in=<ids>`` using the sets cached here.
+
+The cache entry for a user is dropped (see ``signals``) once a change to their
+enrollments, their role or department, or the courses assigned to them commits. Code
+that writes in bulk calls ``invalidate_visibility`` itself, also on commit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.common.metrics import record_cache_lookup
+from apps.users.models import User
+
+from .models import Course, CourseEnrollment
+
+
+@dataclass(frozen=True)
+class Visibility:
+    role: str
+    department_id: object
+    enrolled_course_ids: frozenset
+    teaching_course_ids: frozenset
+
+
+def visibility_cache_key(user_id) -> str:
+    # v2: entries carry the role; older pickles without it must not be read back.
+    return f"visibility:v2:{user_id}"
+
+
+def _compute(user) -> Visibility:
+    return Visibility(
+        role=user.role,
+        department_id=user.department_id,
+        enrolled_course_ids=frozenset(
+            CourseEnrollment.objects.filter(student_id=user.pk).values_list(
+                "course_id", flat=True
+            )
+        ),
+        teaching_course_ids=frozenset(
+            Course.objects.filter(assigned_teacher_id=user.pk).values_list("id", flat=True)
+        ),
+    )
+
+
+def _cached(user_id, load_user) -> Visibility:
+    key = visibility_cache_key(user_id)
+    visibility = cache.get(key)
+    record_cache_lookup("visibility", visibility is not None)
+    if visibility is None:
+        visibility = _compute(load_user())
+        cache.set(key, visibility, settings.VISIBILITY_CACHE_SECONDS)
+    return visibility
+
+
+def visibility_for(user) -> Visibility:
+    """The user's visible course ids and department, from cache when possible."""
+    return _cached(user.pk, lambda: user)
+
+
+def visibility_for_id(user_id) -> Visibility:
+    """``visibility_for`` when only the id is known; the user is loaded on a cache miss."""
+    return _cached(user_id, lambda: User.objects.get(pk=user_id))
+
+
+def invalidate_visibility(user_ids: Iterable) -> None:
+    cache.delete_many([visibility_cache_key(user_id) for user_id in user_ids if user_id])
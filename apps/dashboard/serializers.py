@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from rest_framework import serializers
+
+from apps.academic_calendar.models import TimetableEntry
+from apps.assessments.models import Assessment, AssessmentSubmission
+from apps.courses.models import Course
+
+
+class DashboardCourseSerializer(serializers.ModelSerializer):
+    teacher_name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Course
+        fields = ("id", "code", "title", "credits", "teacher_name")
+
+    def get_teacher_name(self, obj: Course) -> str:
+        teacher = obj.assigned_teacher
+        return (teacher.get_full_name() or teacher.email) if teacher else ""
+
+
+class DashboardAssessmentSerializer(serializers.ModelSerializer):
+    course_code = serializers.CharField(source="course.code")
+    has_submitted = serializers.BooleanField()
+
+    class Meta:
+        model = Assessment
+        fields = (
+            "id",
+            "title",
+            "assessment_type",
+            "course",
+            "course_code",
+            "status",
+            "scheduled_at",
+            "closes_at",
+            "has_submitted",
+        )
+
+
+class DashboardGradeSerializer(serializers.ModelSerializer):
+    assessment_title = serializers.CharField(source="assessment.title")
+    course_code = serializers.CharField(source="assessment.course.code")
+    total_marks = serializers.IntegerField(source="assessment.total_marks")
+
+    class Meta:
+        model = AssessmentSubmission
+        fields = (
+            "id",
+            "assessment",
+            "assessment_title",
+            "course_code",
+            "score",
+            "total_marks",
+            "feedback",
+            "updated_at",
+        )
+
+
+class DashboardTimetableSerializer(serializers.ModelSerializer):
+    course_code = serializers.CharField(source="course.code")
+    course_title = serializers.CharField(source="course.title")
+    location = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TimetableEntry
+        fields = (
+            "id",
+            "course",
+            "course_code",
+            "course_title",
+            "entry_type",
+            "location",
+            "start_at",
+            "end_at",
+        )
+
+    def get_location(self, obj: TimetableEntry) -> str:
+        return obj.location.name if obj.location else obj.room
+
+
+class StudentDashboardSerializer(serializers.Serializer):
+    courses = DashboardCourseSerializer(many=True)
+    upcoming_assessments = DashboardAssessmentSerializer(many=True)
+    recent_grades = DashboardGradeSerializer(many=True)
+    today = DashboardTimetableSerializer(many=True)
+    unread_notifications = serializers.IntegerField()
+    generated_at = serializers.DateTimeField()
@@ -0,0 +1,87 @@
+"""Assemble the student home page in a fixed number of queries.
+
+One query each for enrollments, upcoming assessments (with a submitted flag), recent
+grades, today's timetable and the unread notification count; the result is cached per
+user for ``DASHBOARD_CACHE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from apps.academic_calendar.models import TimetableEntry
+from apps.assessments.models import Assessment, AssessmentSubmission
+from apps.common.metrics import record_cache_lookup
+from apps.courses.models import CourseEnrollment
+from apps.notifications.models import Notification
+from apps.users.models import User
+
+UPCOMING_STATUSES = (Assessment.Status.SCHEDULED, Assessment.Status.IN_PROGRESS)
+
+
+def dashboard_cache_key(user_id) -> str:
+    return f"dashboard:student:{user_id}"
+
+
+def build_student_dashboard(user: User) -> dict:
+    now = timezone.now()
+    enrollments = list(
+        CourseEnrollment.objects.filter(
+            student=user, status=CourseEnrollment.EnrollmentStatus.ENROLLED
+        )
+        .select_related("course", "course__assigned_teacher")
+        .order_by("course__code")
+    )
+    course_ids = [enrollment.course_id for enrollment in enrollments]
+
+    submitted = AssessmentSubmission.objects.filter(assessment=OuterRef("pk"), student=user)
+    upcoming = list(
+        Assessment.objects.filter(
+            course_id__in=course_ids, status__in=UPCOMING_STATUSES, closes_at__gte=now
+        )
+        .select_related("course")
+        .annotate(has_submitted=Exists(submitted))
+        .order_by("scheduled_at")[: settings.DASHBOARD_UPCOMING_LIMIT]
+    )
+    grades = list(
+        AssessmentSubmission.objects.filter(
+            student=user, status=AssessmentSubmission.SubmissionStatus.GRADED
+        )
+        .select_related("assessment", "assessment__course")
+        .order_by("-updated_at")[: settings.DASHBOARD_GRADES_LIMIT]
+    )
+    day_start = timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+    timetable = list(
+        TimetableEntry.objects.filter(
+            course_id__in=course_ids,
+            start_at__lt=day_start + timedelta(days=1),
+            end_at__gt=day_start,
+        )
+        .select_related("course", "location")
+        .order_by("start_at")
+    )
+    unread = Notification.objects.filter(user=user, is_read=False).count()
+    return {
+        "courses": [enrollment.course for enrollment in enrollments],
+        "upcoming_assessments": upcoming,
+        "recent_grades": grades,
+        "today": timetable,
+        "unread_notifications": unread,
+        "generated_at": now,
+    }
+
+
+def cached_student_dashboard(user: User, render) -> dict:
+    """``render(build_student_dashboard(user))``, cached per user for a short TTL."""
+    key = dashboard_cache_key(user.pk)
+    data = cache.get(key)
+    record_cache_lookup("student_dashboard", data is not None)
+    if data is None:
+        data = render(build_student_dashboard(user))
+        cache.set(key, data, settings.DASHBOARD_CACHE_SECONDS)
+    return data
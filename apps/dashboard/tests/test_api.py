@@ -0,0 +1,81 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.academic_calendar.models import TimetableEntry
+from apps.assessments.models import Assessment, AssessmentSubmission
+from apps.notifications.models import Notification
+from apps.users.models import User
+from tests.factories import (
+    AcademicTermFactory,
+    AssessmentFactory,
+    CourseEnrollmentFactory,
+    CourseFactory,
+    UserFactory,
+)
+
+
+@pytest.mark.django_db
+def test_student_dashboard_has_a_fixed_query_budget(django_assert_max_num_queries):
+    student = UserFactory(role=User.Role.STUDENT)
+    now = timezone.now()
+    term = AcademicTermFactory()
+    for _ in range(4):
+        course = CourseFactory(assigned_teacher=UserFactory(role=User.Role.TEACHER))
+        CourseEnrollmentFactory(course=course, student=student)
+        AssessmentFactory(
+            course=course,
+            status=Assessment.Status.SCHEDULED,
+            scheduled_at=now + timedelta(days=2),
+            closes_at=now + timedelta(days=2, hours=1),
+        )
+        graded = AssessmentFactory(course=course, status=Assessment.Status.COMPLETED)
+        AssessmentSubmission.objects.create(
+            assessment=graded,
+            student=student,
+            status=AssessmentSubmission.SubmissionStatus.GRADED,
+            score=42,
+        )
+        TimetableEntry.objects.create(
+            academic_term=term,
+            course=course,
+            teacher=course.assigned_teacher,
+            room="A-1",
+            entry_type="LECTURE",
+            start_at=now,
+            end_at=now + timedelta(minutes=1),
+        )
+    AssessmentFactory(  # not enrolled
+        status=Assessment.Status.SCHEDULED,
+        scheduled_at=now + timedelta(days=1),
+        closes_at=now + timedelta(days=1, hours=1),
+    )
+    Notification.objects.create(user=student, subject="Hi", body="Unread")
+    Notification.objects.create(user=student, subject="Old", body="Read", is_read=True)
+    client = APIClient()
+    client.force_authenticate(user=student)
+
+    with django_assert_max_num_queries(5):
+        response = client.get("/api/dashboard/student/")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["courses"]) == 4
+    assert len(data["upcoming_assessments"]) == 4
+    assert not any(item["has_submitted"] for item in data["upcoming_assessments"])
+    assert len(data["recent_grades"]) == 4
+    assert len(data["today"]) == 4
+    assert data["unread_notifications"] == 1
+
+    with django_assert_max_num_queries(0):
+        assert client.get("/api/dashboard/student/").json() == data
+
+
+@pytest.mark.django_db
+def test_student_dashboard_is_for_students_only():
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(role=User.Role.TEACHER))
+
+    assert client.get("/api/dashboard/student/").status_code == 403
@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import StudentDashboardViewSet
+
+router = DefaultRouter()
+router.register("student", StudentDashboardViewSet, basename="student-dashboard")
+
+urlpatterns = router.urls
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.users.permissions import IsStudent
+from .serializers import StudentDashboardSerializer
+from .services import cached_student_dashboard
+
+
+class StudentDashboardViewSet(viewsets.GenericViewSet):
+    """Everything the student home page needs, in one response."""
+
+    serializer_class = StudentDashboardSerializer
+    permission_classes = [IsAuthenticated, IsStudent]
+
+    def list(self, request, *args, **kwargs):
+        data = cached_student_dashboard(
+            request.user, lambda dashboard: self.get_serializer(dashboard).data
+        )
+        return Response(data)
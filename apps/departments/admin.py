@@ -7,7 +7,7 @@ from .models import Department, DepartmentMembership
 
 @admin.register(Department)
 class DepartmentAdmin(admin.ModelAdmin):
-    list_display = ("name", "code", "head")
+    list_display = ("name", "code", "head", "teacher_count", "student_count")
     search_fields = ("name", "code")
     list_filter = ("head",)
 
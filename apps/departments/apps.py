@@ -5,3 +5,6 @@ class DepartmentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.departments"
     verbose_name = "Departments"
+
+    def ready(self):
+        from . import signals  # noqa: F401
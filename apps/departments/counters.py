@@ -0,0 +1,72 @@
+"""Stored teacher/student counts on departments.
+
+Signals keep the counters in step with single-user saves and deletes. Bulk writes to
+users (``QuerySet.update``, ``bulk_create``) skip signals; callers doing those should
+call ``reconcile_member_counts`` for the affected departments, and a nightly task
+reconciles every department as a backstop.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.users.models import User
+from .models import Department
+
+COUNTER_FIELDS = {
+    User.Role.TEACHER: "teacher_count",
+    User.Role.STUDENT: "student_count",
+}
+
+
+def adjust_member_counts(changes: Counter) -> None:
+    """Apply ``{(department_id, role): delta}`` changes with atomic F() updates.
+
+    Decrements stop at zero: a counter that has drifted low must not make a user
+    delete or move fail the column's CHECK constraint; reconciliation corrects it.
+    """
+    per_department: dict = {}
+    for (department_id, role), delta in changes.items():
+        field = COUNTER_FIELDS.get(role)
+        if department_id is None or field is None or not delta:
+            continue
+        per_department.setdefault(department_id, {})[field] = Greatest(F(field) + delta, 0)
+    for department_id, updates in per_department.items():
+        Department.objects.filter(pk=department_id).update(**updates)
+
+
+def _member_count(role: str) -> Coalesce:
+    members = (
+        User.objects.filter(department_id=OuterRef("pk"), role=role)
+        .order_by()
+        .values("department_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(members, output_field=IntegerField()), Value(0))
+
+
+def reconcile_member_counts(department_ids: Iterable | None = None) -> int:
+    """Recount members from the users table; returns how many departments were corrected."""
+    departments = Department.objects.all()
+    if department_ids is not None:
+        departments = departments.filter(pk__in=list(department_ids))
+    departments = departments.annotate(
+        actual_teachers=_member_count(User.Role.TEACHER),
+        actual_students=_member_count(User.Role.STUDENT),
+    ).only("pk", "teacher_count", "student_count")
+    stale = []
+    for department in departments:
+        if (department.teacher_count, department.student_count) != (
+            department.actual_teachers,
+            department.actual_students,
+        ):
+            department.teacher_count = department.actual_teachers
+            department.student_count = department.actual_students
+            stale.append(department)
+    Department.objects.bulk_update(stale, ["teacher_count", "student_count"], batch_size=500)
+    return len(stale)
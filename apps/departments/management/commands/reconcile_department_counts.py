@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.departments.counters import reconcile_member_counts
+
+
+class Command(BaseCommand):
+    help = "Recount department teacher/student counters from the users table."
+
+    def handle(self, *args, **options):
+        corrected = reconcile_member_counts()
+        self.stdout.write(self.style.SUCCESS(f"Corrected {corrected} department(s)."))
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:52
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_members(apps, schema_editor):
+    Department = apps.get_model("departments", "Department")
+    User = apps.get_model("users", "User")
+    counts = {}
+    rows = (
+        User.objects.filter(department__isnull=False, role__in=("TEACHER", "STUDENT"))
+        .values_list("department_id", "role")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    for department_id, role, total in rows:
+        counts.setdefault(department_id, {})[role] = total
+    departments = list(Department.objects.filter(pk__in=counts))
+    for department in departments:
+        department.teacher_count = counts[department.pk].get("TEACHER", 0)
+        department.student_count = counts[department.pk].get("STUDENT", 0)
+    Department.objects.bulk_update(departments, ["teacher_count", "student_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='department',
+            name='student_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='teacher_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_members, migrations.RunPython.noop),
+    ]
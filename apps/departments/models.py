@@ -19,6 +19,9 @@ class Department(BaseModel):
         null=True,
         blank=True,
     )
+    # Maintained by signals (see ``counters``) and reconciled nightly.
+    teacher_count = models.PositiveIntegerField(default=0, editable=False)
+    student_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ("name",)
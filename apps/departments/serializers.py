@@ -10,8 +10,6 @@ User = get_user_model()
 
 class DepartmentSerializer(serializers.ModelSerializer):
     head_email = serializers.EmailField(source="head.email", read_only=True)
-    teacher_count = serializers.IntegerField(read_only=True)
-    student_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Department
@@ -25,6 +23,7 @@ class DepartmentSerializer(serializers.ModelSerializer):
             "teacher_count",
             "student_count",
         )
+        read_only_fields = ("teacher_count", "student_count")
 
 
 class DepartmentCreateSerializer(serializers.ModelSerializer):
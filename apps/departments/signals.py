@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.users.models import User
+from .counters import adjust_member_counts
+
+
+def _membership(user: User) -> tuple:
+    return (user.department_id, user.role)
+
+
+@receiver(post_init, sender=User, dispatch_uid="departments_remember_membership")
+def remember_membership(sender, instance: User, **kwargs):
+    if instance.pk is None:
+        instance._counted_membership = None
+    elif {"department_id", "role"} <= instance.__dict__.keys():
+        instance._counted_membership = _membership(instance)
+
+
+@receiver(pre_save, sender=User, dispatch_uid="departments_load_membership")
+def load_deferred_membership(sender, instance: User, **kwargs):
+    # Instances loaded with .only()/.defer() did not record their membership on init.
+    if not hasattr(instance, "_counted_membership"):
+        instance._counted_membership = (
+            User.objects.filter(pk=instance.pk).values_list("department_id", "role").first()
+        )
+
+
+@receiver(post_save, sender=User, dispatch_uid="departments_count_membership")
+def count_membership(sender, instance: User, **kwargs):
+    previous = getattr(instance, "_counted_membership", None)
+    current = _membership(instance)
+    if previous == current:
+        return
+    changes = Counter({current: 1})
+    if previous is not None:
+        changes[previous] -= 1
+    adjust_member_counts(changes)
+    instance._counted_membership = current
+
+
+@receiver(post_delete, sender=User, dispatch_uid="departments_uncount_membership")
+def uncount_membership(sender, instance: User, **kwargs):
+    previous = getattr(instance, "_counted_membership", None) or _membership(instance)
+    adjust_member_counts(Counter({previous: -1}))
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import structlog
+from celery import shared_task
+
+from .counters import reconcile_member_counts
+
+logger = structlog.get_logger(__name__)
+
+
+@shared_task
+def reconcile_department_counts() -> int:
+    corrected = reconcile_member_counts()
+    if corrected:
+        logger.warning("departments.counts_reconciled", corrected=corrected)
+    return corrected
@@ -0,0 +1,57 @@
+import pytest
+from rest_framework.test import APIClient
+
+from apps.departments.counters import reconcile_member_counts
+from apps.departments.models import Department
+from apps.users.models import User
+from tests.factories import DepartmentFactory, UserFactory
+
+
+def _counts(department: Department) -> tuple[int, int]:
+    department.refresh_from_db()
+    return department.teacher_count, department.student_count
+
+
+@pytest.mark.django_db
+def test_department_counts_follow_role_and_department_changes():
+    maths, physics = DepartmentFactory(), DepartmentFactory()
+    teacher = UserFactory(role=User.Role.TEACHER, department=maths)
+    student = UserFactory(role=User.Role.STUDENT, department=maths)
+    UserFactory(role=User.Role.STUDENT, department=maths)
+    assert _counts(maths) == (1, 2)
+
+    student.department = physics
+    student.save()
+    teacher.role = User.Role.HOD
+    teacher.save()
+    assert _counts(maths) == (0, 1)
+    assert _counts(physics) == (0, 1)
+
+    User.objects.get(pk=student.pk).delete()
+    assert _counts(physics) == (0, 0)
+
+    # Bulk updates skip signals; reconciliation repairs the counters.
+    User.objects.filter(department=maths, role=User.Role.STUDENT).update(role=User.Role.TEACHER)
+    assert reconcile_member_counts() == 1
+    assert _counts(maths) == (1, 0)
+
+    # A counter that drifted to zero stops there instead of blocking the delete.
+    Department.objects.filter(pk=maths.pk).update(teacher_count=0)
+    User.objects.get(department=maths, role=User.Role.TEACHER).delete()
+    assert _counts(maths) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_department_list_reads_stored_counts(django_assert_max_num_queries):
+    admin = UserFactory(role=User.Role.ADMIN)
+    department = DepartmentFactory()
+    UserFactory.create_batch(3, role=User.Role.STUDENT, department=department)
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    with django_assert_max_num_queries(2):
+        response = client.get("/api/departments/")
+
+    assert response.status_code == 200
+    row = next(item for item in response.json()["results"] if item["id"] == str(department.id))
+    assert (row["teacher_count"], row["student_count"]) == (0, 3)
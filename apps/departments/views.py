@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from django.db.models import Count, Q, QuerySet
+from django.db.models import QuerySet
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 
@@ -28,14 +28,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self) -> QuerySet[Department]:
         user = self.request.user
-        qs = (
-            Department.objects.select_related("head")
-            .annotate(
-                teacher_count=Count("users", filter=Q(users__role=User.Role.TEACHER)),
-                student_count=Count("users", filter=Q(users__role=User.Role.STUDENT)),
-            )
-            .order_by("name")
-        )
+        qs = Department.objects.select_related("head").order_by("name")
         if user.role == User.Role.ADMIN:
             return qs
         if user.role == User.Role.HOD and user.department_id:
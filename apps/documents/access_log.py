@@ -0,0 +1,131 @@
+"""Buffered writer for document access logs.
+
+Access logs are written off the request path: events are appended to an in-process
+buffer and flushed with a single ``bulk_create`` once the buffer reaches
+``DOCUMENT_ACCESS_LOG_BUFFER_SIZE`` events or ``DOCUMENT_ACCESS_LOG_FLUSH_SECONDS``
+have passed since the first pending event. Pending events are flushed when the
+process exits. With ``DOCUMENT_ACCESS_LOG_BUFFERED`` disabled (tests), every event is
+written synchronously.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+
+import structlog
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from .models import DocumentAccessLog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class AccessEvent:
+    document_id: object
+    user_id: int | None
+    action: str
+    accessed_at: datetime
+
+    def to_model(self) -> DocumentAccessLog:
+        return DocumentAccessLog(
+            document_id=self.document_id,
+            user_id=self.user_id,
+            action=self.action,
+            accessed_at=self.accessed_at,
+        )
+
+
+class AccessLogBuffer:
+    def __init__(self, max_size: int, flush_seconds: float):
+        self.max_size = max_size
+        self.flush_seconds = flush_seconds
+        self._events: list[AccessEvent] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pid = os.getpid()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record(self, event: AccessEvent) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked worker: drop the parent's pending events, the parent flushes them.
+                self._events, self._timer, self._pid = [], None, os.getpid()
+            self._events.append(event)
+            full = len(self._events) >= self.max_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.flush_seconds, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        with self._lock:
+            events, self._events = self._events, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not events:
+            return 0
+        try:
+            DocumentAccessLog.objects.bulk_create(
+                [event.to_model() for event in events], batch_size=self.max_size
+            )
+        except Exception:  # noqa: BLE001 - never let logging failures escape
+            logger.exception("documents.access_log_flush_failed", count=len(events))
+            return 0
+        return len(events)
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        finally:
+            connection.close()
+
+
+_buffer: AccessLogBuffer | None = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer() -> AccessLogBuffer:
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = AccessLogBuffer(
+                    max_size=settings.DOCUMENT_ACCESS_LOG_BUFFER_SIZE,
+                    flush_seconds=settings.DOCUMENT_ACCESS_LOG_FLUSH_SECONDS,
+                )
+                atexit.register(_buffer.flush)
+    return _buffer
+
+
+def record_access(document, user, action: str) -> None:
+    """Record that ``user`` performed ``action`` on ``document``."""
+    user_id = user.pk if user is not None and user.is_authenticated else None
+    event = AccessEvent(
+        document_id=document.pk,
+        user_id=user_id,
+        action=action,
+        accessed_at=timezone.now(),
+    )
+    if not settings.DOCUMENT_ACCESS_LOG_BUFFERED:
+        event.to_model().save()
+        return
+    get_buffer().record(event)
+
+
+def flush_access_logs() -> int:
+    """Write any buffered events now; returns the number of rows written."""
+    if _buffer is None:
+        return 0
+    return _buffer.flush()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from django.contrib import admin
 
-from .models import Document, DocumentAccessLog, DocumentCategory
+from .models import Document, DocumentAccessDaily, DocumentAccessLog, DocumentCategory
 
 
 @admin.register(DocumentCategory)
@@ -23,3 +23,11 @@ class DocumentAccessLogAdmin(admin.ModelAdmin):
     list_display = ("document", "user", "action", "accessed_at")
     list_filter = ("action",)
     search_fields = ("document__title", "user__email")
+
+
+@admin.register(DocumentAccessDaily)
+class DocumentAccessDailyAdmin(admin.ModelAdmin):
+    list_display = ("date", "document", "department", "action", "count")
+    list_filter = ("action", "department")
+    search_fields = ("document__title",)
+    date_hierarchy = "date"
@@ -0,0 +1,129 @@
+"""Access-controlled file delivery.
+
+Views decide *whether* a user may fetch a file; this module decides *how* the bytes
+are delivered. With ``DOCUMENT_DOWNLOAD_OFFLOAD`` set to ``"nginx"`` or ``"apache"``
+the response only carries an ``X-Accel-Redirect``/``X-Sendfile`` header and the front
+proxy streams the file. Files in object storage have no local path for the proxy, so
+they are offloaded by redirecting to a presigned URL instead. Otherwise the file is
+streamed from storage in chunks, with single-range ``Range`` requests answered as
+``206 Partial Content``.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import re
+from pathlib import PurePosixPath
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.utils.http import content_disposition_header
+
+from apps.common import object_storage
+
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | bool | None:
+    """Return ``(start, end)`` inclusive, ``None`` to serve everything, or ``False`` if the
+    range is unsatisfiable."""
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        # Malformed or multi-range requests fall back to the full body.
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+def _iter_range(field_file, start: int, length: int):
+    with field_file.open("rb") as handle:
+        handle.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = handle.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _has_local_path(field_file) -> bool:
+    try:
+        field_file.path
+    except NotImplementedError:
+        return False
+    return True
+
+
+def _offload_response(field_file, filename: str, content_type: str):
+    backend = settings.DOCUMENT_DOWNLOAD_OFFLOAD
+    if not backend:
+        return None
+    if not _has_local_path(field_file):
+        if object_storage.is_enabled():
+            return HttpResponseRedirect(
+                object_storage.presign_get(field_file.name, filename, content_type)
+            )
+        return None
+    if backend == "nginx":
+        response = HttpResponse(content_type=content_type)
+        prefix = settings.DOCUMENT_ACCEL_REDIRECT_PREFIX.rstrip("/")
+        response["X-Accel-Redirect"] = quote(f"{prefix}/{field_file.name}")
+        return response
+    if backend == "apache":
+        response = HttpResponse(content_type=content_type)
+        response["X-Sendfile"] = field_file.path
+        return response
+    return None
+
+
+def file_download_response(request, field_file, filename: str):
+    """Build a download response for ``field_file`` served as ``filename``."""
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    response = _offload_response(field_file, filename, content_type)
+    if response is None:
+        size = field_file.size
+        range_header = request.headers.get("Range")
+        byte_range = _parse_range(range_header, size) if range_header else None
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+        if byte_range is None:
+            response = FileResponse(field_file.open("rb"), content_type=content_type)
+            response["Content-Length"] = str(size)
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(
+                _iter_range(field_file, start, length), status=206, content_type=content_type
+            )
+            response["Content-Length"] = str(length)
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    return response
+
+
+def download_filename(title: str, stored_name: str) -> str:
+    extension = PurePosixPath(stored_name).suffix
+    stem = re.sub(r"[^\w.-]+", "-", title).strip("-.") or "document"
+    return f"{stem}{extension}"
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F
+from rest_framework.filters import SearchFilter
+
+from apps.common.db import is_postgres
+
+
+class DocumentSearchFilter(SearchFilter):
+    """Ranked full-text search on PostgreSQL, ``icontains`` search elsewhere.
+
+    On PostgreSQL the ``search`` parameter is parsed as a web-search query and matched
+    against the GIN-indexed ``search_vector``; results are ordered by rank.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, "").strip()
+        if not terms or not is_postgres(connection):
+            return super().filter_queryset(request, queryset, view)
+        query = SearchQuery(terms, search_type="websearch", config=settings.DOCUMENT_SEARCH_CONFIG)
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-created_at")
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:27
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='documentaccesslog',
+            name='accessed_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
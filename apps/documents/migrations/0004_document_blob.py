@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:29
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0001_initial'),
+        ('documents', '0003_access_log_accessed_at_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='documents', to='common.contentblob'),
+        ),
+    ]
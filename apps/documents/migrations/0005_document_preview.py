@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0004_document_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='preview',
+            field=models.FileField(blank=True, editable=False, max_length=255, upload_to=''),
+        ),
+    ]
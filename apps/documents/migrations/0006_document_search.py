@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:31
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+from apps.common.db import PostgresOnlySQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('documents', '0005_document_preview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='extracted_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        PostgresOnlySQL(
+            sql='''
+                CREATE INDEX "documents_document_search_vector_gin"
+                    ON "documents_document" USING gin ("search_vector");
+                UPDATE "documents_document" SET "search_vector" =
+                    setweight(to_tsvector('english', coalesce("title", '')), 'A')
+                    || setweight(to_tsvector('english', coalesce("description", '')), 'B');
+            ''',
+            reverse_sql='DROP INDEX IF EXISTS "documents_document_search_vector_gin";',
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:32
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_initial'),
+        ('documents', '0006_document_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentAccessDaily',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('action', models.CharField(max_length=64)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='document_access_daily', to='departments.department')),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_access', to='documents.document')),
+            ],
+            options={
+                'ordering': ('-date',),
+                'indexes': [models.Index(fields=['department', 'date'], name='documents_d_departm_b13255_idx'), models.Index(fields=['date'], name='documents_d_date_16ebb3_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'document', 'action'), name='document_access_daily_unique')],
+            },
+        ),
+    ]
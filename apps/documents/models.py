@@ -4,10 +4,12 @@ import uuid
 from pathlib import Path
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.utils import timezone
 
-from apps.common.models import BaseModel, OwnedModel
+from apps.common.models import BaseModel, ContentAddressedFilesMixin, OwnedModel
 
 User = settings.AUTH_USER_MODEL
 
@@ -25,7 +27,7 @@ class DocumentCategory(BaseModel):
         return self.name
 
 
-class Document(OwnedModel):
+class Document(ContentAddressedFilesMixin, OwnedModel):
     class AccessLevel(models.TextChoices):
         PRIVATE = "PRIVATE", "Private"
         DEPARTMENT = "DEPARTMENT", "Department"
@@ -57,6 +59,19 @@ class Document(OwnedModel):
         choices=AccessLevel.choices,
         default=AccessLevel.PRIVATE,
     )
+    blob = models.ForeignKey(
+        "common.ContentBlob",
+        on_delete=models.PROTECT,
+        related_name="documents",
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    preview = models.FileField(max_length=255, blank=True, editable=False)
+    extracted_text = models.TextField(blank=True, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    blob_fields = {"file": "blob"}
 
     class Meta:
         ordering = ("-created_at",)
@@ -68,8 +83,36 @@ class Document(OwnedModel):
 class DocumentAccessLog(BaseModel):
     document = models.ForeignKey(Document, on_delete=models.CASCADE, related_name="access_logs")
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
-    accessed_at = models.DateTimeField(auto_now_add=True)
+    accessed_at = models.DateTimeField(default=timezone.now, db_index=True)
     action = models.CharField(max_length=64)
 
     class Meta:
         ordering = ("-accessed_at",)
+
+
+class DocumentAccessDaily(BaseModel):
+    """Daily access counters per document and action, rolled up from DocumentAccessLog."""
+
+    date = models.DateField()
+    document = models.ForeignKey(Document, on_delete=models.CASCADE, related_name="daily_access")
+    department = models.ForeignKey(
+        "departments.Department",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="document_access_daily",
+    )
+    action = models.CharField(max_length=64)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ("-date",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=("date", "document", "action"), name="document_access_daily_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=("department", "date")),
+            models.Index(fields=("date",)),
+        ]
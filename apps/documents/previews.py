@@ -0,0 +1,60 @@
+"""First-page thumbnail rendering for documents.
+
+Previews are derived from the document's content blob, so identical files share one
+preview image and re-saving a document without changing its file never re-renders.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import PurePosixPath
+
+from django.conf import settings
+
+PREVIEWABLE_EXTENSIONS = {".pdf", ".png", ".jpg", ".jpeg"}
+
+
+def preview_path(document) -> str | None:
+    """Storage path of the preview for ``document``'s current file, if it can have one."""
+    if not document.file or not document.blob_id:
+        return None
+    if PurePosixPath(document.file.name).suffix.lower() not in PREVIEWABLE_EXTENSIONS:
+        return None
+    digest = document.blob.sha256
+    return f"previews/{digest[:2]}/{digest}.jpg"
+
+
+def _open_first_page(field_file, extension: str):
+    from PIL import Image
+
+    with field_file.open("rb") as handle:
+        data = handle.read()
+    if extension == ".pdf":
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(data)
+        try:
+            page = pdf[0]
+            try:
+                width = page.get_width()
+                scale = max(settings.DOCUMENT_PREVIEW_SIZE) / width if width else 1
+                return page.render(scale=scale).to_pil()
+            finally:
+                page.close()
+        finally:
+            pdf.close()
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+
+def render_preview(field_file) -> bytes:
+    """Render a JPEG thumbnail of the first page/frame of ``field_file``."""
+    extension = PurePosixPath(field_file.name).suffix.lower()
+    image = _open_first_page(field_file, extension)
+    image.thumbnail(settings.DOCUMENT_PREVIEW_SIZE)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    output = io.BytesIO()
+    image.save(output, format="JPEG", quality=80, optimize=True)
+    return output.getvalue()
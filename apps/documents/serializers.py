@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 
+from apps.common.models import UploadSlot
+from apps.common.serializers import DirectUploadSerializerMixin, UploadSlotField
 from .models import Document, DocumentAccessLog, DocumentCategory
 
 
@@ -11,9 +16,13 @@ class DocumentCategorySerializer(serializers.ModelSerializer):
         fields = ("id", "name", "description")
 
 
-class DocumentSerializer(serializers.ModelSerializer):
+class DocumentSerializer(DirectUploadSerializerMixin, serializers.ModelSerializer):
+    upload_fields = {"upload": ("file", "blob")}
+
+    upload = UploadSlotField(purpose=UploadSlot.Purpose.DOCUMENT)
     owner_email = serializers.EmailField(source="owner.email", read_only=True)
     category_name = serializers.CharField(source="category.name", read_only=True)
+    sha256 = serializers.CharField(source="blob.sha256", read_only=True, default=None)
 
     class Meta:
         model = Document
@@ -22,6 +31,9 @@ class DocumentSerializer(serializers.ModelSerializer):
             "title",
             "description",
             "file",
+            "upload",
+            "preview",
+            "sha256",
             "owner",
             "owner_email",
             "category",
@@ -31,7 +43,13 @@ class DocumentSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         )
-        read_only_fields = ("owner", "created_at", "updated_at")
+        read_only_fields = ("owner", "preview", "created_at", "updated_at")
+        extra_kwargs = {"file": {"required": False}}
+
+    def validate(self, attrs):
+        if self.instance is None and not attrs.get("file"):
+            raise serializers.ValidationError({"file": "Upload a file or reference an upload."})
+        return attrs
 
 
 class DocumentAccessLogSerializer(serializers.ModelSerializer):
@@ -41,3 +59,28 @@ class DocumentAccessLogSerializer(serializers.ModelSerializer):
         model = DocumentAccessLog
         fields = ("id", "document", "user", "user_email", "accessed_at", "action")
         read_only_fields = ("accessed_at",)
+
+
+class DocumentAnalyticsQuerySerializer(serializers.Serializer):
+    GROUP_BY_CHOICES = ("document", "department")
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    group_by = serializers.ChoiceField(choices=GROUP_BY_CHOICES, default="document")
+    action = serializers.CharField(required=False, max_length=64)
+    department = serializers.UUIDField(required=False)
+
+    def validate(self, attrs):
+        attrs.setdefault("end", timezone.localdate())
+        attrs.setdefault("start", attrs["end"] - timedelta(days=6))
+        if attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError("Start date must be on or before end date.")
+        return attrs
+
+
+class DocumentAccessStatSerializer(serializers.Serializer):
+    document = serializers.UUIDField(source="document_id", required=False)
+    document_title = serializers.CharField(source="document__title", required=False)
+    department = serializers.UUIDField(source="department_id", allow_null=True)
+    department_name = serializers.CharField(source="department__name", allow_null=True)
+    total = serializers.IntegerField()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Document
+from .previews import preview_path
+
+
+@receiver(post_save, sender=Document, dispatch_uid="documents_queue_preview")
+def queue_document_preview(sender, instance: Document, **kwargs):
+    if (preview_path(instance) or "") == instance.preview.name:
+        return
+    from .tasks import generate_document_preview
+
+    transaction.on_commit(lambda: generate_document_preview.delay(str(instance.pk)))
+
+
+@receiver(post_save, sender=Document, dispatch_uid="documents_queue_search_index")
+def queue_document_search_index(sender, instance: Document, update_fields=None, **kwargs):
+    if update_fields is not None and not {"title", "description", "file"} & set(update_fields):
+        return
+    from .tasks import index_document
+
+    extract_text = instance.has_new_blob("blob")
+    transaction.on_commit(lambda: index_document.delay(str(instance.pk), extract_text))
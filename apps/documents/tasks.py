@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+
+import structlog
+from celery import shared_task
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.common.db import is_postgres
+from .models import Document, DocumentAccessDaily, DocumentAccessLog
+from .previews import preview_path, render_preview
+from .text_extraction import extract_text
+
+logger = structlog.get_logger(__name__)
+
+
+@shared_task
+def generate_document_preview(document_id: str) -> str | None:
+    """Render (or reuse) the preview for a document and record its path."""
+    document = Document.objects.select_related("blob").filter(pk=document_id).first()
+    if document is None:
+        return None
+    path = preview_path(document)
+    if path is None:
+        Document.objects.filter(pk=document.pk).update(preview="")
+        return None
+    storage = document.preview.storage
+    if not storage.exists(path):
+        try:
+            content = render_preview(document.file)
+        except Exception:  # noqa: BLE001 - corrupt or unsupported files get no preview
+            logger.warning("documents.preview_failed", document=str(document.pk), exc_info=True)
+            return None
+        path = storage.save(path, ContentFile(content))
+    # Only record the preview if the document still holds the file it was rendered from.
+    Document.objects.filter(pk=document.pk, blob_id=document.blob_id).update(preview=path)
+    return path
+
+
+def document_search_vector():
+    config = settings.DOCUMENT_SEARCH_CONFIG
+    return (
+        SearchVector("title", weight="A", config=config)
+        + SearchVector("description", weight="B", config=config)
+        + SearchVector("extracted_text", weight="C", config=config)
+    )
+
+
+@shared_task
+def index_document(document_id: str, extract: bool = True) -> None:
+    """Refresh a document's extracted text (if its file changed) and search vector."""
+    document = Document.objects.filter(pk=document_id).first()
+    if document is None:
+        return
+    if extract:
+        try:
+            text = extract_text(document.file) if document.file else ""
+        except Exception:  # noqa: BLE001 - unreadable files are indexed by metadata only
+            logger.warning("documents.text_extraction_failed", document=document_id, exc_info=True)
+            text = ""
+        Document.objects.filter(pk=document.pk, blob_id=document.blob_id).update(
+            extracted_text=text
+        )
+    if is_postgres(connection):
+        Document.objects.filter(pk=document.pk).update(search_vector=document_search_vector())
+
+
+def rollup_day(day: date) -> int:
+    """Recompute the daily counters for ``day`` from the raw access log (idempotent)."""
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    end = start + timedelta(days=1)
+    rows = (
+        DocumentAccessLog.objects.filter(accessed_at__gte=start, accessed_at__lt=end)
+        .values("document_id", "document__department_id", "action")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    counters = [
+        DocumentAccessDaily(
+            date=day,
+            document_id=row["document_id"],
+            department_id=row["document__department_id"],
+            action=row["action"],
+            count=row["total"],
+        )
+        for row in rows
+    ]
+    DocumentAccessDaily.objects.bulk_create(
+        counters,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["date", "document", "action"],
+        update_fields=["count", "department", "updated_at"],
+    )
+    return len(counters)
+
+
+@shared_task
+def rollup_document_access(days: int = 2) -> int:
+    """Roll up today's and the previous ``days - 1`` days' access logs."""
+    today = timezone.localdate()
+    return sum(rollup_day(today - timedelta(days=offset)) for offset in range(days))
+
+
+@shared_task
+def prune_document_access_logs(batch_size: int = 5000) -> int:
+    """Delete raw access logs older than the retention window; rollups keep the counts."""
+    cutoff = timezone.now() - timedelta(days=settings.DOCUMENT_ACCESS_LOG_RETENTION_DAYS)
+    pruned = 0
+    while True:
+        ids = list(
+            DocumentAccessLog.objects.filter(accessed_at__lt=cutoff)
+            .order_by("accessed_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        deleted, _ = DocumentAccessLog.objects.filter(id__in=ids).delete()
+        pruned += deleted
+    logger.info("documents.access_logs_pruned", count=pruned, cutoff=cutoff.isoformat())
+    return pruned
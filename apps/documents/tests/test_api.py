@@ -0,0 +1,157 @@
+import io
+import zipfile
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+
+from apps.documents.access_log import AccessEvent, AccessLogBuffer, record_access
+from apps.documents.models import DocumentAccessLog
+from apps.documents.tasks import rollup_document_access
+from apps.users.models import User
+from tests.factories import DepartmentFactory, DocumentFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_document_retrieve_records_access_synchronously_in_tests():
+    document = DocumentFactory()
+    student = UserFactory(role=User.Role.STUDENT)
+    client = APIClient()
+    client.force_authenticate(user=student)
+
+    response = client.get(f"/api/documents/{document.id}/")
+    assert response.status_code == 200
+    log = DocumentAccessLog.objects.get()
+    assert (log.document_id, log.user_id, log.action) == (document.id, student.id, "view")
+
+
+@pytest.mark.django_db
+def test_access_log_buffer_flushes_in_bulk_when_full():
+    document = DocumentFactory()
+    buffer = AccessLogBuffer(max_size=3, flush_seconds=60)
+    for _ in range(2):
+        buffer.record(AccessEvent(document.id, None, "view", timezone.now()))
+    assert DocumentAccessLog.objects.count() == 0
+
+    buffer.record(AccessEvent(document.id, None, "view", timezone.now()))
+    assert DocumentAccessLog.objects.count() == 3
+    assert len(buffer) == 0
+
+
+@pytest.mark.django_db
+def test_document_download_supports_range_requests():
+    document = DocumentFactory(title="Course syllabus")
+    student = UserFactory(role=User.Role.STUDENT)
+    client = APIClient()
+    client.force_authenticate(user=student)
+
+    response = client.get(f"/api/documents/{document.id}/download/")
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"%PDF-1.4 syllabus"
+    assert 'filename="Course-syllabus.pdf"' in response["Content-Disposition"]
+
+    partial = client.get(f"/api/documents/{document.id}/download/", HTTP_RANGE="bytes=0-3")
+    assert partial.status_code == 206
+    assert b"".join(partial.streaming_content) == b"%PDF"
+    assert partial["Content-Range"] == "bytes 0-3/17"
+
+    unsatisfiable = client.get(f"/api/documents/{document.id}/download/", HTTP_RANGE="bytes=99-")
+    assert unsatisfiable.status_code == 416
+
+
+@pytest.mark.django_db
+def test_private_document_download_is_denied_to_other_users(settings):
+    settings.DOCUMENT_DOWNLOAD_OFFLOAD = "nginx"
+    document = DocumentFactory(access_level="PRIVATE")
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(role=User.Role.STUDENT))
+    assert client.get(f"/api/documents/{document.id}/download/").status_code == 404
+
+    client.force_authenticate(user=document.owner)
+    response = client.get(f"/api/documents/{document.id}/download/")
+    assert response.status_code == 200
+    assert response["X-Accel-Redirect"] == f"/protected-media/{document.file.name}"
+
+
+@pytest.mark.django_db
+def test_document_preview_is_generated_after_upload(django_capture_on_commit_callbacks):
+    image = io.BytesIO()
+    Image.new("RGB", (800, 600), "navy").save(image, format="PNG")
+    with django_capture_on_commit_callbacks(execute=True):
+        document = DocumentFactory(file=SimpleUploadedFile("chart.png", image.getvalue()))
+
+    document.refresh_from_db()
+    sha256 = document.blob.sha256
+    assert document.preview.name == f"previews/{sha256[:2]}/{sha256}.jpg"
+    with document.preview.open("rb") as handle:
+        assert Image.open(handle).size == (320, 240)
+
+    client = APIClient()
+    client.force_authenticate(user=document.owner)
+    response = client.get("/api/documents/")
+    assert response.json()["results"][0]["preview"].endswith(document.preview.name)
+
+
+def _docx(text: str) -> bytes:
+    body = io.BytesIO()
+    with zipfile.ZipFile(body, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f"<w:body><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:body></w:document>",
+        )
+    return body.getvalue()
+
+
+@pytest.mark.django_db
+def test_document_search_matches_extracted_text(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        document = DocumentFactory(
+            title="Week 3 handout",
+            file=SimpleUploadedFile(
+                "handout.docx", _docx("Thermodynamics entropy worked examples")
+            ),
+        )
+        DocumentFactory(title="Unrelated")
+    hidden = DocumentFactory(
+        access_level="PRIVATE", file=SimpleUploadedFile("notes.docx", _docx("entropy notes"))
+    )
+    hidden.extracted_text = "entropy notes"
+    hidden.save()
+
+    document.refresh_from_db()
+    assert document.extracted_text == "Thermodynamics entropy worked examples"
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(role=User.Role.STUDENT))
+    response = client.get("/api/documents/", {"search": "entropy"})
+    assert [item["id"] for item in response.json()["results"]] == [str(document.id)]
+
+
+@pytest.mark.django_db
+def test_access_analytics_reads_daily_rollups():
+    department = DepartmentFactory()
+    popular = DocumentFactory(department=department)
+    quiet = DocumentFactory(department=department)
+    viewer = UserFactory(role=User.Role.STUDENT)
+    for document, views in ((popular, 3), (quiet, 1)):
+        for _ in range(views):
+            record_access(document, viewer, "view")
+    rollup_document_access()
+
+    hod = UserFactory(role=User.Role.HOD, department=department)
+    client = APIClient()
+    client.force_authenticate(user=hod)
+    response = client.get("/api/documents/logs/analytics/")
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(row["document"], row["total"]) for row in results] == [
+        (str(popular.id), 3),
+        (str(quiet.id), 1),
+    ]
+
+    by_department = client.get("/api/documents/logs/analytics/", {"group_by": "department"})
+    assert by_department.json()["results"] == [
+        {"department": str(department.id), "department_name": department.name, "total": 4}
+    ]
@@ -0,0 +1,53 @@
+"""Plain-text extraction from uploaded documents for full-text search."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import PurePosixPath
+from xml.etree import ElementTree
+
+from django.conf import settings
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _pdf_text(data: bytes) -> str:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(data)
+    parts = []
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return "\n".join(parts)
+
+
+def _docx_text(data: bytes) -> str:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        text = "".join(node.text or "" for node in paragraph.iter(f"{WORD_NAMESPACE}t"))
+        if text:
+            paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
+EXTRACTORS = {".pdf": _pdf_text, ".docx": _docx_text}
+
+
+def extract_text(field_file) -> str:
+    """Return the searchable text of ``field_file`` or ``""`` for unsupported types."""
+    extractor = EXTRACTORS.get(PurePosixPath(field_file.name).suffix.lower())
+    if extractor is None:
+        return ""
+    with field_file.open("rb") as handle:
+        data = handle.read()
+    text = " ".join(extractor(data).split())
+    return text[: settings.DOCUMENT_SEARCH_MAX_TEXT_LENGTH]
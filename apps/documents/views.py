@@ -1,17 +1,25 @@
 from __future__ import annotations
 
-from django.db.models import Q, QuerySet
+from django.db.models import Q, QuerySet, Sum
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.filters import OrderingFilter
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 
 from apps.users.models import User
 from apps.users.permissions import IsAdminOrHOD
-from .models import Document, DocumentAccessLog, DocumentCategory
+from .access_log import record_access
+from .downloads import download_filename, file_download_response
+from .filters import DocumentSearchFilter
+from .models import Document, DocumentAccessDaily, DocumentAccessLog, DocumentCategory
 from .serializers import (
     DocumentAccessLogSerializer,
+    DocumentAccessStatSerializer,
+    DocumentAnalyticsQuerySerializer,
     DocumentCategorySerializer,
     DocumentSerializer,
 )
@@ -28,13 +36,16 @@ class DocumentCategoryViewSet(viewsets.ModelViewSet):
 class DocumentViewSet(viewsets.ModelViewSet):
     serializer_class = DocumentSerializer
     permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+    filter_backends = (DjangoFilterBackend, DocumentSearchFilter, OrderingFilter)
     filterset_fields = ("department", "access_level", "category")
-    search_fields = ("title", "description")
+    search_fields = ("title", "description", "extracted_text")
 
     def get_queryset(self) -> QuerySet[Document]:
         user = self.request.user
-        qs = Document.objects.select_related("owner", "category", "department")
+        qs = Document.objects.select_related("owner", "category", "department", "blob").defer(
+            "extracted_text", "search_vector"
+        )
         if user.role == User.Role.ADMIN:
             return qs
         if user.role == User.Role.HOD and user.department_id:
@@ -81,13 +92,17 @@ class DocumentViewSet(viewsets.ModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         document = self.get_object()
         serializer = self.get_serializer(document)
-        DocumentAccessLog.objects.create(
-            document=document,
-            user=request.user,
-            action="view",
-        )
+        record_access(document, request.user, "view")
         return Response(serializer.data)
 
+    @action(detail=True, methods=["get"])
+    def download(self, request, *args, **kwargs):
+        document = self.get_object()
+        record_access(document, request.user, "download")
+        return file_download_response(
+            request, document.file, download_filename(document.title, document.file.name)
+        )
+
     def perform_destroy(self, instance):
         self._ensure_owner_or_elevated(instance)
         instance.delete()
@@ -106,3 +121,27 @@ class DocumentAccessLogViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
         if user.role == User.Role.HOD and user.department_id:
             return qs.filter(document__department_id=user.department_id)
         return qs.none()
+
+    @action(detail=False, methods=["get"])
+    def analytics(self, request, *args, **kwargs):
+        """Most accessed documents (or departments) over a date range, read from rollups."""
+        params = DocumentAnalyticsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+        user = request.user
+        qs = DocumentAccessDaily.objects.filter(date__range=(filters["start"], filters["end"]))
+        if user.role == User.Role.HOD:
+            qs = qs.filter(department_id=user.department_id) if user.department_id else qs.none()
+        elif user.role != User.Role.ADMIN:
+            qs = qs.none()
+        if "department" in filters:
+            qs = qs.filter(department_id=filters["department"])
+        if "action" in filters:
+            qs = qs.filter(action=filters["action"])
+        if filters["group_by"] == "document":
+            qs = qs.values("document_id", "document__title", "department_id", "department__name")
+        else:
+            qs = qs.values("department_id", "department__name")
+        stats = qs.annotate(total=Sum("count")).order_by("-total")
+        page = self.paginate_queryset(stats)
+        return self.get_paginated_response(DocumentAccessStatSerializer(page, many=True).data)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from django.contrib import admin
 
-from .models import Announcement, AnnouncementRecipient, Notification
+from .models import Announcement, AnnouncementRecipient, Notification, NotificationArchive
 
 
 class AnnouncementRecipientInline(admin.TabularInline):
@@ -24,3 +24,22 @@ class NotificationAdmin(admin.ModelAdmin):
     list_display = ("user", "subject", "is_read", "created_at")
     list_filter = ("is_read",)
     search_fields = ("subject", "user__email")
+
+
+@admin.register(NotificationArchive)
+class NotificationArchiveAdmin(admin.ModelAdmin):
+    list_display = ("user", "subject", "is_read", "created_at", "archived_at")
+    list_filter = ("is_read",)
+    search_fields = ("subject", "user__email")
+    readonly_fields = (
+        "id",
+        "user",
+        "subject",
+        "body",
+        "is_read",
+        "read_at",
+        "metadata",
+        "emailed_at",
+        "created_at",
+        "archived_at",
+    )
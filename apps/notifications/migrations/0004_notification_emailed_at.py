@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:26
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_emailed(apps, schema_editor):
+    # Existing notifications predate digests; without this the first digest run would
+    # email every user their whole history.
+    for model_name in ("Notification", "NotificationArchive"):
+        model = apps.get_model("notifications", model_name)
+        model.objects.filter(emailed_at__isnull=True).update(emailed_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notification_archive'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='emailed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='emailed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_emailed, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('emailed_at__isnull', True), ('is_read', False)), fields=['user', 'created_at'], name='notification_pending_email_idx'),
+        ),
+    ]
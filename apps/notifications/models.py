@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from apps.common.models import BaseModel, OwnedModel
@@ -9,6 +11,31 @@ from apps.common.models import BaseModel, OwnedModel
 User = settings.AUTH_USER_MODEL
 
 
+class AnnouncementQuerySet(models.QuerySet):
+    def with_delivery_stats(self) -> "AnnouncementQuerySet":
+        """Annotate recipient/delivered/read counts as correlated aggregates.
+
+        Subqueries keep the counts correct when the outer query joins recipients for
+        visibility filtering, and avoid loading recipient rows at all.
+        """
+
+        def _count(**filters):
+            recipients = (
+                AnnouncementRecipient.objects.filter(announcement=OuterRef("pk"), **filters)
+                .order_by()
+                .values("announcement")
+                .annotate(total=Count("pk"))
+                .values("total")
+            )
+            return Coalesce(Subquery(recipients), 0)
+
+        return self.annotate(
+            recipient_count=_count(),
+            delivered_count=_count(delivered_at__isnull=False),
+            read_count=_count(read_at__isnull=False),
+        )
+
+
 class Announcement(OwnedModel):
     class Audience(models.TextChoices):
         ALL = "ALL", "All Users"
@@ -45,6 +72,8 @@ class Announcement(OwnedModel):
 
     recipients = models.ManyToManyField(User, through="AnnouncementRecipient")
 
+    objects = AnnouncementQuerySet.as_manager()
+
     class Meta:
         ordering = ("-created_at",)
 
@@ -81,11 +110,46 @@ class Notification(BaseModel):
     is_read = models.BooleanField(default=False)
     read_at = models.DateTimeField(null=True, blank=True)
     metadata = models.JSONField(default=dict, blank=True)
+    emailed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("user", "is_read", "-created_at")),
+            models.Index(
+                fields=("user", "created_at"),
+                condition=models.Q(emailed_at__isnull=True, is_read=False),
+                name="notification_pending_email_idx",
+            ),
+        ]
 
     def mark_read(self):
         self.is_read = True
         self.read_at = timezone.now()
         self.save(update_fields=["is_read", "read_at"])
+
+
+class NotificationArchive(models.Model):
+    """Cold storage for notifications past the retention window.
+
+    Rows keep the id and timestamps of the original notification so the inbox table
+    only ever holds recent data.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="archived_notifications")
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    is_read = models.BooleanField(default=False)
+    read_at = models.DateTimeField(null=True, blank=True)
+    metadata = models.JSONField(default=dict, blank=True)
+    emailed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("user", "-created_at")),
+            models.Index(fields=("created_at",)),
+        ]
@@ -15,7 +15,9 @@ class AnnouncementRecipientSerializer(serializers.ModelSerializer):
 
 
 class AnnouncementSerializer(serializers.ModelSerializer):
-    recipients = AnnouncementRecipientSerializer(many=True, read_only=True, source="announcement_recipients")
+    recipient_count = serializers.IntegerField(read_only=True)
+    delivered_count = serializers.IntegerField(read_only=True)
+    read_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Announcement
@@ -31,9 +33,11 @@ class AnnouncementSerializer(serializers.ModelSerializer):
             "sent_at",
             "created_at",
             "updated_at",
-            "recipients",
+            "recipient_count",
+            "delivered_count",
+            "read_count",
         )
-        read_only_fields = ("status", "sent_at", "created_at", "updated_at", "recipients")
+        read_only_fields = ("status", "sent_at", "created_at", "updated_at")
 
 
 class AnnouncementCreateSerializer(serializers.ModelSerializer):
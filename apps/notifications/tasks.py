@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from itertools import groupby
+
+import structlog
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import Notification, NotificationArchive
+
+logger = structlog.get_logger(__name__)
+
+
+def _archive_batch(cutoff, batch_size: int) -> int:
+    with transaction.atomic():
+        batch = list(
+            Notification.objects.filter(created_at__lt=cutoff)
+            .order_by("created_at")
+            .select_for_update(skip_locked=True)[:batch_size]
+        )
+        if not batch:
+            return 0
+        NotificationArchive.objects.bulk_create(
+            [
+                NotificationArchive(
+                    id=notification.id,
+                    user_id=notification.user_id,
+                    subject=notification.subject,
+                    body=notification.body,
+                    is_read=notification.is_read,
+                    read_at=notification.read_at,
+                    metadata=notification.metadata,
+                    emailed_at=notification.emailed_at,
+                    created_at=notification.created_at,
+                )
+                for notification in batch
+            ],
+            ignore_conflicts=True,
+        )
+        Notification.objects.filter(id__in=[notification.id for notification in batch]).delete()
+    return len(batch)
+
+
+@shared_task
+def archive_notifications(batch_size: int | None = None, max_batches: int | None = None) -> int:
+    """Move notifications older than the retention window into the archive table."""
+    batch_size = batch_size or settings.NOTIFICATION_ARCHIVE_BATCH_SIZE
+    cutoff = timezone.now() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+    archived = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        moved = _archive_batch(cutoff, batch_size)
+        if not moved:
+            break
+        archived += moved
+        batches += 1
+    logger.info("notifications.archived", count=archived, cutoff=cutoff.isoformat())
+    return archived
+
+
+@shared_task
+def purge_notification_archive(batch_size: int | None = None) -> int:
+    """Delete archived notifications past the archive retention window, in batches."""
+    batch_size = batch_size or settings.NOTIFICATION_ARCHIVE_BATCH_SIZE
+    cutoff = timezone.now() - timedelta(days=settings.NOTIFICATION_ARCHIVE_RETENTION_DAYS)
+    purged = 0
+    while True:
+        ids = list(
+            NotificationArchive.objects.filter(created_at__lt=cutoff)
+            .order_by("created_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        deleted, _ = NotificationArchive.objects.filter(id__in=ids).delete()
+        purged += deleted
+    logger.info("notifications.archive_purged", count=purged, cutoff=cutoff.isoformat())
+    return purged
+
+
+def _build_digest(user, notifications: list[Notification]) -> EmailMessage:
+    max_items = settings.NOTIFICATION_DIGEST_MAX_ITEMS
+    context = {
+        "user": user,
+        "notifications": notifications[:max_items],
+        "remaining": max(len(notifications) - max_items, 0),
+        "total": len(notifications),
+    }
+    subject = (
+        notifications[0].subject
+        if len(notifications) == 1
+        else f"You have {len(notifications)} new notifications"
+    )
+    return EmailMessage(
+        subject=f"[Sentraexam] {subject}",
+        body=render_to_string("notifications/email/digest.txt", context),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+@shared_task
+def send_notification_digests(batch_size: int | None = None) -> int:
+    """Email each user one digest of the unread notifications created since their last digest.
+
+    Pending notifications are loaded per batch of users in a single query and all
+    messages go out over one reused mail connection.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_DIGEST_BATCH_SIZE
+    now = timezone.now()
+    pending = Notification.objects.filter(
+        emailed_at__isnull=True,
+        is_read=False,
+        created_at__lte=now,
+        user__is_active=True,
+    ).exclude(user__email="")
+    user_ids = list(pending.order_by("user_id").values_list("user_id", flat=True).distinct())
+    sent = 0
+    with get_connection() as connection:
+        for start in range(0, len(user_ids), batch_size):
+            chunk = pending.filter(user_id__in=user_ids[start : start + batch_size])
+            notifications = chunk.select_related("user").order_by("user_id", "created_at")
+            messages = []
+            notification_ids = []
+            for _, group in groupby(notifications, key=lambda notification: notification.user_id):
+                group = list(group)
+                messages.append(_build_digest(group[0].user, group))
+                notification_ids.extend(notification.id for notification in group)
+            if not messages:
+                continue
+            connection.send_messages(messages)
+            Notification.objects.filter(id__in=notification_ids).update(emailed_at=now)
+            sent += len(messages)
+    logger.info("notifications.digests_sent", count=sent)
+    return sent
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.notifications.models import (
+    Announcement,
+    AnnouncementRecipient,
+    Notification,
+    NotificationArchive,
+)
+from apps.notifications.tasks import archive_notifications, send_notification_digests
+from apps.users.models import User
+from tests.factories import UserFactory
+
+
+@pytest.mark.django_db
+def test_announcement_list_returns_delivery_stats_instead_of_recipients():
+    admin = UserFactory(role=User.Role.ADMIN)
+    announcement = Announcement.objects.create(
+        title="Exam week", message="Good luck", audience=Announcement.Audience.CUSTOM
+    )
+    students = UserFactory.create_batch(3, role=User.Role.STUDENT)
+    AnnouncementRecipient.objects.bulk_create(
+        [AnnouncementRecipient(announcement=announcement, user=student) for student in students]
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    send_response = client.post(f"/api/notifications/announcements/{announcement.id}/send/")
+    assert send_response.status_code == 200
+    assert send_response.json()["delivered_count"] == 3
+
+    AnnouncementRecipient.objects.filter(user=students[0]).update(read_at=announcement.created_at)
+    response = client.get("/api/notifications/announcements/")
+    assert response.status_code == 200
+    item = response.json()["results"][0]
+    assert "recipients" not in item
+    assert (item["recipient_count"], item["delivered_count"], item["read_count"]) == (3, 3, 1)
+
+
+@pytest.mark.django_db
+def test_announcement_recipients_are_paginated():
+    admin = UserFactory(role=User.Role.ADMIN)
+    announcement = Announcement.objects.create(
+        title="Notice", message="Body", audience=Announcement.Audience.CUSTOM
+    )
+    AnnouncementRecipient.objects.bulk_create(
+        [
+            AnnouncementRecipient(announcement=announcement, user=user)
+            for user in UserFactory.create_batch(12)
+        ]
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    response = client.get(f"/api/notifications/announcements/{announcement.id}/recipients/")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 12
+    assert len(data["results"]) == 10
+    assert data["next"] is not None
+
+
+@pytest.mark.django_db
+def test_archive_notifications_moves_rows_past_retention(settings):
+    settings.NOTIFICATION_RETENTION_DAYS = 30
+    user = UserFactory()
+    old = Notification.objects.create(user=user, subject="Old", body="...")
+    recent = Notification.objects.create(user=user, subject="Recent", body="...")
+    Notification.objects.filter(id=old.id).update(created_at=timezone.now() - timedelta(days=31))
+
+    assert archive_notifications(batch_size=1) == 1
+
+    assert list(Notification.objects.values_list("id", flat=True)) == [recent.id]
+    archived = NotificationArchive.objects.get()
+    assert archived.id == old.id
+    assert archived.subject == "Old"
+
+
+@pytest.mark.django_db
+def test_notification_digest_sends_one_email_per_user():
+    first, second = UserFactory.create_batch(2)
+    Notification.objects.bulk_create(
+        [Notification(user=first, subject=f"Update {n}", body="...") for n in range(3)]
+        + [Notification(user=second, subject="Only one", body="...")]
+        + [Notification(user=second, subject="Already seen", body="...", is_read=True)]
+    )
+
+    assert send_notification_digests() == 2
+    assert "Already seen" not in "".join(message.body for message in mail.outbox)
+
+    assert sorted(message.to[0] for message in mail.outbox) == sorted([first.email, second.email])
+    assert not Notification.objects.filter(emailed_at__isnull=True, is_read=False).exists()
+    assert send_notification_digests() == 0
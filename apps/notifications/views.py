@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from django.db.models import Q, QuerySet
+from django.db.models import Exists, OuterRef, Q, QuerySet
 from django.contrib.auth import get_user_model
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.common.metrics import NOTIFICATIONS_FANNED_OUT
 from apps.users.models import User
 from apps.users.permissions import IsAdmin, IsAdminOrHOD
 from .models import Announcement, AnnouncementRecipient, Notification
@@ -21,7 +22,7 @@ from .serializers import (
 
 
 class AnnouncementViewSet(viewsets.ModelViewSet):
-    queryset = Announcement.objects.select_related("department", "course")
+    queryset = Announcement.objects.select_related("department", "course").with_delivery_stats()
     serializer_class = AnnouncementSerializer
     permission_classes = [IsAuthenticated, IsAdminOrHOD]
     filterset_fields = ("audience", "status", "department", "course")
@@ -39,15 +40,14 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
             return qs
         if user.role == User.Role.HOD and user.department_id:
             return qs.filter(department_id=user.department_id)
+        received = Exists(
+            AnnouncementRecipient.objects.filter(announcement=OuterRef("pk"), user=user)
+        )
         if user.role == User.Role.TEACHER:
             return qs.filter(
-                Q(created_by=user)
-                | Q(department_id=user.department_id)
-                | Q(announcement_recipients__user=user)
-            ).distinct()
-        return qs.filter(
-            Q(announcement_recipients__user=user) | Q(audience=Announcement.Audience.ALL)
-        ).distinct()
+                Q(created_by=user) | Q(department_id=user.department_id) | received
+            )
+        return qs.filter(received | Q(audience=Announcement.Audience.ALL))
 
     def get_serializer_class(self):
         if self.action in {"create", "update", "partial_update"}:
@@ -99,10 +99,26 @@ class AnnouncementViewSet(viewsets.ModelViewSet):
             for recipient in recipient_qs.select_related("user")
         ]
         Notification.objects.bulk_create(notifications)
+        NOTIFICATIONS_FANNED_OUT.inc(len(notifications))
         announcement.mark_sent()
         recipient_qs.update(delivered_at=announcement.sent_at)
+        announcement = self.get_queryset().get(pk=announcement.pk)
         return Response(AnnouncementSerializer(announcement, context={"request": request}).data)
 
+    @action(detail=True, methods=["get"], permission_classes=[IsAuthenticated, IsAdminOrHOD])
+    def recipients(self, request, *args, **kwargs):
+        announcement = self.get_object()
+        queryset = (
+            AnnouncementRecipient.objects.filter(announcement=announcement)
+            .select_related("user")
+            .order_by("user__email")
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = AnnouncementRecipientSerializer(
+            page, many=True, context=self.get_serializer_context()
+        )
+        return self.get_paginated_response(serializer.data)
+
 
 class NotificationViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     serializer_class = NotificationSerializer
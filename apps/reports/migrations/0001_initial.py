@@ -0,0 +1,123 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:58
+
+from django.db import migrations, models
+
+from apps.common.db import NonPostgresSQL, PostgresOnlySQL
+
+# Mirrors apps.reports.performance.compute_course_performance (PASS_PERCENT = 50).
+COURSE_PERFORMANCE_VIEW = '''
+    CREATE MATERIALIZED VIEW "reports_course_performance" AS
+    WITH scheduled AS (
+        SELECT
+            a."id",
+            a."course_id",
+            c."department_id",
+            a."assessment_type",
+            a."total_marks",
+            (
+                SELECT t."id" FROM "academic_calendar_academicterm" t
+                WHERE (a."scheduled_at" AT TIME ZONE 'UTC')::date
+                    BETWEEN t."start_date" AND t."end_date"
+                ORDER BY t."start_date"
+                LIMIT 1
+            ) AS "academic_term_id"
+        FROM "assessments_assessment" a
+        JOIN "courses_course" c ON c."id" = a."course_id"
+        WHERE a."scheduled_at" IS NOT NULL
+            AND a."status" IN ('APPROVED', 'SCHEDULED', 'IN_PROGRESS', 'COMPLETED')
+    ),
+    enrolled AS (
+        SELECT "course_id", count(*) AS "students"
+        FROM "courses_courseenrollment"
+        WHERE "status" <> 'DROPPED'
+        GROUP BY "course_id"
+    )
+    SELECT
+        s."course_id"::text || ':' || coalesce(s."academic_term_id"::text, '-')
+            || ':' || s."assessment_type" AS "id",
+        s."course_id",
+        s."department_id",
+        s."academic_term_id",
+        s."assessment_type",
+        count(DISTINCT s."id")::integer AS "assessment_count",
+        coalesce(max(e."students"), 0)::integer AS "enrolled_count",
+        count(sub."id")::integer AS "submission_count",
+        (count(sub."id") FILTER (WHERE sub."status" = 'GRADED'))::integer AS "graded_count",
+        (
+            count(sub."id") FILTER (
+                WHERE sub."status" = 'GRADED' AND sub."score" * 100 >= s."total_marks" * 50
+            )
+        )::integer AS "pass_count",
+        (
+            avg(sub."score" * 100.0 / nullif(s."total_marks", 0))
+                FILTER (WHERE sub."status" = 'GRADED')
+        )::double precision AS "average_percent"
+    FROM scheduled s
+    LEFT JOIN "assessments_assessmentsubmission" sub ON sub."assessment_id" = s."id"
+    LEFT JOIN enrolled e ON e."course_id" = s."course_id"
+    GROUP BY s."course_id", s."department_id", s."academic_term_id", s."assessment_type"
+    WITH DATA;
+    -- REFRESH ... CONCURRENTLY needs a unique index.
+    CREATE UNIQUE INDEX "reports_course_performance_id" ON "reports_course_performance" ("id");
+    CREATE INDEX "reports_course_performance_dept_term"
+        ON "reports_course_performance" ("department_id", "academic_term_id");
+'''
+
+COURSE_PERFORMANCE_TABLE = '''
+    CREATE TABLE "reports_course_performance" (
+        "id" varchar(100) NOT NULL PRIMARY KEY,
+        "course_id" char(32) NOT NULL,
+        "department_id" char(32) NULL,
+        "academic_term_id" char(32) NULL,
+        "assessment_type" varchar(20) NOT NULL,
+        "assessment_count" integer NOT NULL,
+        "enrolled_count" integer NOT NULL,
+        "submission_count" integer NOT NULL,
+        "graded_count" integer NOT NULL,
+        "pass_count" integer NOT NULL,
+        "average_percent" real NULL
+    );
+    CREATE INDEX "reports_course_performance_dept_term"
+        ON "reports_course_performance" ("department_id", "academic_term_id");
+'''
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('academic_calendar', '0008_agenda_indexes'),
+        ('assessments', '0008_submission_ungraded_index'),
+        ('courses', '0002_initial'),
+        ('departments', '0003_department_member_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoursePerformance',
+            fields=[
+                ('id', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('assessment_type', models.CharField(choices=[('EXAM', 'Exam'), ('QUIZ', 'Quiz'), ('ASSIGNMENT', 'Assignment'), ('PROJECT', 'Project')], max_length=20)),
+                ('assessment_count', models.IntegerField()),
+                ('enrolled_count', models.IntegerField()),
+                ('submission_count', models.IntegerField()),
+                ('graded_count', models.IntegerField()),
+                ('pass_count', models.IntegerField()),
+                ('average_percent', models.FloatField(null=True)),
+            ],
+            options={
+                'db_table': 'reports_course_performance',
+                'ordering': ('course_id', 'assessment_type'),
+                'managed': False,
+            },
+        ),
+        PostgresOnlySQL(
+            sql=COURSE_PERFORMANCE_VIEW,
+            reverse_sql='DROP MATERIALIZED VIEW IF EXISTS "reports_course_performance";',
+        ),
+        NonPostgresSQL(
+            sql=COURSE_PERFORMANCE_TABLE,
+            reverse_sql='DROP TABLE IF EXISTS "reports_course_performance";',
+        ),
+    ]
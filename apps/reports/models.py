@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from django.db import models
+
+from apps.assessments.models import Assessment
+
+
+class CoursePerformance(models.Model):
+    """Assessment results per course, academic term and assessment type.
+
+    On PostgreSQL this is a materialized view (migration 0001) refreshed by
+    ``performance.refresh_course_performance``; elsewhere it is a plain table that the
+    refresh recomputes.
+    """
+
+    id = models.CharField(max_length=100, primary_key=True)
+    course = models.ForeignKey(
+        "courses.Course", on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    department = models.ForeignKey(
+        "departments.Department",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    academic_term = models.ForeignKey(
+        "academic_calendar.AcademicTerm",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        related_name="+",
+    )
+    assessment_type = models.CharField(max_length=20, choices=Assessment.AssessmentType.choices)
+    assessment_count = models.IntegerField()
+    enrolled_count = models.IntegerField()
+    submission_count = models.IntegerField()
+    graded_count = models.IntegerField()
+    pass_count = models.IntegerField()
+    average_percent = models.FloatField(null=True)
+
+    class Meta:
+        managed = False
+        db_table = "reports_course_performance"
+        ordering = ("course_id", "assessment_type")
+
+    @property
+    def submission_rate(self) -> float | None:
+        expected = self.assessment_count * self.enrolled_count
+        return self.submission_count / expected if expected else None
+
+    @property
+    def pass_rate(self) -> float | None:
+        return self.pass_count / self.graded_count if self.graded_count else None
@@ -0,0 +1,117 @@
+"""Course performance reporting.
+
+``compute_course_performance`` is the ORM version of the ``reports_course_performance``
+materialized view SQL in migration 0001; keep the two in step. PostgreSQL refreshes the
+view concurrently, other backends replace the table contents with the computed rows.
+"""
+
+from __future__ import annotations
+
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Avg, Count, F, FloatField, OuterRef, Q, Subquery
+from django.db.models.functions import Cast, TruncDate
+from django.db.models.lookups import GreaterThanOrEqual
+
+from apps.academic_calendar.models import AcademicTerm
+from apps.assessments.models import Assessment, AssessmentSubmission
+from apps.common.db import is_postgres
+from apps.courses.models import CourseEnrollment
+from .models import CoursePerformance
+
+PASS_PERCENT = 50
+
+REPORTED_STATUSES = (
+    Assessment.Status.APPROVED,
+    Assessment.Status.SCHEDULED,
+    Assessment.Status.IN_PROGRESS,
+    Assessment.Status.COMPLETED,
+)
+
+REFRESH_PENDING_KEY = "reports:performance-refresh-pending"
+
+
+def performance_row_id(course_id, academic_term_id, assessment_type: str) -> str:
+    return f"{course_id}:{academic_term_id or '-'}:{assessment_type}"
+
+
+def compute_course_performance() -> list[CoursePerformance]:
+    """Aggregate submissions per (course, term, assessment type) from the live tables."""
+    term = (
+        AcademicTerm.objects.filter(
+            start_date__lte=OuterRef("scheduled_date"), end_date__gte=OuterRef("scheduled_date")
+        )
+        .order_by("start_date")
+        .values("id")[:1]
+    )
+    graded = Q(submissions__status=AssessmentSubmission.SubmissionStatus.GRADED)
+    passed = GreaterThanOrEqual(
+        F("submissions__score") * 100, F("total_marks") * PASS_PERCENT
+    )
+    groups = (
+        Assessment.objects.filter(scheduled_at__isnull=False, status__in=REPORTED_STATUSES)
+        .annotate(
+            scheduled_date=TruncDate("scheduled_at", tzinfo=dt_timezone.utc),
+            term_id=Subquery(term),
+        )
+        .values("course_id", "course__department_id", "term_id", "assessment_type")
+        .annotate(
+            assessments=Count("id", distinct=True),
+            submitted=Count("submissions"),
+            graded=Count("submissions", filter=graded),
+            passed=Count("submissions", filter=graded & passed),
+            average=Avg(
+                Cast("submissions__score", FloatField()) * 100.0 / F("total_marks"),
+                filter=graded,
+            ),
+        )
+        .order_by()
+    )
+    enrolled = dict(
+        CourseEnrollment.objects.exclude(status=CourseEnrollment.EnrollmentStatus.DROPPED)
+        .values("course_id")
+        .annotate(total=Count("id"))
+        .values_list("course_id", "total")
+        .order_by()
+    )
+    return [
+        CoursePerformance(
+            id=performance_row_id(row["course_id"], row["term_id"], row["assessment_type"]),
+            course_id=row["course_id"],
+            department_id=row["course__department_id"],
+            academic_term_id=row["term_id"],
+            assessment_type=row["assessment_type"],
+            assessment_count=row["assessments"],
+            enrolled_count=enrolled.get(row["course_id"], 0),
+            submission_count=row["submitted"],
+            graded_count=row["graded"],
+            pass_count=row["passed"],
+            average_percent=row["average"],
+        )
+        for row in groups
+    ]
+
+
+def refresh_course_performance() -> None:
+    table = CoursePerformance._meta.db_table
+    if is_postgres(connection):
+        with connection.cursor() as cursor:
+            cursor.execute(f'REFRESH MATERIALIZED VIEW CONCURRENTLY "{table}"')
+        return
+    rows = compute_course_performance()
+    with transaction.atomic():
+        CoursePerformance.objects.all().delete()
+        CoursePerformance.objects.bulk_create(rows, batch_size=1000)
+
+
+def request_performance_refresh() -> None:
+    """Schedule one refresh for a burst of grading instead of one per graded submission."""
+    delay = settings.REPORTS_REFRESH_DEBOUNCE_SECONDS
+    if not cache.add(REFRESH_PENDING_KEY, True, delay * 2):
+        return
+    from .tasks import refresh_performance_reports
+
+    transaction.on_commit(lambda: refresh_performance_reports.apply_async(countdown=delay))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from rest_framework import serializers
+
+from .models import CoursePerformance
+
+
+class CoursePerformanceSerializer(serializers.ModelSerializer):
+    course_code = serializers.CharField(source="course.code", read_only=True)
+    course_title = serializers.CharField(source="course.title", read_only=True)
+    academic_term_name = serializers.CharField(source="academic_term.name", read_only=True)
+    submission_rate = serializers.FloatField(read_only=True)
+    pass_rate = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = CoursePerformance
+        fields = (
+            "id",
+            "course",
+            "course_code",
+            "course_title",
+            "department",
+            "academic_term",
+            "academic_term_name",
+            "assessment_type",
+            "assessment_count",
+            "enrolled_count",
+            "submission_count",
+            "graded_count",
+            "pass_count",
+            "average_percent",
+            "submission_rate",
+            "pass_rate",
+        )
+        read_only_fields = fields
+
+
+class PerformanceSummarySerializer(serializers.Serializer):
+    assessment_type = serializers.CharField()
+    courses = serializers.IntegerField()
+    assessment_count = serializers.IntegerField()
+    expected_submissions = serializers.IntegerField()
+    submission_count = serializers.IntegerField()
+    graded_count = serializers.IntegerField()
+    pass_count = serializers.IntegerField()
+    average_percent = serializers.FloatField(allow_null=True)
+    submission_rate = serializers.SerializerMethodField()
+    pass_rate = serializers.SerializerMethodField()
+
+    def get_submission_rate(self, row: dict) -> float | None:
+        expected = row["expected_submissions"]
+        return row["submission_count"] / expected if expected else None
+
+    def get_pass_rate(self, row: dict) -> float | None:
+        return row["pass_count"] / row["graded_count"] if row["graded_count"] else None
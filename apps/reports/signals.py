@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.assessments.models import AssessmentSubmission
+from .performance import request_performance_refresh
+
+
+@receiver(post_save, sender=AssessmentSubmission, dispatch_uid="reports_refresh_on_grading")
+def refresh_after_grading(sender, instance: AssessmentSubmission, **kwargs):
+    if instance.status == AssessmentSubmission.SubmissionStatus.GRADED:
+        request_performance_refresh()
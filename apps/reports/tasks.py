@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from time import perf_counter
+
+import structlog
+from celery import shared_task
+from django.core.cache import cache
+
+from .performance import REFRESH_PENDING_KEY, refresh_course_performance
+
+logger = structlog.get_logger(__name__)
+
+
+@shared_task
+def refresh_performance_reports() -> None:
+    # Grading that lands while the refresh runs schedules the next one.
+    cache.delete(REFRESH_PENDING_KEY)
+    started = perf_counter()
+    refresh_course_performance()
+    logger.info(
+        "reports.performance_refreshed", elapsed_ms=round((perf_counter() - started) * 1000)
+    )
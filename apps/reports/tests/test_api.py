@@ -0,0 +1,104 @@
+from datetime import timedelta
+from importlib import import_module
+
+import pytest
+import sqlparse
+from django.db import connection
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.assessments.models import Assessment, AssessmentSubmission
+from apps.reports.performance import compute_course_performance, refresh_course_performance
+from apps.users.models import User
+from tests.factories import (
+    AcademicTermFactory,
+    AssessmentFactory,
+    CourseEnrollmentFactory,
+    CourseFactory,
+    DepartmentFactory,
+    UserFactory,
+)
+
+
+@pytest.fixture
+def performance_table(db):
+    # Unmanaged (a materialized view on Postgres): build the fallback table from the
+    # migration's DDL inside the test transaction.
+    migration = import_module("apps.reports.migrations.0001_initial")
+    with connection.cursor() as cursor:
+        for statement in sqlparse.split(migration.COURSE_PERFORMANCE_TABLE):
+            cursor.execute(statement)
+
+
+def _graded(assessment, score, status=AssessmentSubmission.SubmissionStatus.GRADED):
+    student = UserFactory(role=User.Role.STUDENT)
+    CourseEnrollmentFactory(course=assessment.course, student=student)
+    AssessmentSubmission.objects.create(
+        assessment=assessment, student=student, status=status, score=score
+    )
+
+
+@pytest.mark.django_db
+def test_compute_course_performance_groups_by_course_term_and_type():
+    term = AcademicTermFactory()
+    course = CourseFactory()
+    when = timezone.now() + timedelta(days=1)
+    exam = AssessmentFactory(
+        course=course, status=Assessment.Status.COMPLETED, scheduled_at=when, total_marks=40
+    )
+    _graded(exam, 30)
+    _graded(exam, 19)  # 47.5%: below the pass mark
+    _graded(exam, None, status=AssessmentSubmission.SubmissionStatus.SUBMITTED)
+    CourseEnrollmentFactory(course=course)  # enrolled, never submitted
+    AssessmentFactory(course=course, status=Assessment.Status.DRAFT, scheduled_at=when)
+
+    [row] = compute_course_performance()
+
+    assert (row.course_id, row.academic_term_id, row.assessment_type) == (
+        course.id,
+        term.id,
+        Assessment.AssessmentType.EXAM,
+    )
+    assert row.assessment_count == 1
+    assert row.enrolled_count == 4
+    assert (row.submission_count, row.graded_count, row.pass_count) == (3, 2, 1)
+    assert row.average_percent == pytest.approx((75 + 47.5) / 2)
+    assert row.submission_rate == pytest.approx(3 / 4)
+    assert row.pass_rate == pytest.approx(1 / 2)
+
+
+@pytest.mark.django_db
+def test_hod_performance_report_is_limited_to_department(performance_table):
+    department = DepartmentFactory()
+    when = timezone.now() + timedelta(days=1)
+    AcademicTermFactory()
+    own = AssessmentFactory(
+        course=CourseFactory(department=department),
+        status=Assessment.Status.COMPLETED,
+        scheduled_at=when,
+    )
+    other = AssessmentFactory(status=Assessment.Status.COMPLETED, scheduled_at=when)
+    _graded(own, 80)
+    _graded(other, 10)
+    refresh_course_performance()
+    client = APIClient()
+    client.force_authenticate(user=UserFactory(role=User.Role.HOD, department=department))
+
+    rows = client.get("/api/reports/course-performance/").json()["results"]
+    summary = client.get("/api/reports/course-performance/summary/").json()
+
+    assert [row["course"] for row in rows] == [str(own.course_id)]
+    assert summary == [
+        {
+            "assessment_type": "EXAM",
+            "courses": 1,
+            "assessment_count": 1,
+            "expected_submissions": 1,
+            "submission_count": 1,
+            "graded_count": 1,
+            "pass_count": 1,
+            "average_percent": 80.0,
+            "submission_rate": 1.0,
+            "pass_rate": 1.0,
+        }
+    ]
@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import CoursePerformanceViewSet
+
+router = DefaultRouter()
+router.register("course-performance", CoursePerformanceViewSet, basename="course-performance")
+
+urlpatterns = router.urls
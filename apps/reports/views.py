@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from django.db.models import Count, F, FloatField, QuerySet, Sum
+from django.db.models.functions import Cast
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.users.models import User
+from apps.users.permissions import IsAdminOrHOD
+from .models import CoursePerformance
+from .serializers import CoursePerformanceSerializer, PerformanceSummarySerializer
+
+
+class CoursePerformanceViewSet(viewsets.ReadOnlyModelViewSet):
+    """Precomputed results per course, term and assessment type (refreshed periodically)."""
+
+    serializer_class = CoursePerformanceSerializer
+    permission_classes = [IsAuthenticated, IsAdminOrHOD]
+    filterset_fields = ("department", "academic_term", "course", "assessment_type")
+
+    def get_queryset(self) -> QuerySet[CoursePerformance]:
+        user = self.request.user
+        qs = CoursePerformance.objects.select_related("course", "academic_term")
+        if user.role == User.Role.ADMIN:
+            return qs
+        if user.role == User.Role.HOD and user.department_id:
+            return qs.filter(department_id=user.department_id)
+        return qs.none()
+
+    @action(detail=False, methods=["get"])
+    def summary(self, request, *args, **kwargs):
+        """Totals per assessment type over the filtered rows (department or institution)."""
+        rows = (
+            self.filter_queryset(self.get_queryset())
+            .order_by()
+            .values("assessment_type")
+            .annotate(
+                # Row-level products first: the totals below shadow the column names.
+                expected_submissions=Sum(F("assessment_count") * F("enrolled_count")),
+                weighted_average=Sum(F("average_percent") * Cast("graded_count", FloatField())),
+                courses=Count("course", distinct=True),
+                assessment_count=Sum("assessment_count"),
+                submission_count=Sum("submission_count"),
+                graded_count=Sum("graded_count"),
+                pass_count=Sum("pass_count"),
+            )
+            .order_by("assessment_type")
+        )
+        summary = [
+            {
+                **row,
+                "average_percent": (
+                    row["weighted_average"] / row["graded_count"] if row["graded_count"] else None
+                ),
+            }
+            for row in rows
+        ]
+        return Response(PerformanceSummarySerializer(summary, many=True).data)
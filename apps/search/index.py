@@ -0,0 +1,254 @@
+"""Global search over courses, assessments, documents and users.
+
+Every searchable object has one ``SearchEntry`` row. ``signals`` upsert or delete the
+row when the object changes; code that writes in bulk calls ``index_objects`` or
+``update_entries`` itself, and ``rebuild_index`` recreates everything.
+
+On PostgreSQL a search matches the GIN-indexed ``search_vector`` (web-search syntax) or
+the trigram-indexed title (typos, partial words) and is ranked by both; elsewhere it
+falls back to ``icontains``. Permissions are applied with the same rules as the list
+endpoints, expressed over the entry columns, so the whole search is one query.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+)
+from django.db import connection
+from django.db.models import Case, F, FloatField, Model, Q, QuerySet, Value, When
+
+from apps.assessments.models import Assessment
+from apps.common.db import is_postgres
+from apps.courses.models import Course
+from apps.courses.visibility import visibility_for
+from apps.documents.models import Document
+from apps.users.models import User
+from .models import SearchEntry
+
+Kind = SearchEntry.Kind
+
+# Columns rewritten when an existing entry is upserted.
+ENTRY_FIELDS = (
+    "title",
+    "subtitle",
+    "body",
+    "department",
+    "course",
+    "owner",
+    "status",
+    "access_level",
+    "updated_at",
+)
+
+STUDENT_ASSESSMENT_STATUSES = (
+    Assessment.Status.APPROVED,
+    Assessment.Status.SCHEDULED,
+    Assessment.Status.IN_PROGRESS,
+    Assessment.Status.COMPLETED,
+)
+
+
+def _course_entry(course: Course) -> SearchEntry:
+    return SearchEntry(
+        kind=Kind.COURSE,
+        object_id=str(course.pk),
+        title=course.title,
+        subtitle=course.code,
+        body=course.description,
+        department_id=course.department_id,
+        # A course is its own course, so enrollment filters apply to it unchanged.
+        course_id=course.pk,
+        owner_id=course.assigned_teacher_id,
+        status=course.status,
+    )
+
+
+def _assessment_entry(assessment: Assessment) -> SearchEntry:
+    return SearchEntry(
+        kind=Kind.ASSESSMENT,
+        object_id=str(assessment.pk),
+        title=assessment.title,
+        subtitle=f"{assessment.course.code} · {assessment.get_assessment_type_display()}",
+        body=assessment.description,
+        department_id=assessment.course.department_id,
+        course_id=assessment.course_id,
+        owner_id=assessment.created_by_id,
+        status=assessment.status,
+    )
+
+
+def _document_entry(document: Document) -> SearchEntry:
+    return SearchEntry(
+        kind=Kind.DOCUMENT,
+        object_id=str(document.pk),
+        title=document.title,
+        subtitle=document.get_access_level_display(),
+        body=document.description,
+        department_id=document.department_id,
+        owner_id=document.owner_id,
+        access_level=document.access_level,
+    )
+
+
+def _user_entry(user: User) -> SearchEntry:
+    return SearchEntry(
+        kind=Kind.USER,
+        object_id=str(user.pk),
+        title=user.get_full_name() or user.email,
+        subtitle=user.email,
+        department_id=user.department_id,
+        owner_id=user.pk,
+        status=user.role,
+    )
+
+
+ENTRY_BUILDERS = {
+    Course: (Kind.COURSE, _course_entry),
+    Assessment: (Kind.ASSESSMENT, _assessment_entry),
+    Document: (Kind.DOCUMENT, _document_entry),
+    User: (Kind.USER, _user_entry),
+}
+
+
+def indexed_querysets() -> list[QuerySet]:
+    """Everything that belongs in the index, loaded with what the builders read."""
+    return [
+        Course.objects.all(),
+        Assessment.objects.select_related("course"),
+        Document.objects.defer("extracted_text", "search_vector"),
+        User.objects.all(),
+    ]
+
+
+def entry_search_vector():
+    config = settings.SEARCH_CONFIG
+    return (
+        SearchVector("title", weight="A", config=config)
+        + SearchVector("subtitle", weight="B", config=config)
+        + SearchVector("body", weight="C", config=config)
+    )
+
+
+def update_entries(kind: str, object_ids: Iterable, **fields) -> int:
+    """Apply a bulk write's field changes to existing entries (no text is re-read)."""
+    return SearchEntry.objects.filter(
+        kind=kind, object_id__in=[str(object_id) for object_id in object_ids]
+    ).update(**fields)
+
+
+def index_objects(objects: Iterable[Model]) -> int:
+    """Upsert the entries for ``objects`` (any mix of indexed models)."""
+    entries = []
+    for obj in objects:
+        kind, build = ENTRY_BUILDERS[type(obj)]
+        entries.append(build(obj))
+    if not entries:
+        return 0
+    SearchEntry.objects.bulk_create(
+        entries,
+        update_conflicts=True,
+        unique_fields=("kind", "object_id"),
+        update_fields=ENTRY_FIELDS,
+        batch_size=500,
+    )
+    if is_postgres(connection):
+        object_ids = defaultdict(list)
+        for entry in entries:
+            object_ids[entry.kind].append(entry.object_id)
+        for kind, ids in object_ids.items():
+            update_entries(kind, ids, search_vector=entry_search_vector())
+    return len(entries)
+
+
+def remove_object(obj: Model) -> None:
+    kind, _ = ENTRY_BUILDERS[type(obj)]
+    SearchEntry.objects.filter(kind=kind, object_id=str(obj.pk)).delete()
+
+
+def rebuild_index() -> int:
+    """Drop every entry and index all objects again."""
+    SearchEntry.objects.all().delete()
+    return sum(
+        index_objects(queryset.iterator(chunk_size=500)) for queryset in indexed_querysets()
+    )
+
+
+def _document_filter(user: User) -> Q:
+    return (
+        Q(owner_id=user.pk)
+        | Q(access_level=Document.AccessLevel.INSTITUTION)
+        | Q(access_level=Document.AccessLevel.DEPARTMENT, department_id=user.department_id)
+    )
+
+
+def visible_entries(user: User) -> Q:
+    """The entries ``user`` may see; mirrors each kind's list endpoint."""
+    if user.role == User.Role.ADMIN:
+        return Q()
+    if user.role == User.Role.HOD:
+        own_documents = Q(kind=Kind.DOCUMENT, owner_id=user.pk)
+        if not user.department_id:
+            return own_documents
+        return Q(department_id=user.department_id) | own_documents
+    if user.role == User.Role.TEACHER:
+        visible = visibility_for(user)
+        return (
+            # Courses taught, assessments created, documents owned, and the user itself.
+            Q(owner_id=user.pk)
+            | Q(kind=Kind.COURSE, status=Course.Status.ACTIVE)
+            | Q(kind=Kind.ASSESSMENT, course_id__in=visible.teaching_course_ids)
+            | (Q(kind=Kind.DOCUMENT) & _document_filter(user))
+        )
+    if user.role == User.Role.STUDENT:
+        visible = visibility_for(user)
+        department_courses = Q(status=Course.Status.ACTIVE)
+        assessments = Q(kind=Kind.ASSESSMENT, status__in=STUDENT_ASSESSMENT_STATUSES)
+        if visible.department_id:
+            department_courses &= Q(department_id=visible.department_id)
+            assessments &= Q(course_id__in=visible.enrolled_course_ids) | Q(
+                department_id=visible.department_id
+            )
+        return (
+            Q(kind=Kind.COURSE)
+            & (Q(course_id__in=visible.enrolled_course_ids) | department_courses)
+            | assessments
+            | (Q(kind=Kind.DOCUMENT) & _document_filter(user))
+            | Q(kind=Kind.USER, owner_id=user.pk)
+        )
+    return Q(pk__in=[])
+
+
+def search_entries(
+    user: User, terms: str, *, kinds: Iterable[str] = (), limit: int | None = None
+) -> QuerySet[SearchEntry]:
+    """Entries matching ``terms`` that ``user`` may see, best match first."""
+    qs = SearchEntry.objects.filter(visible_entries(user)).defer("body", "search_vector")
+    kinds = list(kinds)
+    if kinds:
+        qs = qs.filter(kind__in=kinds)
+    if is_postgres(connection):
+        query = SearchQuery(terms, search_type="websearch", config=settings.SEARCH_CONFIG)
+        qs = qs.filter(Q(search_vector=query) | Q(title__trigram_similar=terms)).annotate(
+            rank=SearchRank(F("search_vector"), query) + TrigramSimilarity("title", terms)
+        )
+    else:
+        qs = qs.filter(
+            Q(title__icontains=terms) | Q(subtitle__icontains=terms) | Q(body__icontains=terms)
+        ).annotate(
+            rank=Case(
+                When(title__iexact=terms, then=Value(1.0)),
+                When(title__istartswith=terms, then=Value(0.75)),
+                When(title__icontains=terms, then=Value(0.5)),
+                default=Value(0.25),
+                output_field=FloatField(),
+            )
+        )
+    return qs.order_by("-rank", "title")[: limit or settings.SEARCH_DEFAULT_RESULTS]
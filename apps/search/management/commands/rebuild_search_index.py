@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.search.index import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the global search index from courses, assessments, documents and users."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            indexed = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} object(s)."))
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:02
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+from apps.common.db import PostgresOnlySQL
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('courses', '0002_initial'),
+        ('departments', '0003_department_member_counts'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('COURSE', 'Course'), ('ASSESSMENT', 'Assessment'), ('DOCUMENT', 'Document'), ('USER', 'User')], max_length=16)),
+                ('object_id', models.CharField(max_length=64)),
+                ('title', models.CharField(max_length=255)),
+                ('subtitle', models.CharField(blank=True, max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('status', models.CharField(blank=True, max_length=32)),
+                ('access_level', models.CharField(blank=True, max_length=32)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('course', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='courses.course')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='departments.department')),
+                ('owner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'search entries',
+                'ordering': ('title',),
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='search_entry_object_unique')],
+            },
+        ),
+        PostgresOnlySQL(
+            sql='''
+                CREATE INDEX "search_entry_vector_gin"
+                    ON "search_searchentry" USING gin ("search_vector");
+                CREATE INDEX "search_entry_title_trgm"
+                    ON "search_searchentry" USING gin ("title" gin_trgm_ops);
+            ''',
+            reverse_sql='''
+                DROP INDEX IF EXISTS "search_entry_title_trgm";
+                DROP INDEX IF EXISTS "search_entry_vector_gin";
+            ''',
+        ),
+    ]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+
+from apps.common.models import BaseModel
+
+
+class SearchEntry(BaseModel):
+    """One searchable object (course, assessment, document or user).
+
+    Besides the searchable text, each entry carries the columns the permission filter
+    needs (department, course, owner, status, access level), so a search across every
+    kind is a single query on this table. Entries are kept current by ``signals``; the
+    ``rebuild_search_index`` command rebuilds them after bulk writes.
+    """
+
+    class Kind(models.TextChoices):
+        COURSE = "COURSE", "Course"
+        ASSESSMENT = "ASSESSMENT", "Assessment"
+        DOCUMENT = "DOCUMENT", "Document"
+        USER = "USER", "User"
+
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    object_id = models.CharField(max_length=64)
+    title = models.CharField(max_length=255)
+    subtitle = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    department = models.ForeignKey(
+        "departments.Department",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    course = models.ForeignKey(
+        "courses.Course",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    status = models.CharField(max_length=32, blank=True)
+    access_level = models.CharField(max_length=32, blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        ordering = ("title",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=("kind", "object_id"), name="search_entry_object_unique"
+            ),
+        ]
+        verbose_name_plural = "search entries"
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()}: {self.title}"
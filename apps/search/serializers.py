@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from django.conf import settings
+from rest_framework import serializers
+
+from .models import SearchEntry
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(min_length=2, max_length=200)
+    kind = serializers.ListField(
+        child=serializers.ChoiceField(choices=SearchEntry.Kind.choices), required=False
+    )
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.SEARCH_MAX_RESULTS, required=False
+    )
+
+
+class SearchHitSerializer(serializers.ModelSerializer):
+    id = serializers.CharField(source="object_id")
+    rank = serializers.FloatField()
+
+    class Meta:
+        model = SearchEntry
+        fields = ("kind", "id", "title", "subtitle", "rank")
+        read_only_fields = fields
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.assessments.models import Assessment
+from apps.courses.models import Course
+from apps.documents.models import Document
+from apps.users.models import User
+from .index import index_objects, remove_object
+
+# Saves limited to other fields (``last_login``, previews, ...) leave the entry as is.
+INDEXED_FIELDS = {
+    Course: {"code", "title", "description", "department", "assigned_teacher", "status"},
+    Assessment: {"title", "description", "assessment_type", "course", "created_by", "status"},
+    Document: {"title", "description", "department", "owner", "access_level"},
+    User: {"email", "first_name", "last_name", "department", "role"},
+}
+
+
+def _changes_entry(sender, update_fields) -> bool:
+    return update_fields is None or bool(INDEXED_FIELDS[sender] & set(update_fields))
+
+
+@receiver(post_save, sender=Course, dispatch_uid="search_index_course")
+def index_course(sender, instance: Course, created: bool, update_fields=None, **kwargs):
+    if not _changes_entry(sender, update_fields):
+        return
+    # Assessment entries carry the course code and department.
+    index_objects(
+        [instance]
+        if created
+        else [instance, *instance.assessments.select_related("course")]
+    )
+
+
+@receiver(post_save, sender=Assessment, dispatch_uid="search_index_assessment")
+@receiver(post_save, sender=Document, dispatch_uid="search_index_document")
+@receiver(post_save, sender=User, dispatch_uid="search_index_user")
+def index_saved_object(sender, instance, update_fields=None, **kwargs):
+    if _changes_entry(sender, update_fields):
+        index_objects([instance])
+
+
+@receiver(post_delete, sender=Course, dispatch_uid="search_unindex_course")
+@receiver(post_delete, sender=Assessment, dispatch_uid="search_unindex_assessment")
+@receiver(post_delete, sender=Document, dispatch_uid="search_unindex_document")
+@receiver(post_delete, sender=User, dispatch_uid="search_unindex_user")
+def unindex_deleted_object(sender, instance, **kwargs):
+    remove_object(instance)
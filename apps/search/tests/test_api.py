@@ -0,0 +1,66 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.assessments.models import Assessment
+from apps.documents.models import Document
+from apps.search.models import SearchEntry
+from apps.users.models import User
+from tests.factories import (
+    AssessmentFactory,
+    CourseEnrollmentFactory,
+    CourseFactory,
+    DepartmentFactory,
+    DocumentFactory,
+    UserFactory,
+)
+
+
+@pytest.mark.django_db
+def test_search_returns_visible_hits_across_kinds(django_assert_num_queries):
+    department = DepartmentFactory()
+    student = UserFactory(role=User.Role.STUDENT, department=department)
+    course = CourseFactory(department=department, code="ALG101", title="Linear algebra")
+    CourseEnrollmentFactory(course=course, student=student)
+    AssessmentFactory(course=course, title="Algebra midterm", status=Assessment.Status.SCHEDULED)
+    AssessmentFactory(course=course, title="Algebra draft quiz", status=Assessment.Status.DRAFT)
+    DocumentFactory(title="Algebra notes", access_level=Document.AccessLevel.INSTITUTION)
+    DocumentFactory(title="Algebra answers", access_level=Document.AccessLevel.PRIVATE)
+    UserFactory(role=User.Role.TEACHER, first_name="Algebra", last_name="Teacher")
+    hidden = CourseFactory(title="Algebra for engineers", status="DRAFT")
+    client = APIClient()
+    client.force_authenticate(user=student)
+
+    response = client.get("/api/search/", {"q": "algebra"})
+    assert response.status_code == 200
+    titles = {hit["title"] for hit in response.json()}
+    assert titles == {"Linear algebra", "Algebra midterm", "Algebra notes"}
+
+    with django_assert_num_queries(1):
+        response = client.get("/api/search/", {"q": "ALG101", "kind": ["COURSE"]})
+    assert [hit["id"] for hit in response.json()] == [str(course.id)]
+
+    hidden.delete()
+    assert not SearchEntry.objects.filter(object_id=str(hidden.id)).exists()
+    assert client.get("/api/search/", {"q": "a"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_search_index_follows_saves_and_rebuilds():
+    admin = UserFactory(role=User.Role.ADMIN)
+    course = CourseFactory(code="BIO200", title="Cell biology")
+    assessment = AssessmentFactory(course=course, title="Microscopy lab")
+
+    course.code = "BIO201"
+    course.save()
+    entry = SearchEntry.objects.get(kind=SearchEntry.Kind.ASSESSMENT, object_id=str(assessment.id))
+    assert entry.subtitle.startswith("BIO201")
+
+    SearchEntry.objects.all().delete()
+    call_command("rebuild_search_index", stdout=StringIO())
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    hits = client.get("/api/search/", {"q": "Microscopy"}).json()
+    assert [(hit["kind"], hit["id"]) for hit in hits] == [("ASSESSMENT", str(assessment.id))]
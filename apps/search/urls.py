@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import SearchViewSet
+
+router = DefaultRouter()
+router.register("", SearchViewSet, basename="search")
+
+urlpatterns = router.urls
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .index import search_entries
+from .serializers import SearchHitSerializer, SearchQuerySerializer
+
+
+class SearchViewSet(viewsets.GenericViewSet):
+    """Ranked matches across courses, assessments, documents and users the caller can see."""
+
+    serializer_class = SearchHitSerializer
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request, *args, **kwargs):
+        query = SearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        hits = search_entries(
+            request.user,
+            query.validated_data["q"].strip(),
+            kinds=query.validated_data.get("kind", ()),
+            limit=query.validated_data.get("limit"),
+        )
+        return Response(self.get_serializer(hits, many=True).data)
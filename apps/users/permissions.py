@@ -20,6 +20,10 @@ class IsAdmin(RolePermission):
     allowed_roles = (User.Role.ADMIN,)
 
 
+class IsStudent(RolePermission):
+    allowed_roles = (User.Role.STUDENT,)
+
+
 class IsAdminOrTeacher(RolePermission):
     allowed_roles = (User.Role.ADMIN, User.Role.TEACHER)
 
@@ -3,9 +3,24 @@
 import os
 
 from celery import Celery
+from celery.signals import celeryd_init, worker_process_shutdown
+
+from .prometheus import mark_process_dead, reset_multiproc_dir
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
 
 app = Celery("sentraexam")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+@celeryd_init.connect
+def reset_worker_metrics(**kwargs):
+    # Run the worker with its own PROMETHEUS_MULTIPROC_DIR so task metrics recorded in
+    # the pool processes are aggregated on METRICS_WORKER_PORT.
+    reset_multiproc_dir()
+
+
+@worker_process_shutdown.connect
+def release_worker_metrics(pid=None, **kwargs):
+    mark_process_dead(pid or os.getpid())
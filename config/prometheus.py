@@ -0,0 +1,34 @@
+"""Prometheus multiprocess directory handling for the gunicorn and Celery processes.
+
+``PROMETHEUS_MULTIPROC_DIR`` must name a directory that exists before the first metric
+is created and is emptied whenever the server (or worker) starts. Web and worker
+processes each need their own directory.
+"""
+
+import os
+import shutil
+
+from prometheus_client import multiprocess
+
+
+def multiproc_dir() -> str | None:
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+
+def ensure_multiproc_dir() -> None:
+    path = multiproc_dir()
+    if path:
+        os.makedirs(path, exist_ok=True)
+
+
+def reset_multiproc_dir() -> None:
+    """Remove samples left by a previous run (call before any worker process starts)."""
+    path = multiproc_dir()
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def mark_process_dead(pid: int) -> None:
+    if multiproc_dir():
+        multiprocess.mark_process_dead(pid)
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import environ
 import structlog
+from celery.schedules import crontab
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -21,8 +22,24 @@ env = environ.Env(
     DB_HOST=(str, "localhost"),
     DB_PORT=(int, 5432),
     REDIS_URL=(str, "redis://localhost:6379/0"),
+    CACHE_URL=(str, ""),
     EMAIL_BACKEND=(str, "django.core.mail.backends.console.EmailBackend"),
     DEFAULT_FROM_EMAIL=(str, "no-reply@sentraexam.local"),
+    NOTIFICATION_RETENTION_DAYS=(int, 180),
+    NOTIFICATION_ARCHIVE_RETENTION_DAYS=(int, 730),
+    NOTIFICATION_DIGEST_WINDOW_MINUTES=(int, 60),
+    DOCUMENT_DOWNLOAD_OFFLOAD=(str, ""),
+    DOCUMENT_ACCEL_REDIRECT_PREFIX=(str, "/protected-media/"),
+    OBJECT_STORAGE_BUCKET=(str, ""),
+    OBJECT_STORAGE_ENDPOINT_URL=(str, ""),
+    OBJECT_STORAGE_REGION=(str, ""),
+    OBJECT_STORAGE_ACCESS_KEY_ID=(str, ""),
+    OBJECT_STORAGE_SECRET_ACCESS_KEY=(str, ""),
+    REQUEST_PROFILING_SAMPLE_RATE=(float, 0.1),
+    REQUEST_PROFILING_SLOW_QUERY_MS=(int, 200),
+    METRICS_ENABLED=(bool, True),
+    METRICS_TOKEN=(str, ""),
+    METRICS_WORKER_PORT=(int, 0),
 )
 
 environ.Env.read_env(os.path.join(BASE_DIR, ".env"))
@@ -57,10 +74,15 @@ INSTALLED_APPS = [
     "apps.notifications",
     "apps.documents",
     "apps.academic_calendar",
+    "apps.dashboard",
+    "apps.reports",
+    "apps.search",
     "guardian",
 ]
 
 MIDDLEWARE = [
+    "apps.common.middleware.MetricsMiddleware",
+    "apps.common.middleware.RequestProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -130,6 +152,31 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# S3-compatible object storage (AWS S3, MinIO). When a bucket is configured, media files
+# are stored there and clients can upload directly through presigned URLs.
+OBJECT_STORAGE_BUCKET = env("OBJECT_STORAGE_BUCKET")
+OBJECT_STORAGE_ENDPOINT_URL = env("OBJECT_STORAGE_ENDPOINT_URL")
+OBJECT_STORAGE_REGION = env("OBJECT_STORAGE_REGION")
+OBJECT_STORAGE_ACCESS_KEY_ID = env("OBJECT_STORAGE_ACCESS_KEY_ID")
+OBJECT_STORAGE_SECRET_ACCESS_KEY = env("OBJECT_STORAGE_SECRET_ACCESS_KEY")
+if OBJECT_STORAGE_BUCKET:
+    STORAGES = {
+        "default": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {
+                "bucket_name": OBJECT_STORAGE_BUCKET,
+                "endpoint_url": OBJECT_STORAGE_ENDPOINT_URL or None,
+                "region_name": OBJECT_STORAGE_REGION or None,
+                "access_key": OBJECT_STORAGE_ACCESS_KEY_ID or None,
+                "secret_key": OBJECT_STORAGE_SECRET_ACCESS_KEY or None,
+                "addressing_style": "path",
+                "file_overwrite": False,
+                "querystring_auth": True,
+            },
+        },
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
@@ -170,12 +217,142 @@ CORS_ALLOW_ALL_ORIGINS = True
 EMAIL_BACKEND = env("EMAIL_BACKEND")
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL")
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("CACHE_URL") or env("REDIS_URL"),
+        "KEY_PREFIX": "sentraexam",
+        "TIMEOUT": 300,
+    }
+}
+
 CELERY_BROKER_URL = env("REDIS_URL")
 CELERY_RESULT_BACKEND = env("REDIS_URL")
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    "archive-notifications": {
+        "task": "apps.notifications.tasks.archive_notifications",
+        "schedule": crontab(hour=2, minute=0),
+    },
+    "purge-notification-archive": {
+        "task": "apps.notifications.tasks.purge_notification_archive",
+        "schedule": crontab(hour=2, minute=30, day_of_week="sunday"),
+    },
+    "collect-content-blobs": {
+        "task": "apps.common.tasks.collect_blobs",
+        "schedule": crontab(hour=3, minute=0),
+    },
+    "purge-upload-slots": {
+        "task": "apps.common.tasks.purge_upload_slots",
+        "schedule": crontab(minute=15),
+    },
+    "rollup-document-access": {
+        "task": "apps.documents.tasks.rollup_document_access",
+        "schedule": timedelta(minutes=30),
+    },
+    "prune-document-access-logs": {
+        "task": "apps.documents.tasks.prune_document_access_logs",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    "reconcile-department-counts": {
+        "task": "apps.departments.tasks.reconcile_department_counts",
+        "schedule": crontab(hour=4, minute=30),
+    },
+    "refresh-performance-reports": {
+        "task": "apps.reports.tasks.refresh_performance_reports",
+        "schedule": crontab(minute=45),
+    },
+    "send-notification-digests": {
+        "task": "apps.notifications.tasks.send_notification_digests",
+        "schedule": timedelta(minutes=env("NOTIFICATION_DIGEST_WINDOW_MINUTES")),
+    },
+}
+
+# Notifications older than the retention window move to the archive table; archived
+# rows are deleted once they pass the archive retention window.
+NOTIFICATION_RETENTION_DAYS = env("NOTIFICATION_RETENTION_DAYS")
+NOTIFICATION_ARCHIVE_RETENTION_DAYS = env("NOTIFICATION_ARCHIVE_RETENTION_DAYS")
+NOTIFICATION_ARCHIVE_BATCH_SIZE = 1000
+
+# Pending notifications are emailed as one digest per user every digest window.
+NOTIFICATION_DIGEST_WINDOW_MINUTES = env("NOTIFICATION_DIGEST_WINDOW_MINUTES")
+NOTIFICATION_DIGEST_BATCH_SIZE = 500
+NOTIFICATION_DIGEST_MAX_ITEMS = 25
+
+# Document access logs are buffered in-process and bulk inserted.
+DOCUMENT_ACCESS_LOG_BUFFERED = True
+DOCUMENT_ACCESS_LOG_BUFFER_SIZE = 200
+DOCUMENT_ACCESS_LOG_FLUSH_SECONDS = 5
+# Raw access logs are kept this long; daily rollups (DocumentAccessDaily) are kept forever.
+DOCUMENT_ACCESS_LOG_RETENTION_DAYS = 90
+
+# Document downloads: "" streams from Django, "nginx" answers with X-Accel-Redirect to
+# DOCUMENT_ACCEL_REDIRECT_PREFIX (an internal location aliased to MEDIA_ROOT), "apache"
+# answers with X-Sendfile.
+DOCUMENT_DOWNLOAD_OFFLOAD = env("DOCUMENT_DOWNLOAD_OFFLOAD")
+DOCUMENT_ACCEL_REDIRECT_PREFIX = env("DOCUMENT_ACCEL_REDIRECT_PREFIX")
+# The proxy can only send files from disk; with object storage an offloaded download is
+# a redirect to a presigned URL valid this long.
+PRESIGNED_DOWNLOAD_EXPIRY_SECONDS = 300
+
+# Thumbnail bounding box for document previews (pdf/png/jpg).
+DOCUMENT_PREVIEW_SIZE = (320, 320)
+
+# Full-text search over document metadata and extracted file text.
+DOCUMENT_SEARCH_CONFIG = "english"
+DOCUMENT_SEARCH_MAX_TEXT_LENGTH = 200_000
+
+# Content blobs left without references are deleted after this grace period.
+BLOB_GC_GRACE_HOURS = 24
+
+# Presigned direct uploads: URL lifetime, largest accepted file, and how long an
+# unconfirmed or unused upload slot is kept.
+PRESIGNED_UPLOAD_EXPIRY_SECONDS = 900
+PRESIGNED_UPLOAD_MAX_BYTES = 100 * 1024 * 1024
+UPLOAD_SLOT_RETENTION_HOURS = 24
+
+# Personal iCalendar feeds cover this window around the current date; rendered feeds
+# are cached until the user's calendar version changes (or this many seconds pass).
+CALENDAR_FEED_PAST_DAYS = 30
+CALENDAR_FEED_FUTURE_DAYS = 180
+CALENDAR_FEED_CACHE_SECONDS = 24 * 60 * 60
+# The agenda endpoint serves windows of at most this many days, cached per user.
+CALENDAR_AGENDA_MAX_DAYS = 62
+CALENDAR_AGENDA_CACHE_SECONDS = 5 * 60
+
+# The student dashboard is cached per user for this long (it is not invalidated).
+DASHBOARD_CACHE_SECONDS = 60
+DASHBOARD_UPCOMING_LIMIT = 10
+DASHBOARD_GRADES_LIMIT = 5
+
+# Performance reports refresh hourly, and this long after a burst of grading starts.
+REPORTS_REFRESH_DEBOUNCE_SECONDS = 5 * 60
+
+# Global search: text search configuration, and how many hits a query returns by
+# default and at most.
+SEARCH_CONFIG = "english"
+SEARCH_DEFAULT_RESULTS = 20
+SEARCH_MAX_RESULTS = 50
+
+# Fraction of requests profiled (Server-Timing header and a structured log line), and
+# the duration above which a query in any request is logged on its own.
+REQUEST_PROFILING_SAMPLE_RATE = env("REQUEST_PROFILING_SAMPLE_RATE")
+REQUEST_PROFILING_SLOW_QUERY_MS = env("REQUEST_PROFILING_SLOW_QUERY_MS")
+
+# Prometheus metrics on /metrics, protected by the METRICS_TOKEN bearer token (refused
+# outside DEBUG when no token is set).
+# Celery workers serve their own on METRICS_WORKER_PORT; queue depth is read from the
+# broker for these queues at scrape time.
+METRICS_ENABLED = env("METRICS_ENABLED")
+METRICS_TOKEN = env("METRICS_TOKEN")
+METRICS_WORKER_PORT = env("METRICS_WORKER_PORT")
+METRICS_CELERY_QUEUES = ("celery",)
+
+# Cached per-user visible course ids; signals invalidate it, this is only a backstop.
+VISIBILITY_CACHE_SECONDS = 60 * 60
 
 LOGGING = {
     "version": 1,
@@ -4,6 +4,11 @@ from .base import *  # noqa
 
 PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+DOCUMENT_ACCESS_LOG_BUFFERED = False
+CELERY_TASK_ALWAYS_EAGER = True
+REQUEST_PROFILING_SAMPLE_RATE = 1.0
+METRICS_CELERY_QUEUES = ()
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
 DATABASES = {
     "default": {
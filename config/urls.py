@@ -8,6 +8,8 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+from apps.common.views import metrics
+
 api_urlpatterns = [
     path("auth/", include("apps.users.urls")),
     path("departments/", include("apps.departments.urls")),
@@ -16,10 +18,15 @@ api_urlpatterns = [
     path("notifications/", include("apps.notifications.urls")),
     path("documents/", include("apps.documents.urls")),
     path("calendar/", include("apps.academic_calendar.urls")),
+    path("uploads/", include("apps.common.urls")),
+    path("dashboard/", include("apps.dashboard.urls")),
+    path("reports/", include("apps.reports.urls")),
+    path("search/", include("apps.search.urls")),
 ]
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", metrics, name="metrics"),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "api/docs/",
@@ -160,16 +160,22 @@ export const useCancelAnnouncement = () => {
   });
 };
 
-// Get announcement recipients
-export const getAnnouncementRecipients = async (id: number): Promise<AnnouncementRecipient[]> => {
-  const { data } = await apiClient.get<AnnouncementRecipient[]>(`/announcements/${id}/recipients/`);
+// Get announcement recipients (paginated)
+export const getAnnouncementRecipients = async (
+  id: number,
+  params?: { page?: number }
+): Promise<PaginatedResponse<AnnouncementRecipient>> => {
+  const { data } = await apiClient.get<PaginatedResponse<AnnouncementRecipient>>(
+    `/announcements/${id}/recipients/`,
+    { params }
+  );
   return data;
 };
 
-export const useAnnouncementRecipients = (id: number) => {
+export const useAnnouncementRecipients = (id: number, params?: { page?: number }) => {
   return useQuery({
-    queryKey: ['announcement-recipients', id],
-    queryFn: () => getAnnouncementRecipients(id),
+    queryKey: ['announcement-recipients', id, params],
+    queryFn: () => getAnnouncementRecipients(id, params),
     enabled: !!id,
   });
 };
@@ -401,6 +401,9 @@ export interface Announcement {
   created_by_email: string;
   created_at: string;
   updated_at: string;
+  recipient_count?: number;
+  delivered_count?: number;
+  read_count?: number;
 }
 
 export interface CreateAnnouncementPayload {
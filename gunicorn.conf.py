@@ -0,0 +1,15 @@
+"""Gunicorn settings (loaded automatically from the working directory).
+
+With ``PROMETHEUS_MULTIPROC_DIR`` set, workers write their metrics to that directory and
+``/metrics`` aggregates them; it is emptied on start and dead workers are cleaned up.
+"""
+
+from config.prometheus import mark_process_dead, reset_multiproc_dir
+
+
+def on_starting(server):
+    reset_multiproc_dir()
+
+
+def child_exit(server, worker):
+    mark_process_dead(worker.pid)
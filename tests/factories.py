@@ -6,6 +6,7 @@ from apps.academic_calendar.models import AcademicTerm, AcademicYear
 from apps.assessments.models import Assessment
 from apps.courses.models import Course, CourseEnrollment
 from apps.departments.models import Department
+from apps.documents.models import Document
 
 User = get_user_model()
 
@@ -120,3 +121,14 @@ class AssessmentFactory(factory.django.DjangoModelFactory):
             ]
         return []
     created_by = factory.SubFactory(UserFactory, role=User.Role.TEACHER)
+
+
+class DocumentFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Document
+
+    title = factory.Faker("sentence", nb_words=3)
+    description = factory.Faker("paragraph")
+    file = factory.django.FileField(filename="syllabus.pdf", data=b"%PDF-1.4 syllabus")
+    owner = factory.SubFactory(UserFactory, role=User.Role.TEACHER)
+    access_level = Document.AccessLevel.INSTITUTION